@@ -1,39 +1,98 @@
+import asyncio
 from datetime import UTC, datetime
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 
 from app.core.config import settings
+from app.services.dependencies.impact import get_impact_index
 from app.services.dependencies.main import get_dependency_data
-from app.utils.storage import save_to_storage
+from app.utils.cache import response_cache
+from app.utils.collection import collection_errors
+from app.utils.singleflight import collector_key, run_collector
+from app.utils.storage import publish_snapshot
 
 router = APIRouter()
 
 
+async def refresh_dependencies() -> Dict[str, Any]:
+    """Build the dependency graph and publish it to storage."""
+    with collection_errors() as errors:
+        dependency_data = await run_collector(
+            collector_key("dependencies", repositories=settings.REPOSITORIES),
+            get_dependency_data,
+            settings.REPOSITORIES,
+        )
+    created_at = datetime.now(UTC).replace(microsecond=0).isoformat()
+    outdata = {
+        "results": dependency_data,
+        "metadata": {
+            "created_at": created_at,
+            "version": settings.VERSION,
+            "repository_count": len(settings.REPOSITORIES),
+            "source": "dependency-analyzer",
+            "partial": bool(errors),
+            "errors": errors,
+        },
+    }
+
+    cloud_storage_folder = f"{settings.GCP_BUCKET_SITE_FOLDER_NAME}/dependencies"
+    await asyncio.to_thread(publish_snapshot, outdata, cloud_storage_folder, created_at)
+    return outdata
+
+
 @router.get("/dependencies", response_model=Dict[str, Any])
-async def get_dependencies():
+async def get_dependencies(fresh: bool = False):
     """
     Get current dependencies graph for all repositories.
     Returns nodes and links representing the dependency relationships.
+
+    Served from the response cache (refreshed in the background once stale)
+    unless `fresh=1` is passed.
     """
     try:
-        dependency_data = get_dependency_data(settings.REPOSITORIES)
-        created_at = datetime.now(UTC).replace(microsecond=0).isoformat()
-        outdata = {
-            "results": dependency_data,
-            "metadata": {
-                "created_at": created_at,
-                "version": settings.VERSION,
-                "repository_count": len(settings.REPOSITORIES),
-                "source": "dependency-analyzer",
-            },
-        }
-        cloud_storage_folder = f"{settings.GCP_BUCKET_SITE_FOLDER_NAME}/dependencies"
-
-        save_to_storage(
-            outdata, f"{cloud_storage_folder}/latest.json", make_public=True
+        return await response_cache.get_or_compute(
+            "dependencies",
+            settings.DEPENDENCIES_CACHE_TTL_SECONDS,
+            refresh_dependencies,
+            fresh=fresh,
         )
-        save_to_storage(outdata, f"{cloud_storage_folder}/{created_at}.json")
-        return outdata
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/dependencies/impact", response_model=Dict[str, Any])
+async def get_dependency_impact(
+    package: str = Query(..., description="Node id, package name or repository name"),
+    language: Optional[str] = Query(default=None, description="Only match nodes of this language"),
+    fresh: bool = False,
+):
+    """
+    List the direct and transitive dependents of a package with the version
+    constraints they declare, e.g. the repositories affected by a breaking
+    algokit-utils or puya release.
+
+    Answered from a reachability index built once per dependencies snapshot.
+    """
+    try:
+        snapshot = await response_cache.get_or_compute(
+            "dependencies",
+            settings.DEPENDENCIES_CACHE_TTL_SECONDS,
+            refresh_dependencies,
+            fresh=fresh,
+        )
+        index = await asyncio.to_thread(get_impact_index, snapshot)
+        result = index.query(package, language)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    if not result["matched_nodes"]:
+        raise HTTPException(status_code=404, detail=f"Package not found in the dependency graph: {package}")
+    return {
+        **result,
+        "metadata": {
+            "created_at": snapshot["metadata"]["created_at"],
+            "version": settings.VERSION,
+            "source": "dependency-analyzer",
+        },
+    }
@@ -5,6 +5,8 @@ from fastapi import APIRouter, HTTPException
 
 from app.core.config import settings
 from app.services.functional_specs.tree import get_functional_specs
+from app.utils.collection import collection_errors
+from app.utils.singleflight import collector_key, run_collector
 from app.utils.storage import save_to_storage
 
 router = APIRouter()
@@ -17,7 +19,8 @@ async def get_specs():
     Returns a hierarchical tree structure of specifications.
     """
     try:
-        results = get_functional_specs()
+        with collection_errors() as errors:
+            results = await run_collector(collector_key("functional_specs"), get_functional_specs)
         created_at = datetime.now(UTC).replace(microsecond=0).isoformat()
         outdata = {
             "results": results,
@@ -25,6 +28,8 @@ async def get_specs():
                 "created_at": created_at,
                 "version": settings.VERSION,
                 "source": "specs-analyzer",
+                "partial": bool(errors),
+                "errors": errors,
             },
         }
         cloud_storage_folder = (
@@ -1,23 +1,32 @@
 from datetime import UTC, datetime
-from typing import Any, Dict, List
+from typing import Any, Dict
 
 from fastapi import APIRouter, HTTPException
 
 from app.core.config import settings
 from app.services.outdated.dependency_checker import check_outdated_dependencies
+from app.utils.singleflight import collector_key, run_collector
 from app.utils.storage import save_to_storage
 
 router = APIRouter()
 
 
 @router.get("/outdated", response_model=Dict[str, Any])
-async def check_outdated():
+async def check_outdated(full: bool = False):
     """
     Check for outdated dependencies in the configured repositories.
     Returns list of outdated dependencies with metadata.
+
+    Repositories unchanged since their last check reuse its result unless `full` is set.
     """
     try:
-        results = check_outdated_dependencies(settings.REPOSITORIES)
+        incremental = settings.OUTDATED_INCREMENTAL and not full
+        results = await run_collector(
+            collector_key("outdated", repositories=settings.REPOSITORIES, incremental=incremental),
+            check_outdated_dependencies,
+            settings.REPOSITORIES,
+            incremental,
+        )
         created_at = datetime.now(UTC).replace(microsecond=0).isoformat()
         outdata = {
             "results": results,
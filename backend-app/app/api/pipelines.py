@@ -4,7 +4,9 @@ from typing import Any, Dict
 from fastapi import APIRouter, HTTPException
 
 from app.core.config import settings
-from app.services.pipelines.github import get_pipeline_status
+from app.services.pipelines.github import fetch_pipeline_runs
+from app.utils.collection import collection_errors
+from app.utils.singleflight import collector_key, run_collector
 from app.utils.storage import save_to_storage
 
 router = APIRouter()
@@ -17,7 +19,10 @@ async def github_pipeline_status():
     Returns the pipeline status data and saves it to storage.
     """
     try:
-        all_runs, start_date_iso, end_date_iso = await get_pipeline_status()
+        with collection_errors() as errors:
+            all_runs, start_date_iso, end_date_iso = await run_collector(
+                collector_key("pipeline_status"), fetch_pipeline_runs
+            )
 
         created_at = datetime.now(UTC).replace(microsecond=0).isoformat() + "Z"
         outdata = {
@@ -30,6 +35,8 @@ async def github_pipeline_status():
                 "run_count": len(all_runs),
                 "start_date_iso": start_date_iso,
                 "end_date_iso": end_date_iso,
+                "partial": bool(errors),
+                "errors": errors,
             },
         }
 
@@ -8,6 +8,8 @@ from app.services.pull_requests.github import (
     get_github_pull_requests, 
     get_closed_pull_requests_with_metrics
 )
+from app.utils.collection import collection_errors
+from app.utils.singleflight import collector_key, run_collector
 from app.utils.storage import save_to_storage
 
 router = APIRouter()
@@ -20,7 +22,8 @@ async def get_repo_pull_requests():
     Returns a summary of the sync operation.
     """
     try:
-        results = get_github_pull_requests()
+        with collection_errors() as errors:
+            results = await run_collector(collector_key("pull_requests"), get_github_pull_requests)
         created_at = datetime.now(UTC).replace(microsecond=0).isoformat() + "Z"
         outdata = {
             "results": results,
@@ -29,6 +32,8 @@ async def get_repo_pull_requests():
                 "version": settings.VERSION,
                 "repository_count": len(settings.REPOSITORIES),
                 "source": "pull-requests-analyzer",
+                "partial": bool(errors),
+                "errors": errors,
             },
         }
 
@@ -64,7 +69,12 @@ async def get_closed_repo_pull_requests():
     """
     try:
         # Get closed PRs with metrics (default 7 days to cover both metric periods)
-        data = get_closed_pull_requests_with_metrics(days_back=7)
+        with collection_errors() as errors:
+            data = await run_collector(
+                collector_key("closed_pull_requests", days_back=7),
+                get_closed_pull_requests_with_metrics,
+                days_back=7,
+            )
         created_at = datetime.now(UTC).replace(microsecond=0).isoformat() + "Z"
         
         outdata = {
@@ -75,6 +85,8 @@ async def get_closed_repo_pull_requests():
                 "version": settings.VERSION,
                 "repository_count": len(settings.REPOSITORIES),
                 "source": "pull-requests-analyzer",
+                "partial": bool(errors),
+                "errors": errors,
                 "pr_count": len(data["pull_requests"]),
             },
         }
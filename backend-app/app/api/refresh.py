@@ -0,0 +1,39 @@
+from typing import Any, Dict, List, Optional
+
+from fastapi import APIRouter, HTTPException, Query
+
+from app.services.refresh.orchestrator import resolve_stages, run_refresh
+
+router = APIRouter()
+
+
+@router.get("/refresh", response_model=Dict[str, Any])
+async def refresh_all(
+    stages: Optional[List[str]] = Query(
+        default=None,
+        description="Stages to refresh (dependencies are included automatically). Defaults to all.",
+    ),
+    max_concurrency: Optional[int] = Query(
+        default=None, ge=1, description="Maximum number of collectors running at once"
+    ),
+):
+    """
+    Refresh every dataset in a single run.
+    Collectors run concurrently as a dependency graph, share fetched data and
+    publish all snapshots at the end. Returns per-stage status and timings.
+    """
+    try:
+        resolve_stages(stages)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    try:
+        result = await run_refresh(stages=stages, max_concurrency=max_concurrency)
+        return {
+            "message": "Refresh completed"
+            if not result["failed_stages"]
+            else "Refresh completed with failures",
+            **result,
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
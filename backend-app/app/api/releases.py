@@ -1,3 +1,4 @@
+import asyncio
 from datetime import UTC, datetime
 from typing import Any, Dict
 
@@ -5,36 +6,48 @@ from fastapi import APIRouter, HTTPException
 
 from app.core.config import settings
 from app.services.releases.github import get_github_releases
-from app.utils.storage import save_to_storage
+from app.utils.cache import response_cache
+from app.utils.collection import collection_errors
+from app.utils.singleflight import collector_key, run_collector
+from app.utils.storage import publish_snapshot
 
 router = APIRouter()
 
 
+async def refresh_releases() -> Dict[str, Any]:
+    """Collect the latest releases and publish them to storage."""
+    with collection_errors() as errors:
+        results = await run_collector(collector_key("releases"), get_github_releases)
+    created_at = datetime.now(UTC).replace(microsecond=0).isoformat()
+    outdata = {
+        "results": results,
+        "metadata": {
+            "created_at": created_at,
+            "version": settings.VERSION,
+            "repository_count": len(settings.REPOSITORIES),
+            "source": "releases-analyzer",
+            "partial": bool(errors),
+            "errors": errors,
+        },
+    }
+
+    cloud_storage_folder = f"{settings.GCP_BUCKET_SITE_FOLDER_NAME}/releases"
+    await asyncio.to_thread(publish_snapshot, outdata, cloud_storage_folder, created_at)
+    return outdata
+
+
 @router.get("/releases", response_model=Dict[str, Any])
-async def get_repo_releases():
+async def get_repo_releases(fresh: bool = False):
     """
     Fetch the latest main and beta releases for all configured repositories.
     Returns the latest main release and latest beta release for each repository.
+
+    Served from the response cache (refreshed in the background once stale)
+    unless `fresh=1` is passed.
     """
     try:
-        results = get_github_releases()
-        created_at = datetime.now(UTC).replace(microsecond=0).isoformat()
-        outdata = {
-            "results": results,
-            "metadata": {
-                "created_at": created_at,
-                "version": settings.VERSION,
-                "repository_count": len(settings.REPOSITORIES),
-                "source": "releases-analyzer",
-            },
-        }
-
-        cloud_storage_folder = f"{settings.GCP_BUCKET_SITE_FOLDER_NAME}/releases"
-
-        save_to_storage(
-            outdata, f"{cloud_storage_folder}/latest.json", make_public=True
+        return await response_cache.get_or_compute(
+            "releases", settings.RELEASES_CACHE_TTL_SECONDS, refresh_releases, fresh=fresh
         )
-        save_to_storage(outdata, f"{cloud_storage_folder}/{created_at}.json")
-        return outdata
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,59 @@
+import json
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, Header, HTTPException, Request
+
+from app.services.webhooks.github import (
+    is_tracked_repository,
+    verify_signature,
+    webhook_batcher,
+)
+from app.utils.github import get_github_webhook_secret
+
+router = APIRouter()
+
+
+@router.post("/webhooks/github", response_model=Dict[str, Any], status_code=202)
+async def receive_github_webhook(
+    request: Request,
+    x_github_event: str = Header(...),
+    x_hub_signature_256: Optional[str] = Header(default=None),
+    x_github_delivery: Optional[str] = Header(default=None),
+):
+    """
+    Receive GitHub webhook deliveries for the configured repositories.
+    `issues`, `pull_request`, `release` and `workflow_run` events are applied to
+    the published datasets, which are republished in debounced batches.
+    """
+    body = await request.body()
+    try:
+        secret = get_github_webhook_secret()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    if not verify_signature(body, x_hub_signature_256, secret):
+        raise HTTPException(status_code=401, detail="Invalid webhook signature")
+
+    if x_github_event == "ping":
+        return {"message": "pong", "delivery": x_github_delivery}
+
+    try:
+        payload = json.loads(body)
+    except json.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="Invalid JSON payload")
+
+    if not is_tracked_repository(payload):
+        return {
+            "message": "Repository is not tracked",
+            "event": x_github_event,
+            "delivery": x_github_delivery,
+            "datasets": [],
+        }
+
+    datasets = webhook_batcher.enqueue(x_github_event, payload)
+    return {
+        "message": "Event queued" if datasets else "Event type is not handled",
+        "event": x_github_event,
+        "delivery": x_github_delivery,
+        "datasets": datasets,
+    }
@@ -130,10 +130,75 @@ class Settings(BaseSettings):
     GCP_BUCKET_NAME: str = "algokit-management-tool"
     GCP_BUCKET_SITE_FOLDER_NAME: str = "site"
 
+    # GitHub Webhook Configuration
+    GITHUB_WEBHOOK_SECRET_NAME: str = "github-webhook-secret"
+    GITHUB_WEBHOOK_SECRET_LOCAL: str = ""
+    WEBHOOK_DEBOUNCE_SECONDS: float = 30
+
+    # Outbound HTTP Configuration
+    HTTP_TIMEOUT_SECONDS: float = 30
+    HTTP_MAX_RETRIES: int = 3
+    HTTP_BACKOFF_BASE_SECONDS: float = 1
+    HTTP_BACKOFF_MAX_SECONDS: float = 30
+    HTTP_RETRY_AFTER_MAX_SECONDS: float = 60
+    HTTP_POOL_SIZE: int = 16
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD: int = 5
+    CIRCUIT_BREAKER_RESET_SECONDS: float = 60
+
+    # Refresh Orchestrator Configuration
+    REFRESH_MAX_CONCURRENCY: int = 4
+
+    # Dependency Graph Configuration
+    DEPENDENCIES_MAX_WORKERS: int = 8
+    DEPENDENCIES_FILE_WORKERS: int = 4
+    DEPENDENCIES_INCLUDE_LOCKFILES: bool = False  # adds lockfiles' transitive nodes and edges; resolved versions are always read
+    DEPENDENCIES_BLOB_CACHE_DIR: str = ".algokit_cache/blobs"  # empty keeps the cache in memory only
+    DEPENDENCIES_BLOB_CACHE_MAX_ENTRIES: int = 1024
+
+    # Outdated Dependencies Configuration
+    OUTDATED_MODE: str = "registry"  # "registry" (manifests + registry metadata) or "install" (clone + pip/npm)
+    OUTDATED_REGISTRY_WORKERS: int = 8
+    OUTDATED_METADATA_CACHE_DIR: str = ".algokit_cache/registry"  # empty keeps the cache in memory only
+    OUTDATED_METADATA_CACHE_MAX_ENTRIES: int = 4096
+    OUTDATED_METADATA_TTL_SECONDS: float = 60 * 60  # revalidated with ETag / Last-Modified once expired
+    OUTDATED_MAX_WORKERS: int = 4
+    OUTDATED_REPO_TIMEOUT_SECONDS: float = 10 * 60
+    OUTDATED_VENV_DIR: str = ".algokit_cache/venvs"
+    OUTDATED_VENV_MAX_BYTES: int = 5 * 1024 * 1024 * 1024
+    OUTDATED_NPM_MODE: str = "lockfile"  # "lockfile" (no node_modules) or "install" (cached node_modules)
+    OUTDATED_NODE_MODULES_DIR: str = ".algokit_cache/node_modules"
+    OUTDATED_NODE_MODULES_MAX_BYTES: int = 5 * 1024 * 1024 * 1024
+    OUTDATED_INCREMENTAL: bool = True  # reuse results of repositories whose manifests and upstreams are unchanged
+    OUTDATED_STATE_FILE: str = ".algokit_cache/outdated/state.json"  # empty keeps the state in memory only
+    PYPI_JSON_URL: str = "https://pypi.org/pypi"
+    NPM_REGISTRY_URL: str = "https://registry.npmjs.org"
+
+    # Vulnerability Advisory Configuration
+    ADVISORY_INDEX_PATH: str = ".algokit_cache/advisories/index.bin"
+    ADVISORY_REFRESH_SECONDS: float = 24 * 60 * 60  # rebuild from the OSV dumps once older, 0 disables it
+    ADVISORY_DOWNLOAD_TIMEOUT_SECONDS: float = 120
+    OSV_DUMP_URL: str = "https://osv-vulnerabilities.storage.googleapis.com"
+
+    # Repository Mirror Configuration
+    REPOSITORY_MIRROR_REFRESH_SECONDS: float = 30 * 60  # background fetch interval, 0 disables it
+    REPOSITORY_MIRROR_MAX_AGE_SECONDS: float = 60 * 60  # older mirrors are fetched at request time
+
+    # Response Cache Configuration
+    RESPONSE_CACHE_MAX_ENTRIES: int = 32
+    RESPONSE_CACHE_MAX_STALE_SECONDS: float = 24 * 60 * 60
+    ISSUES_CACHE_TTL_SECONDS: float = 5 * 60
+    RELEASES_CACHE_TTL_SECONDS: float = 15 * 60
+    DEPENDENCIES_CACHE_TTL_SECONDS: float = 60 * 60
+
     # AI/LLM Configuration
     GEMINI_API_KEY_SECRET_NAME: str = "gemini-api-key"
     LLM_MODEL_VERSION: str = "google-gla:gemini-2.5-pro-preview-03-25"
 
+    # Logging Configuration
+    LOG_FORMAT: str = "json"  # "json" or "text"
+    LOG_RATE_LIMIT_PER_SECOND: float = 0  # per call site, 0 disables rate limiting
+    LOG_RATE_LIMIT_BURST: int = 20
+
     # Service Account Configuration for local development
     GOOGLE_APPLICATION_CREDENTIALS: str
     GITHUB_TOKEN_LOCAL: str
@@ -187,6 +252,19 @@ class Settings(BaseSettings):
                 f"Error: {str(e)}"
             ) from e
 
+    @property
+    def GITHUB_WEBHOOK_SECRET(self) -> str:
+        try:
+            client = secretmanager.SecretManagerServiceClient()
+            name = f"projects/{self.GCP_PROJECT_ID}/secrets/{self.GITHUB_WEBHOOK_SECRET_NAME}/versions/latest"
+            response = client.access_secret_version(request={"name": name})
+            return response.payload.data.decode("UTF-8")
+        except Exception as e:
+            raise Exception(
+                "Failed to access GitHub webhook secret from Secret Manager.\n"
+                f"Error: {str(e)}"
+            ) from e
+
     @property
     def SLACK_WEBHOOK_URL(self) -> str:
         try:
@@ -1,7 +1,122 @@
+import atexit
+import copy
+import json
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+import threading
+import time
+from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from app.core.config import settings
+
+# Attributes present on every LogRecord; anything else was passed via `extra=`
+_RESERVED_RECORD_ATTRS = set(
+    logging.LogRecord("", 0, "", 0, "", None, None).__dict__
+) | {"message", "asctime", "taskName"}
+
+
+class JsonFormatter(logging.Formatter):
+    """Format log records as single-line JSON objects."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "timestamp": datetime.fromtimestamp(record.created, UTC).isoformat(),
+            "logger": record.name,
+            "level": record.levelname,
+            "message": record.getMessage(),
+            "module": record.module,
+            "line": record.lineno,
+            "thread": record.threadName,
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_RECORD_ATTRS and not key.startswith("_"):
+                payload[key] = value
+        if record.exc_text:
+            payload["exception"] = record.exc_text
+        return json.dumps(payload, default=str, ensure_ascii=False)
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Token-bucket rate limiter keyed by call site.
+
+    Each logging call site (logger, file, line) gets its own bucket, so a
+    chatty per-page message cannot starve other messages. Records at WARNING
+    and above are never dropped. The number of suppressed records is attached
+    to the next record that gets through as `suppressed`.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        super().__init__()
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._buckets: Dict[Tuple[str, str, int], list] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+
+        key = (record.name, record.pathname, record.lineno)
+        now = time.monotonic()
+        with self._lock:
+            # bucket = [tokens, last_refill, suppressed_count]
+            bucket = self._buckets.setdefault(key, [float(self.burst), now, 0])
+            bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+            if bucket[0] < 1:
+                bucket[2] += 1
+                return False
+            bucket[0] -= 1
+            if bucket[2]:
+                record.suppressed = bucket[2]
+                bucket[2] = 0
+        return True
+
+
+class _StructuredQueueHandler(QueueHandler):
+    """QueueHandler that keeps records structured instead of pre-formatting them."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        record.stack_info = None
+        return record
+
+
+class _RoutingHandler(logging.Handler):
+    """
+    Runs on the listener thread and dispatches records to the console and to
+    the per-module rotating log file registered for the record's logger.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.console_handler: Optional[logging.Handler] = None
+        self.routes: Dict[str, Tuple[bool, Optional[logging.Handler]]] = {}
+        self.file_handlers: Dict[Path, logging.Handler] = {}
+
+    def emit(self, record: logging.LogRecord) -> None:
+        console, file_handler = self.routes.get(record.name, (True, None))
+        if console and self.console_handler is not None:
+            self.console_handler.handle(record)
+        if file_handler is not None:
+            file_handler.handle(record)
+
+    def close(self) -> None:
+        for handler in self.file_handlers.values():
+            handler.close()
+        if self.console_handler is not None:
+            self.console_handler.flush()
+        super().close()
 
 
 class LoggerFactory:
@@ -10,14 +125,41 @@ class LoggerFactory:
     _formatter = logging.Formatter(
         "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     )
+    _json_formatter = JsonFormatter()
+    _queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    _router = _RoutingHandler()
+    _listener: Optional[QueueListener] = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def _get_formatter(cls) -> logging.Formatter:
+        return cls._json_formatter if settings.LOG_FORMAT == "json" else cls._formatter
 
     @classmethod
     def _initialize(cls) -> None:
-        """Initialize logging directory and configuration once"""
+        """Initialize logging directory and the shared listener thread once"""
         if not cls._initialized:
             cls._log_dir.mkdir(exist_ok=True)
+
+            console_handler = logging.StreamHandler(sys.stdout)
+            console_handler.setFormatter(cls._get_formatter())
+            cls._router.console_handler = console_handler
+
+            cls._listener = QueueListener(cls._queue, cls._router)
+            cls._listener.start()
+            atexit.register(cls.shutdown)
             cls._initialized = True
 
+    @classmethod
+    def shutdown(cls) -> None:
+        """Flush queued records and stop the listener thread."""
+        with cls._lock:
+            if cls._listener is not None:
+                cls._listener.stop()
+                cls._listener = None
+                cls._router.close()
+                cls._initialized = False
+
     @classmethod
     def get_logger(
         cls,
@@ -27,10 +169,16 @@ class LoggerFactory:
         console_logging: bool = True,
         max_bytes: int = 10485760,  # 10MB
         backup_count: int = 5,
+        rate_limit: Optional[float] = None,
+        rate_limit_burst: Optional[int] = None,
     ) -> logging.Logger:
         """
         Create a logger with the specified configuration.
 
+        Records are put on a shared queue and written to the console and log
+        files by a single background listener thread, so callers never block
+        on disk writes or file rotation.
+
         Args:
             name: Name of the logger (typically __name__ of the module)
             log_level: Logging level (default: INFO)
@@ -38,8 +186,27 @@ class LoggerFactory:
             console_logging: Enable logging to console (default: True)
             max_bytes: Maximum size of log file before rotation
             backup_count: Number of backup files to keep
+            rate_limit: Records per second allowed per call site below WARNING
+                (default: settings.LOG_RATE_LIMIT_PER_SECOND, 0 disables)
+            rate_limit_burst: Burst size for the rate limiter
+                (default: settings.LOG_RATE_LIMIT_BURST)
         """
-        cls._initialize()
+        with cls._lock:
+            cls._initialize()
+
+            file_handler = None
+            if file_logging:
+                log_file = cls._log_dir / f"{name.split('.')[-1]}.log"
+                file_handler = cls._router.file_handlers.get(log_file)
+                if file_handler is None:
+                    file_handler = RotatingFileHandler(
+                        log_file,
+                        maxBytes=max_bytes,
+                        backupCount=backup_count,
+                    )
+                    file_handler.setFormatter(cls._get_formatter())
+                    cls._router.file_handlers[log_file] = file_handler
+            cls._router.routes[name] = (console_logging, file_handler)
 
         logger = logging.getLogger(name)
         logger.setLevel(log_level)
@@ -48,19 +215,19 @@ class LoggerFactory:
         if logger.hasHandlers():
             logger.handlers.clear()
 
-        if console_logging:
-            console_handler = logging.StreamHandler(sys.stdout)
-            console_handler.setFormatter(cls._formatter)
-            logger.addHandler(console_handler)
-
-        if file_logging:
-            file_handler = RotatingFileHandler(
-                cls._log_dir / f"{name.split('.')[-1]}.log",
-                maxBytes=max_bytes,
-                backupCount=backup_count,
+        queue_handler = _StructuredQueueHandler(cls._queue)
+        if rate_limit is None:
+            rate_limit = settings.LOG_RATE_LIMIT_PER_SECOND
+        if rate_limit and rate_limit > 0:
+            queue_handler.addFilter(
+                RateLimitFilter(
+                    rate_limit,
+                    rate_limit_burst
+                    if rate_limit_burst is not None
+                    else settings.LOG_RATE_LIMIT_BURST,
+                )
             )
-            file_handler.setFormatter(cls._formatter)
-            logger.addHandler(file_handler)
+        logger.addHandler(queue_handler)
 
         logger.propagate = False
         return logger
@@ -1,3 +1,6 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -9,15 +12,44 @@ from app.api import (
     outdated,
     pipelines,
     pull_requests,
+    refresh,
     releases,
     slack,
+    webhooks,
 )
 from app.core.config import settings
+from app.services.advisories import advisory_index
+from app.services.webhooks.github import webhook_batcher
+from app.utils.repositories import repository_manager
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Keep the repository mirrors fetched so git work at request time is a local worktree
+    mirror_refresh = None
+    if settings.REPOSITORY_MIRROR_REFRESH_SECONDS > 0:
+        mirror_refresh = asyncio.create_task(
+            repository_manager.refresh_forever(settings.REPOSITORIES, settings.REPOSITORY_MIRROR_REFRESH_SECONDS)
+        )
+    # Rebuild the offline advisory index from the OSV dumps once it is older than the interval
+    advisory_refresh = None
+    if settings.ADVISORY_REFRESH_SECONDS > 0:
+        advisory_refresh = asyncio.create_task(advisory_index.refresh_forever(settings.ADVISORY_REFRESH_SECONDS))
+    yield
+    for task in (mirror_refresh, advisory_refresh):
+        if task is not None:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+    # Publish webhook events still waiting for their debounce window
+    await webhook_batcher.flush()
+
 
 app = FastAPI(
     title="AlgoKit Management API",
     description="API for managing AlgoKit dependencies, outdated packages, GitHub issues, and changelog generation",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # Configure CORS
@@ -46,7 +78,9 @@ app.include_router(
     pull_requests.router, prefix=settings.API_V1_STR, tags=["pull_requests"]
 )
 app.include_router(releases.router, prefix=settings.API_V1_STR, tags=["releases"])
+app.include_router(refresh.router, prefix=settings.API_V1_STR, tags=["refresh"])
 app.include_router(slack.router, prefix=settings.API_V1_STR, tags=["slack"])
+app.include_router(webhooks.router, prefix=settings.API_V1_STR, tags=["webhooks"])
 
 
 @app.get("/")
@@ -0,0 +1,6 @@
+from .index import AdvisoryIndex, advisory_index
+
+__all__ = [
+    "AdvisoryIndex",
+    "advisory_index",
+]
@@ -0,0 +1,275 @@
+import asyncio
+import hashlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+import zipfile
+import zlib
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+import requests
+
+from app.core.config import settings
+from app.core.logging import LoggerFactory
+from app.services.advisories.osv import OSV_ECOSYSTEMS, iterate_dump
+from app.services.dependencies.identity import canonicalize_name
+from app.services.dependencies.requirements import VersionKey, parse_version
+
+logger = LoggerFactory.get_logger(__name__)
+
+# File layout: header, then one entry per package sorted by key hash, then the
+# zlib-compressed JSON advisories of each package that the entries point to
+_MAGIC = b"ALGOADV1"
+_HEADER = struct.Struct("<8sI")  # magic, package count
+_ENTRY = struct.Struct("<QQI")  # key hash, data offset, data length
+
+
+def _key_hash(language: str, name: str) -> int:
+    return int.from_bytes(hashlib.blake2b(f"{language}:{name}".encode(), digest_size=8).digest(), "little")
+
+
+@dataclass(frozen=True)
+class Advisory:
+    """
+    A vulnerability advisory as it applies to one package.
+
+    Attributes:
+        ranges: (lower, upper, upper_inclusive, upper text) affected ranges; lower bounds are
+            inclusive and a None bound is unbounded
+        versions: Affected versions listed explicitly, for advisories without ranges
+    """
+
+    id: str
+    summary: str
+    severity: Optional[str]
+    aliases: Tuple[str, ...]
+    ranges: Tuple[Tuple[Optional[VersionKey], Optional[VersionKey], bool, Optional[str]], ...]
+    versions: FrozenSet[Any]
+
+    @classmethod
+    def from_record(cls, record: List[Any]) -> "Advisory":
+        advisory_id, summary, severity, aliases, ranges, versions = record
+        parsed_ranges = []
+        for lower, upper, upper_inclusive in ranges:
+            lower_key = parse_version(lower) if lower else None
+            upper_key = parse_version(upper) if upper else None
+            # A bound that is not a version cannot be compared; skip the range rather than guess
+            if (lower and lower_key is None) or (upper and upper_key is None):
+                continue
+            parsed_ranges.append((lower_key, upper_key, upper_inclusive, upper))
+        return cls(
+            advisory_id,
+            summary,
+            severity,
+            tuple(aliases),
+            tuple(parsed_ranges),
+            frozenset(parse_version(version) or version for version in versions),
+        )
+
+    def affected_range(self, version: str) -> Optional[Tuple]:
+        """The range containing `version`, (None,) * 4 for an explicitly listed version, or None."""
+        key = parse_version(version)
+        if (key or version) in self.versions:
+            return (None, None, False, None)
+        if key is None:
+            return None
+        for affected in self.ranges:
+            lower, upper, upper_inclusive, _ = affected
+            if (lower is None or key >= lower) and (upper is None or key < upper or (upper_inclusive and key == upper)):
+                return affected
+        return None
+
+    def to_dict(self, affected_range: Tuple) -> Dict[str, Any]:
+        """Summary of the advisory for a version in `affected_range`, see affected_range."""
+        return {
+            "id": self.id,
+            "summary": self.summary,
+            "severity": self.severity,
+            "aliases": list(self.aliases),
+            # Only an exclusive upper bound is a release with the fix
+            "fixed": affected_range[3] if not affected_range[2] else None,
+        }
+
+
+def write_index(path: Path, records: Iterable[Tuple[str, str, List[Any]]]) -> int:
+    """
+    Write advisory records to an index file, replacing it atomically.
+
+    Args:
+        records: (language, canonical package name, advisory record) tuples
+
+    Returns:
+        Number of packages in the index
+    """
+    packages: Dict[Tuple[str, str], List[List[Any]]] = {}
+    for language, name, record in records:
+        packages.setdefault((language, name), []).append(record)
+
+    entries = []
+    blobs = []
+    offset = _HEADER.size + _ENTRY.size * len(packages)
+    for (language, name), advisories in packages.items():
+        blob = zlib.compress(json.dumps([language, name, advisories], separators=(",", ":")).encode())
+        entries.append((_key_hash(language, name), offset, len(blob)))
+        blobs.append(blob)
+        offset += len(blob)
+    order = sorted(range(len(entries)), key=lambda i: entries[i][0])
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write then rename: readers keep their mapping of the old file until they reopen
+    with tempfile.NamedTemporaryFile("wb", dir=path.parent, delete=False) as f:
+        f.write(_HEADER.pack(_MAGIC, len(entries)))
+        for i in order:
+            f.write(_ENTRY.pack(*entries[i]))
+        for blob in blobs:
+            f.write(blob)
+    os.replace(f.name, path)
+    return len(entries)
+
+
+class AdvisoryIndex:
+    """
+    Offline vulnerability advisories of PyPI and npm packages, built from the OSV data dumps.
+
+    The index is a single memory-mapped file: a lookup binary searches the
+    sorted key table and decompresses only that package's advisories, so
+    queries need no network and barely touch memory. Decoded packages are
+    memoized until the file is rebuilt.
+    """
+
+    def __init__(self, path: Optional[str]):
+        self.path = Path(path) if path else None
+        # (mapping, package count, generation), replaced as a whole so readers never see a partial update
+        self._snapshot: Optional[Tuple[mmap.mmap, int, int]] = None
+        self._signature: Optional[Tuple[int, int, int]] = None
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._lookup = lru_cache(maxsize=8192)(self._read)
+
+    def age(self) -> Optional[float]:
+        """Seconds since the index was built, or None if it does not exist."""
+        try:
+            return time.time() - self.path.stat().st_mtime if self.path else None
+        except FileNotFoundError:
+            return None
+
+    def _open(self) -> Optional[Tuple[mmap.mmap, int, int]]:
+        """The current snapshot, remapped when the file was rebuilt since; None without an index."""
+        with self._lock:
+            try:
+                stat = self.path.stat() if self.path else None
+            except FileNotFoundError:
+                stat = None
+            signature = (stat.st_ino, stat.st_mtime_ns, stat.st_size) if stat else None
+            if signature != self._signature:
+                snapshot = None
+                if stat and stat.st_size >= _HEADER.size:
+                    with open(self.path, "rb") as f:
+                        mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    magic, count = _HEADER.unpack_from(mapping, 0)
+                    if magic == _MAGIC:
+                        snapshot = (mapping, count, self._generation + 1)
+                    else:
+                        logger.warning(f"⚠️  Ignoring advisory index {self.path} with an unknown format")
+                # Readers holding the previous snapshot keep using its mapping until they finish
+                self._generation += 1
+                self._snapshot = snapshot
+                self._signature = signature
+                self._lookup.cache_clear()
+            return self._snapshot
+
+    def _read(self, snapshot: Tuple[mmap.mmap, int, int], language: str, name: str) -> Tuple[Advisory, ...]:
+        mapping, count, _ = snapshot
+        target = _key_hash(language, name)
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            if _ENTRY.unpack_from(mapping, _HEADER.size + middle * _ENTRY.size)[0] < target:
+                low = middle + 1
+            else:
+                high = middle
+        # Hashes can collide; the blob names its package
+        while low < count:
+            key_hash, offset, length = _ENTRY.unpack_from(mapping, _HEADER.size + low * _ENTRY.size)
+            if key_hash != target:
+                break
+            blob_language, blob_name, records = json.loads(zlib.decompress(mapping[offset : offset + length]))
+            if (blob_language, blob_name) == (language, name):
+                return tuple(Advisory.from_record(record) for record in records)
+            low += 1
+        return ()
+
+    def _advisories(self, snapshot: Tuple[mmap.mmap, int, int], language: str, name: str) -> Tuple[Advisory, ...]:
+        if language not in OSV_ECOSYSTEMS:
+            return ()
+        return self._lookup(snapshot, language, canonicalize_name(name, language))
+
+    def advisories_for(self, language: str, name: str) -> Tuple[Advisory, ...]:
+        """Every advisory of a package, whatever the version."""
+        snapshot = self._open()
+        if snapshot is None:
+            return ()
+        return self._advisories(snapshot, language, name)
+
+    def match(self, queries: Iterable[Tuple[str, str, str]]) -> List[List[Dict[str, Any]]]:
+        """
+        Advisories affecting each (language, package name, version), in query order.
+
+        The index is checked for a rebuild once per call and each distinct package is decoded once.
+        """
+        queries = list(queries)
+        snapshot = self._open()
+        if snapshot is None:
+            return [[] for _ in queries]
+        results = []
+        for language, name, version in queries:
+            matched = []
+            for advisory in self._advisories(snapshot, language, name):
+                affected_range = advisory.affected_range(version)
+                if affected_range is not None:
+                    matched.append(advisory.to_dict(affected_range))
+            results.append(matched)
+        return results
+
+    def build(self) -> int:
+        """
+        Rebuild the index from the OSV dumps.
+
+        Returns:
+            Number of packages with advisories
+
+        Raises:
+            requests.RequestException: If a dump cannot be downloaded
+            zipfile.BadZipFile: If a dump is not a valid archive
+        """
+        started = time.monotonic()
+        records = ((language, name, record) for language in OSV_ECOSYSTEMS for name, record in iterate_dump(language))
+        count = write_index(self.path, records)
+        logger.info(f"🛡️  Built advisory index of {count} packages in {time.monotonic() - started:.1f}s")
+        return count
+
+    async def refresh_forever(self, interval_seconds: float) -> None:
+        """Rebuild the index whenever it is older than `interval_seconds`, until cancelled."""
+        if self.path is None:
+            logger.info("⏭️  No advisory index path configured, not building the index")
+            return
+        while True:
+            age = self.age()
+            if age is None or age >= interval_seconds:
+                try:
+                    await asyncio.to_thread(self.build)
+                except (requests.RequestException, zipfile.BadZipFile, OSError) as e:
+                    logger.error(f"❌ Failed to build advisory index: {e}")
+                age = self.age()
+            fresh_for = interval_seconds - age if age is not None and age < interval_seconds else interval_seconds
+            await asyncio.sleep(fresh_for)
+
+
+advisory_index = AdvisoryIndex(settings.ADVISORY_INDEX_PATH)
@@ -0,0 +1,102 @@
+import json
+import tempfile
+import zipfile
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.logging import LoggerFactory
+from app.services.dependencies.identity import canonicalize_name
+from app.utils.http_client import http_get
+
+logger = LoggerFactory.get_logger(__name__)
+
+# Dependency graph language -> OSV ecosystem
+OSV_ECOSYSTEMS = {
+    "python": "PyPI",
+    "javascript": "npm",
+}
+
+# Affected range types whose events are package versions (GIT ranges are commits)
+VERSION_RANGE_TYPES = {"SEMVER", "ECOSYSTEM"}
+
+# [lower, upper, upper_inclusive]; a None bound is unbounded, the lower bound is inclusive
+RangeRecord = List[Any]
+
+
+def _ranges_from_events(events: List[Dict[str, str]]) -> List[RangeRecord]:
+    """Affected ranges of an OSV range: each `introduced` up to the next `fixed`, `last_affected` or `limit`."""
+    ranges = []
+    for event in events:
+        if "introduced" in event:
+            ranges.append([None if event["introduced"] == "0" else event["introduced"], None, False])
+        elif ranges and ranges[-1][1] is None:
+            if "fixed" in event or "limit" in event:
+                ranges[-1][1] = event.get("fixed") or event.get("limit")
+            elif "last_affected" in event:
+                ranges[-1][1:] = [event["last_affected"], True]
+    return ranges
+
+
+def _severity(advisory: Dict[str, Any]) -> Optional[str]:
+    severity = (advisory.get("database_specific") or {}).get("severity")
+    return severity.upper() if isinstance(severity, str) else None
+
+
+def parse_advisory(advisory: Dict[str, Any], language: str) -> Iterator[Tuple[str, List[Any]]]:
+    """
+    Compact records of an OSV advisory, one per affected package.
+
+    Yields:
+        (canonical package name, [id, summary, severity, aliases, ranges, versions])
+    """
+    if advisory.get("withdrawn"):
+        return
+    ecosystem = OSV_ECOSYSTEMS[language]
+    packages: Dict[str, Tuple[List[RangeRecord], List[str]]] = {}
+    for affected in advisory.get("affected") or []:
+        package = affected.get("package") or {}
+        if package.get("ecosystem") != ecosystem or not package.get("name"):
+            continue
+        ranges, versions = packages.setdefault(canonicalize_name(package["name"], language), ([], []))
+        for affected_range in affected.get("ranges") or []:
+            if affected_range.get("type") in VERSION_RANGE_TYPES:
+                ranges.extend(_ranges_from_events(affected_range.get("events") or []))
+        versions.extend(affected.get("versions") or [])
+
+    for name, (ranges, versions) in packages.items():
+        # Explicit versions only matter when there is no range to match; they can number in the hundreds
+        yield name, [
+            advisory["id"],
+            advisory.get("summary") or "",
+            _severity(advisory),
+            advisory.get("aliases") or [],
+            ranges,
+            [] if ranges else sorted(set(versions)),
+        ]
+
+
+def iterate_dump(language: str) -> Iterator[Tuple[str, List[Any]]]:
+    """
+    Download the OSV dump of a language's ecosystem and yield its advisories as compact records.
+
+    Raises:
+        requests.RequestException: If the dump cannot be downloaded
+        zipfile.BadZipFile: If the download is not a valid archive
+    """
+    url = f"{settings.OSV_DUMP_URL.rstrip('/')}/{OSV_ECOSYSTEMS[language]}/all.zip"
+    logger.info(f"📥 Downloading OSV advisories from {url}")
+    response = http_get(url, stream=True, timeout=settings.ADVISORY_DOWNLOAD_TIMEOUT_SECONDS)
+    response.raise_for_status()
+    with tempfile.TemporaryFile() as archive_file:
+        for chunk in response.iter_content(chunk_size=1024 * 1024):
+            archive_file.write(chunk)
+        with zipfile.ZipFile(archive_file) as archive:
+            for member in archive.namelist():
+                if not member.endswith(".json"):
+                    continue
+                try:
+                    advisory = json.loads(archive.read(member))
+                except ValueError as e:
+                    logger.warning(f"⚠️  Skipping unreadable advisory {member}: {e}")
+                    continue
+                yield from parse_advisory(advisory, language)
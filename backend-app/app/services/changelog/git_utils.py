@@ -1,10 +1,10 @@
 import subprocess
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
-from pathlib import Path
 
 from app.core.logging import LoggerFactory
 from app.services.changelog.models import GitOperationResult
+from app.utils.repositories import repository_manager, repository_url
 
 logger = LoggerFactory.get_logger(__name__)
 
@@ -51,48 +51,6 @@ def get_repository_filter_patterns(repo_name: Optional[str]) -> tuple[list[str],
         return patterns, description
 
 
-def get_or_clone_repo(repo_url: str, repo_name: str) -> Optional[str]:
-    """Get repository from .algokit_repos folder, clone or update as needed."""
-    repos_dir = Path(".algokit_repos")
-    repos_dir.mkdir(exist_ok=True)
-    
-    repo_path = repos_dir / repo_name
-    
-    try:
-        if repo_path.exists():
-            logger.info(f"Updating existing repository: {repo_name}")
-            
-            # Determine main branch (main vs master)
-            try:
-                result = subprocess.run(
-                    ["git", "symbolic-ref", "refs/remotes/origin/HEAD"],
-                    cwd=repo_path,
-                    capture_output=True, text=True, check=False
-                )
-                main_branch = result.stdout.strip().split('/')[-1] if result.returncode == 0 else "main"
-            except:
-                main_branch = "main"
-            
-            # Checkout main branch and hard pull
-            subprocess.run(["git", "checkout", main_branch], cwd=repo_path, check=True, capture_output=True)
-            subprocess.run(["git", "fetch", "origin"], cwd=repo_path, check=True, capture_output=True)
-            subprocess.run(["git", "reset", "--hard", f"origin/{main_branch}"], cwd=repo_path, check=True, capture_output=True)
-            
-        else:
-            logger.info(f"Cloning fresh repository: {repo_name}")
-            subprocess.run(
-                ["git", "clone", repo_url, str(repo_path)],
-                check=True,
-                capture_output=True,
-            )
-        
-        return str(repo_path)
-        
-    except subprocess.CalledProcessError as e:
-        logger.error(f"Error with repository {repo_name}: {e}")
-        return None
-
-
 def get_commits_since(repo_path: str, days_back: int = 7) -> List[str]:
     """Get commit hashes from the last N days using git log.
     
@@ -289,26 +247,28 @@ def process_repository_git_data(repo_config: Dict[str, Any], days_back: int = 7)
         GitOperationResult with all git data or error information
     """
     repo_name = repo_config["name"]
-    repo_url = f"https://github.com/{repo_config['owner']}/{repo_name}"
+    repo_url = repository_url(repo_config)
     
     logger.info(f"Processing git data for {repo_name}")
     
-    # Get or clone repository
-    repo_path = get_or_clone_repo(repo_url, repo_name)
-    if not repo_path:
-        return GitOperationResult(
-            repository_name=repo_name,
-            success=False,
-            commits=[],
-            diff_content="",
-            git_log="",
-            error="Failed to get repository"
-        )
+    # Worktree of the shared mirror; only history is read, so no files are checked out
+    with repository_manager.checkout(
+        repo_url, repo_name, branch=repo_config.get("branch"), history_only=True
+    ) as repo_path:
+        if not repo_path:
+            return GitOperationResult(
+                repository_name=repo_name,
+                success=False,
+                commits=[],
+                diff_content="",
+                git_log="",
+                error="Failed to get repository"
+            )
 
-    # Get commits, diff, and log
-    commits = get_commits_since(repo_path, days_back)
-    diff_content = get_repository_diff(repo_path, days_back, repo_name)
-    git_log = get_detailed_git_log(repo_path, days_back, repo_name)
+        # Get commits, diff, and log
+        commits = get_commits_since(repo_path, days_back)
+        diff_content = get_repository_diff(repo_path, days_back, repo_name)
+        git_log = get_detailed_git_log(repo_path, days_back, repo_name)
     
     if not commits and not diff_content:
         return GitOperationResult(
@@ -0,0 +1,81 @@
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional
+
+from app.core.config import settings
+from app.core.logging import LoggerFactory
+
+logger = LoggerFactory.get_logger(__name__)
+
+# Bump when a parser's output changes so stale entries on disk are ignored
+PARSED_FORMAT_VERSION = 1
+
+
+class ParsedBlobCache:
+    """
+    Cache of parsed manifests and lockfiles keyed by git blob SHA.
+
+    A blob SHA identifies the exact file content, so an entry never needs
+    invalidating: unchanged files skip both the download and the parse.
+    Entries live in a bounded in-memory LRU backed by JSON files on local
+    disk, which survive restarts.
+    """
+
+    def __init__(self, directory: Optional[str], max_entries: int):
+        self.directory = Path(directory) / f"v{PARSED_FORMAT_VERSION}" if directory else None
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _path(self, sha: str) -> Path:
+        return self.directory / sha[:2] / f"{sha}.json"
+
+    def get(self, sha: str) -> Optional[Any]:
+        with self._lock:
+            if sha in self._entries:
+                self._entries.move_to_end(sha)
+                return self._entries[sha]
+
+        if self.directory is None:
+            return None
+        try:
+            with open(self._path(sha), encoding="utf-8") as f:
+                value = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️  Ignoring unreadable cache entry for blob {sha}: {e}")
+            return None
+
+        self._remember(sha, value)
+        return value
+
+    def set(self, sha: str, value: Any) -> None:
+        self._remember(sha, value)
+        if self.directory is None:
+            return
+        path = self._path(sha)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename so concurrent readers never see a partial file
+            with tempfile.NamedTemporaryFile("w", dir=path.parent, delete=False, encoding="utf-8") as f:
+                json.dump(value, f, separators=(",", ":"))
+            os.replace(f.name, path)
+        except OSError as e:
+            logger.warning(f"⚠️  Could not write cache entry for blob {sha}: {e}")
+
+    def _remember(self, sha: str, value: Any) -> None:
+        with self._lock:
+            self._entries[sha] = value
+            self._entries.move_to_end(sha)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+parsed_blob_cache = ParsedBlobCache(
+    settings.DEPENDENCIES_BLOB_CACHE_DIR, settings.DEPENDENCIES_BLOB_CACHE_MAX_ENTRIES
+)
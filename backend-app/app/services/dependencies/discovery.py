@@ -0,0 +1,204 @@
+import json
+import posixpath
+import re
+import tomllib
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import requests
+
+from app.core.config import settings
+from app.core.logging import LoggerFactory
+from app.utils.collection import map_concurrently, record_collection_error
+from app.utils.github import get_github_token
+from app.utils.http_client import http_get
+
+from .blob_cache import parsed_blob_cache
+
+logger = LoggerFactory.get_logger(__name__)
+
+# Manifest file name -> language of the package it describes
+MANIFEST_LANGUAGES = {
+    "pyproject.toml": "python",
+    "package.json": "javascript",
+}
+
+# Lockfile name -> language of the package it locks
+LOCKFILE_LANGUAGES = {
+    "poetry.lock": "python",
+    "uv.lock": "python",
+    "package-lock.json": "javascript",
+    "pnpm-lock.yaml": "javascript",
+    "yarn.lock": "javascript",
+}
+
+# Directories whose manifests are vendored or generated rather than maintained
+EXCLUDED_DIRECTORIES = {"node_modules", ".venv", "venv", "site-packages", "dist", "build"}
+
+
+@dataclass
+class RepoFile:
+    path: str
+    sha: str
+    language: str
+    content: Optional[str] = None
+
+    @property
+    def directory(self) -> str:
+        return posixpath.dirname(self.path)
+
+    @property
+    def name(self) -> str:
+        return posixpath.basename(self.path)
+
+
+@dataclass
+class RepoFiles:
+    manifests: List[RepoFile] = field(default_factory=list)
+    lockfiles: List[RepoFile] = field(default_factory=list)
+
+
+def _repo_api_url(repo: Dict[str, Any]) -> str:
+    organization = re.sub("_", "", repo.get("owner"))
+    return f"https://api.github.com/repos/{organization}/{repo.get('name')}"
+
+
+def _headers(token: str, accept: str = "application/vnd.github.v3+json") -> Dict[str, str]:
+    return {"Authorization": f"token {token}", "Accept": accept}
+
+
+def get_repo_tree(repo: Dict[str, Any], token: Optional[str] = None) -> Optional[List[Dict[str, Any]]]:
+    """
+    Fetch the full file tree of the repository's branch (or default branch) in one request.
+
+    Returns:
+        Tree entries with path, type and sha, or None if the tree could not be fetched
+    """
+    repo_name = repo.get("name")
+    ref = repo.get("branch") or "HEAD"
+    url = f"{_repo_api_url(repo)}/git/trees/{ref}"
+
+    logger.info(f"🌳 Fetching file tree of {repo_name} ({ref})")
+    try:
+        response = http_get(url, headers=_headers(token or get_github_token()), params={"recursive": "1"})
+    except requests.RequestException as e:
+        record_collection_error(f"dependencies:{repo_name}", f"❌ Failed to fetch tree for {repo_name}: {e}")
+        return None
+
+    if response.status_code != 200:
+        record_collection_error(f"dependencies:{repo_name}", f"❌ Failed to fetch tree for {repo_name}: {response.status_code}")
+        return None
+
+    data = response.json()
+    if data.get("truncated"):
+        record_collection_error(
+            f"dependencies:{repo_name}",
+            f"⚠️  Tree of {repo_name} is truncated, nested packages may be missing",
+        )
+    return data.get("tree", [])
+
+
+def discover_repo_files(repo: Dict[str, Any], token: Optional[str] = None) -> Optional[RepoFiles]:
+    """
+    Find every manifest and lockfile in the repository, at any depth.
+
+    Returns:
+        The discovered files (without content), or None if the tree could not be fetched
+    """
+    tree = get_repo_tree(repo, token)
+    if tree is None:
+        return None
+
+    files = RepoFiles()
+    for entry in tree:
+        if entry.get("type") != "blob":
+            continue
+        path = entry["path"]
+        if EXCLUDED_DIRECTORIES.intersection(path.split("/")[:-1]):
+            continue
+        name = posixpath.basename(path)
+        if name in MANIFEST_LANGUAGES:
+            files.manifests.append(RepoFile(path, entry["sha"], MANIFEST_LANGUAGES[name]))
+        elif name in LOCKFILE_LANGUAGES:
+            files.lockfiles.append(RepoFile(path, entry["sha"], LOCKFILE_LANGUAGES[name]))
+
+    logger.info(
+        f"🔎 Found {len(files.manifests)} manifest(s) and {len(files.lockfiles)} lockfile(s) in {repo.get('name')}"
+    )
+    return files
+
+
+def fetch_blob(repo: Dict[str, Any], sha: str, token: Optional[str] = None) -> Optional[str]:
+    """Fetch the raw content of a blob by SHA, or None if it could not be fetched."""
+    repo_name = repo.get("name")
+    url = f"{_repo_api_url(repo)}/git/blobs/{sha}"
+    try:
+        response = http_get(url, headers=_headers(token or get_github_token(), "application/vnd.github.raw+json"))
+    except requests.RequestException as e:
+        record_collection_error(f"dependencies:{repo_name}", f"❌ Failed to fetch blob {sha} for {repo_name}: {e}")
+        return None
+
+    if response.status_code != 200:
+        record_collection_error(f"dependencies:{repo_name}", f"❌ Failed to fetch blob {sha} for {repo_name}: {response.status_code}")
+        return None
+    return response.text
+
+
+def fetch_contents(repo: Dict[str, Any], files: List[RepoFile], token: Optional[str] = None) -> List[RepoFile]:
+    """Fetch the content of the given files concurrently, dropping the ones that failed."""
+    token = token or get_github_token()
+
+    def fetch(repo_file: RepoFile) -> RepoFile:
+        repo_file.content = fetch_blob(repo, repo_file.sha, token)
+        return repo_file
+
+    fetched = map_concurrently(fetch, files, settings.DEPENDENCIES_FILE_WORKERS)
+    return [repo_file for repo_file in fetched if repo_file.content is not None]
+
+
+def fetch_parsed(
+    repo: Dict[str, Any],
+    files: List[RepoFile],
+    parse: Callable[[RepoFile], Any],
+    token: Optional[str] = None,
+) -> List[Tuple[RepoFile, Any]]:
+    """
+    Parsed content of the given files, in input order.
+
+    Files whose blob SHA is in the parsed blob cache skip both the download
+    and the parse; the others are fetched concurrently, parsed and cached.
+    Files that fail to download or parse are left out.
+    """
+    cached = {repo_file.sha: parsed_blob_cache.get(repo_file.sha) for repo_file in files}
+    misses = [repo_file for repo_file in files if cached[repo_file.sha] is None]
+    logger.info(
+        f"🗃️  {len(files) - len(misses)}/{len(files)} file(s) of {repo.get('name')} served from the blob cache"
+    )
+
+    for repo_file in fetch_contents(repo, misses, token):
+        try:
+            parsed = parse(repo_file)
+        except ValueError as e:
+            logger.warning(f"⚠️  Could not parse {repo_file.path} in {repo.get('name')}: {e}")
+            continue
+        parsed_blob_cache.set(repo_file.sha, parsed)
+        cached[repo_file.sha] = parsed
+        # The content is only needed to parse, don't keep large lockfiles around
+        repo_file.content = None
+
+    return [(repo_file, cached[repo_file.sha]) for repo_file in files if cached[repo_file.sha] is not None]
+
+
+def parse_manifest(repo_file: RepoFile) -> Dict[str, Any]:
+    if repo_file.name.endswith(".toml"):
+        return tomllib.loads(repo_file.content)
+    return json.loads(repo_file.content)
+
+
+def get_manifest_package_name(repo_file: RepoFile, manifest_data: Dict[str, Any]) -> Optional[str]:
+    """Name of the package a pyproject.toml or package.json describes, if any."""
+    if repo_file.language == "python":
+        return (manifest_data.get("project") or {}).get("name") or (
+            (manifest_data.get("tool") or {}).get("poetry") or {}
+        ).get("name")
+    return manifest_data.get("name")
@@ -0,0 +1,180 @@
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+
+from app.core.logging import LoggerFactory
+
+logger = LoggerFactory.get_logger(__name__)
+
+
+def _version_key(version: Any) -> Hashable:
+    # Dependency nodes carry {"repo_name", "version"} entries, repository nodes plain strings
+    if isinstance(version, dict):
+        return (version.get("repo_name"), version.get("version"))
+    return version
+
+
+class DependencyGraph:
+    """
+    Indexed in-memory dependency graph.
+
+    Node ids are interned to integer indexes on first sight (from a node or a
+    link endpoint), so membership checks, version merges and neighbour lookups
+    are O(1) per item regardless of the graph size. Links are kept in insertion
+    order and indexed both by source (adjacency) and by target (reverse
+    adjacency).
+
+    Links follow the published convention: `source` is the dependency and
+    `target` the package or repository that depends on it.
+    """
+
+    def __init__(self):
+        self._index: Dict[str, int] = {}
+        self._ids: List[str] = []
+        self._nodes: List[Optional[Dict[str, Any]]] = []
+        self._versions: List[Dict[Hashable, Any]] = []
+        self._node_order: List[int] = []
+        self._links: List[Dict[str, Any]] = []
+        self._link_ends: List[Tuple[int, int]] = []
+        self._outgoing: List[List[int]] = []
+        self._incoming: List[List[int]] = []
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, List[Dict[str, Any]]]) -> "DependencyGraph":
+        """Build a graph from the published {"nodes", "links"} representation."""
+        graph = cls()
+        graph.add_nodes(data.get("nodes", []))
+        graph.add_links(data.get("links", []))
+        return graph
+
+    def intern(self, node_id: str) -> int:
+        """Return the integer index of a node id, allocating one if it is new."""
+        index = self._index.get(node_id)
+        if index is None:
+            index = len(self._ids)
+            self._index[node_id] = index
+            self._ids.append(node_id)
+            self._nodes.append(None)
+            self._versions.append({})
+            self._outgoing.append([])
+            self._incoming.append([])
+        return index
+
+    def add_node(self, node: Dict[str, Any]) -> int:
+        """
+        Add a node, merging it into an existing node with the same id.
+
+        A duplicate keeps the first node's attributes; its version entries are
+        merged, dropping exact (repo_name, version) duplicates.
+        """
+        index = self.intern(node["id"])
+        versions = self._versions[index]
+        if self._nodes[index] is None:
+            self._nodes[index] = dict(node)
+            self._node_order.append(index)
+        else:
+            logger.debug(f"Duplicate node found: {node['id']}")
+
+        for version in node.get("version") or []:
+            key = _version_key(version)
+            # Re-assigning keeps the first position and the latest entry, like a dict merge
+            versions[key] = version
+        return index
+
+    def add_nodes(self, nodes: Iterable[Dict[str, Any]]) -> None:
+        for node in nodes:
+            self.add_node(node)
+
+    def add_link(self, link: Dict[str, Any]) -> int:
+        source = self.intern(link["source"])
+        target = self.intern(link["target"])
+        position = len(self._links)
+        self._links.append(link)
+        self._link_ends.append((source, target))
+        self._outgoing[source].append(position)
+        self._incoming[target].append(position)
+        return position
+
+    def add_links(self, links: Iterable[Dict[str, Any]]) -> None:
+        for link in links:
+            self.add_link(link)
+
+    def __contains__(self, node_id: str) -> bool:
+        index = self._index.get(node_id)
+        return index is not None and self._nodes[index] is not None
+
+    def __len__(self) -> int:
+        return len(self._node_order)
+
+    @property
+    def link_count(self) -> int:
+        return len(self._links)
+
+    @property
+    def index_size(self) -> int:
+        """Number of interned ids, including link endpoints without a node."""
+        return len(self._ids)
+
+    def index_of(self, node_id: str) -> Optional[int]:
+        return self._index.get(node_id)
+
+    def id_of(self, index: int) -> str:
+        return self._ids[index]
+
+    def get_node(self, node_id: str) -> Optional[Dict[str, Any]]:
+        index = self._index.get(node_id)
+        if index is None or self._nodes[index] is None:
+            return None
+        return self._serialize_node(index)
+
+    def node_indexes(self) -> Iterator[int]:
+        return iter(self._node_order)
+
+    def node_at(self, index: int) -> Optional[Dict[str, Any]]:
+        """The stored node (without merged versions) at an interned index."""
+        return self._nodes[index]
+
+    def versions_at(self, index: int) -> List[Any]:
+        return list(self._versions[index].values())
+
+    def incoming_links(self, index: int) -> Iterator[Tuple[Dict[str, Any], int]]:
+        """Links into the node at `index` (its dependencies), with their source index."""
+        return ((self._links[link], self._link_ends[link][0]) for link in self._incoming[index])
+
+    def dependents(self, node_id: str) -> List[str]:
+        """Ids of the packages and repositories that depend on `node_id`."""
+        index = self._index.get(node_id)
+        if index is None:
+            return []
+        return [self._ids[self._link_ends[link][1]] for link in self._outgoing[index]]
+
+    def dependencies(self, node_id: str) -> List[str]:
+        """Ids of the dependencies of `node_id`."""
+        index = self._index.get(node_id)
+        if index is None:
+            return []
+        return [self._ids[self._link_ends[link][0]] for link in self._incoming[index]]
+
+    def dependent_indexes(self, index: int) -> Iterator[int]:
+        return (self._link_ends[link][1] for link in self._outgoing[index])
+
+    def dangling_links(self) -> List[Tuple[Dict[str, Any], str]]:
+        """Links whose source or target has no node, with the missing endpoint name."""
+        dangling = []
+        for link, (source, target) in zip(self._links, self._link_ends):
+            if self._nodes[source] is None:
+                dangling.append((link, "source"))
+            if self._nodes[target] is None:
+                dangling.append((link, "target"))
+        return dangling
+
+    def _serialize_node(self, index: int) -> Dict[str, Any]:
+        node = dict(self._nodes[index])
+        if "version" in node or self._versions[index]:
+            node["version"] = list(self._versions[index].values())
+        return node
+
+    def to_dict(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Serialize to the published {"nodes", "links"} representation."""
+        return {
+            "nodes": [self._serialize_node(index) for index in self._node_order],
+            "links": list(self._links),
+        }
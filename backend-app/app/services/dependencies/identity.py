@@ -0,0 +1,87 @@
+import re
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.core.config import settings
+
+# PEP 503: runs of -, _ and . are equivalent and names are case-insensitive
+_PEP503_SEPARATORS = re.compile(r"[-_.]+")
+
+# npm scopes owned as a whole
+SCOPE_OWNERS = {
+    "@algorandfoundation": "algorandfoundation",
+    "@makerx": "makerx",
+}
+
+# Package name prefixes owned outside of settings.REPOSITORIES
+PREFIX_OWNERS = {
+    "py-algorand-sdk": "algorandtechnologies",
+}
+
+DEFAULT_OWNER = "other"
+
+
+def canonicalize_name(package_name: str, language: Optional[str] = None) -> str:
+    """
+    Canonical form of a package name within its ecosystem.
+
+    Python names are normalized per PEP 503 (`AlgoKit_Utils` -> `algokit-utils`),
+    npm names are lowercased. Without a language, both rules apply.
+    """
+    name = package_name.strip().lower()
+    if language == "javascript" or name.startswith("@"):
+        return name
+    return _PEP503_SEPARATORS.sub("-", name)
+
+
+def _name_tokens(canonical_name: str) -> Tuple[str, ...]:
+    return tuple(_PEP503_SEPARATORS.split(canonical_name))
+
+
+class PackageOwnerIndex:
+    """
+    Owner lookup over a token trie of known package names.
+
+    Names are split on separators and walked token by token, so a package
+    is owned by the longest known name it starts with: `algokit` covers
+    `algokit-utils-debug`, and `algorand-python-testing` wins over a shorter
+    `algorand-python`. npm scopes are matched as a whole before the trie.
+    """
+
+    def __init__(self, owners: Iterable[Tuple[str, str]], scopes: Dict[str, str]):
+        self._trie: Dict[str, Any] = {}
+        self._scopes = {canonicalize_name(scope): owner for scope, owner in scopes.items()}
+        for name, owner in owners:
+            node = self._trie
+            for token in _name_tokens(canonicalize_name(name)):
+                node = node.setdefault(token, {})
+            node[None] = owner
+        # Lookups are per name, and the same dependency appears in most repositories
+        self.owner_of = lru_cache(maxsize=None)(self._owner_of)
+
+    def _owner_of(self, package_name: str) -> str:
+        name = canonicalize_name(package_name)
+        if name.startswith("@") and name.partition("/")[0] in self._scopes:
+            return self._scopes[name.partition("/")[0]]
+
+        owner = DEFAULT_OWNER
+        node = self._trie
+        for token in _name_tokens(name):
+            node = node.get(token)
+            if node is None:
+                break
+            owner = node.get(None, owner)
+        return owner
+
+
+def _known_package_owners(repositories: List[Dict[str, Any]]) -> List[Tuple[str, str]]:
+    owners = [
+        (repo["build_name"], "algorandfoundation")
+        for repo in repositories
+        if repo.get("build_name") is not None
+    ]
+    owners.extend(PREFIX_OWNERS.items())
+    return owners
+
+
+package_owners = PackageOwnerIndex(_known_package_owners(settings.REPOSITORIES), SCOPE_OWNERS)
@@ -0,0 +1,177 @@
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+from app.core.config import settings
+from app.core.logging import LoggerFactory
+
+from .graph import DependencyGraph
+from .identity import canonicalize_name
+from .utils import get_dependency_node_id, get_node_name
+
+logger = LoggerFactory.get_logger(__name__)
+
+
+def _bits(bitset: int) -> Iterator[int]:
+    while bitset:
+        lowest = bitset & -bitset
+        yield lowest.bit_length() - 1
+        bitset ^= lowest
+
+
+class ImpactIndex:
+    """
+    Precomputed reverse-dependency reachability over a DependencyGraph.
+
+    For every node the set of direct and of transitive dependents is stored as
+    a bitset (a Python int) over the graph's interned node indexes, so an
+    impact query is a couple of dict lookups and a bitset decode instead of a
+    graph walk.
+
+    A repository or workspace package node is linked to the dependency node
+    it is published as (e.g. the `algokit-utils` repository and the
+    `algokit-utils-python` dependency), which is what makes dependents
+    transitive across repositories.
+    """
+
+    def __init__(self, graph: DependencyGraph):
+        self.graph = graph
+        size = graph.index_size
+        direct = [0] * size
+        published_as: Dict[int, int] = {}
+
+        for index in graph.node_indexes():
+            for dependent in graph.dependent_indexes(index):
+                # A dangling link's endpoint has an index but no node to describe
+                if graph.node_at(dependent) is not None:
+                    direct[index] |= 1 << dependent
+
+            node = graph.node_at(index)
+            if node.get("language"):
+                alias = graph.index_of(get_dependency_node_id(node["name"], node["language"]))
+                if alias is not None and alias != index:
+                    published_as[index] = alias
+
+        # A package's dependents include the dependents of what it is published as
+        for index, alias in published_as.items():
+            direct[index] |= direct[alias]
+
+        self.direct = direct
+        self.published_as = published_as
+        self.transitive = self._closure(direct)
+        self._names: Dict[str, Set[int]] = {}
+        for index in graph.node_indexes():
+            self._names.setdefault(canonicalize_name(graph.node_at(index)["name"]), set()).add(index)
+
+        logger.info(f"🧮 Built impact index over {size} nodes and {graph.link_count} links")
+
+    @staticmethod
+    def _closure(direct: List[int]) -> List[int]:
+        """Transitive closure by fixpoint iteration; converges in a few passes for dependency DAGs and handles cycles."""
+        reach = list(direct)
+        changed = True
+        while changed:
+            changed = False
+            for index, bitset in enumerate(reach):
+                expanded = bitset
+                for dependent in _bits(bitset):
+                    expanded |= reach[dependent]
+                if expanded != bitset:
+                    reach[index] = expanded
+                    changed = True
+        return reach
+
+    def resolve(self, package: str, language: Optional[str] = None) -> List[int]:
+        """Node indexes matching a node id, package name or configured repository name."""
+        matches: Set[int] = set()
+        index = self.graph.index_of(package)
+        if index is not None and package in self.graph:
+            matches.add(index)
+        matches |= self._names.get(canonicalize_name(package), set())
+        for repo in settings.REPOSITORIES:
+            if repo["name"] == package:
+                index = self.graph.index_of(get_node_name(repo))
+                if index is not None and get_node_name(repo) in self.graph:
+                    matches.add(index)
+
+        if language:
+            matches = {i for i in matches if self.graph.node_at(i).get("language") == language}
+        return sorted(matches)
+
+    def _constraints(self, dependent: int, affected: int) -> List[Dict[str, Any]]:
+        """Version constraints the dependent declares on the affected packages."""
+        dependent_id = self.graph.id_of(dependent)
+        constraints = []
+        for link, source in self.graph.incoming_links(dependent):
+            if not affected >> source & 1:
+                continue
+            versions = [
+                version.get("version")
+                for version in self.graph.versions_at(source)
+                if isinstance(version, dict) and version.get("repo_name") == dependent_id
+            ]
+            constraints.append(
+                {
+                    "dependency": self.graph.id_of(source),
+                    "type": link.get("type"),
+                    "version": versions[0] if versions else None,
+                }
+            )
+        return constraints
+
+    def _describe(self, index: int, affected: int) -> Dict[str, Any]:
+        node = self.graph.node_at(index)
+        return {
+            "id": node["id"],
+            "name": node["name"],
+            "language": node.get("language"),
+            "repository": node.get("repository"),
+            "constraints": self._constraints(index, affected),
+        }
+
+    def query(self, package: str, language: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Direct and transitive dependents of a package.
+
+        Returns:
+            The matched nodes plus the direct dependents and the dependents only
+            reached transitively, each with the constraints it declares on the
+            affected packages
+        """
+        matches = self.resolve(package, language)
+        direct = 0
+        transitive = 0
+        affected = 0
+        for index in matches:
+            direct |= self.direct[index]
+            transitive |= self.transitive[index]
+            affected |= 1 << index
+            if index in self.published_as:
+                affected |= 1 << self.published_as[index]
+
+        # Every impacted package propagates the change through what it is published as
+        for index in _bits(transitive):
+            affected |= 1 << index
+            if index in self.published_as:
+                affected |= 1 << self.published_as[index]
+
+        return {
+            "package": package,
+            "matched_nodes": [self.graph.id_of(index) for index in matches],
+            "direct": [self._describe(index, affected) for index in _bits(direct)],
+            "transitive": [
+                self._describe(index, affected) for index in _bits(transitive & ~direct)
+            ],
+        }
+
+
+_index_cache: Dict[str, ImpactIndex] = {}
+
+
+def get_impact_index(snapshot: Dict[str, Any]) -> ImpactIndex:
+    """Impact index of a published dependencies snapshot, built once per snapshot."""
+    key = snapshot.get("metadata", {}).get("created_at", "")
+    index = _index_cache.get(key)
+    if index is None:
+        index = ImpactIndex(DependencyGraph.from_dict(snapshot["results"]))
+        _index_cache.clear()
+        _index_cache[key] = index
+    return index
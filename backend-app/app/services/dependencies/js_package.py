@@ -1,8 +1,6 @@
 from typing import Any, Dict, List, Tuple
 
-import requests
-
-from .utils import get_node_name, get_package_owner
+from .utils import get_dependency_node_id, get_node_name, get_package_owner
 
 
 def get_node_links_from_js_deps(
@@ -14,7 +12,7 @@ def get_node_links_from_js_deps(
 
     nodes = [
         {
-            "id": f"{name}-{repo.get('language')}",
+            "id": get_dependency_node_id(name, repo.get("language")),
             "name": name,
             "version": [{"repo_name": repo_node_name, "version": version}],
             "owner": get_package_owner(name),
@@ -24,7 +22,7 @@ def get_node_links_from_js_deps(
     ]
     links = [
         {
-            "source": f"{name}-{repo.get('language')}",
+            "source": get_dependency_node_id(name, repo.get("language")),
             "target": repo_node_name,
             **link_data,
         }
@@ -35,10 +33,9 @@ def get_node_links_from_js_deps(
 
 
 def get_node_links_from_js_repo(
-    repo: Dict, repo_contents: List[Dict]
+    repo: Dict, package_json_data: Dict[str, Any]
 ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
     graph_kwargs = {"language": "javascript"}
-    package_json = [item for item in repo_contents if item["name"] == "package.json"]
     repo_node = {
         "id": get_node_name(repo),
         "name": get_node_name(repo),
@@ -47,10 +44,7 @@ def get_node_links_from_js_repo(
         "type": "dependency",
     }
 
-    if len(package_json) > 0:
-        package_json_url = package_json[0]["download_url"]
-        package_json_response = requests.get(package_json_url)
-        package_json_data = package_json_response.json()
+    if package_json_data:
         repo_node["version"] = [package_json_data.get("version")]
         (dependencies_nodes, dependencies_links) = get_node_links_from_js_deps(
             package_json_data.get("dependencies"),
@@ -0,0 +1,408 @@
+import io
+import json
+import re
+from dataclasses import dataclass, field
+from json.decoder import scanstring
+from typing import Any, Callable, Dict, Generator, Iterable, Iterator, List, Optional, Set, Tuple
+
+from app.core.logging import LoggerFactory
+
+from .utils import get_dependency_node_id, get_package_owner
+
+logger = LoggerFactory.get_logger(__name__)
+
+
+@dataclass
+class LockedPackage:
+    """A package pinned by a lockfile, with the names of the packages it depends on."""
+
+    name: str
+    version: str
+    dependencies: List[str] = field(default_factory=list)
+    # Installed below another package (npm nested node_modules) rather than at the top level
+    nested: bool = False
+
+
+# Lockfiles are parsed line by line (or entry by entry for package-lock.json)
+# and packages are yielded as soon as they are complete, so a multi-megabyte
+# lockfile never becomes a nested dict in memory.
+
+_TOML_HEADER = re.compile(r"^\[\[?([^\]]+)\]\]?\s*$")
+_TOML_STRING_FIELD = re.compile(r'^(name|version)\s*=\s*"([^"]*)"')
+_TOML_KEY = re.compile(r'^"?([A-Za-z0-9_.\-]+)"?\s*=')
+_TOML_INLINE_NAME = re.compile(r'name\s*=\s*"([^"]+)"')
+
+
+def parse_poetry_lock(lines: Iterable[str]) -> Iterator[LockedPackage]:
+    """Stream the [[package]] entries of a poetry.lock."""
+    package: Optional[LockedPackage] = None
+    section = None
+
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        header = _TOML_HEADER.match(line)
+        if header:
+            section = header.group(1).strip()
+            if line.startswith("[[") and section == "package":
+                if package and package.name:
+                    yield package
+                package = LockedPackage(name="", version="")
+            continue
+
+        if package is None:
+            continue
+        if section == "package":
+            field_match = _TOML_STRING_FIELD.match(line)
+            if field_match:
+                setattr(package, field_match.group(1), field_match.group(2))
+        elif section == "package.dependencies":
+            key = _TOML_KEY.match(line)
+            if key:
+                package.dependencies.append(key.group(1))
+
+    if package and package.name:
+        yield package
+
+
+def parse_uv_lock(lines: Iterable[str]) -> Iterator[LockedPackage]:
+    """
+    Stream the [[package]] entries of a uv.lock.
+
+    Workspace members (editable or virtual sources) are the repository's own
+    packages rather than locked dependencies and are skipped.
+    """
+    package: Optional[LockedPackage] = None
+    is_member = False
+    section = None
+    in_dependencies = False
+
+    def finished() -> Optional[LockedPackage]:
+        return package if package and package.name and not is_member else None
+
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        header = _TOML_HEADER.match(line)
+        if header:
+            in_dependencies = False
+            section = header.group(1).strip()
+            if line.startswith("[[") and section == "package":
+                if finished():
+                    yield package
+                package = LockedPackage(name="", version="")
+                is_member = False
+            continue
+
+        if package is None or section != "package":
+            continue
+        if in_dependencies:
+            if line.startswith("]"):
+                in_dependencies = False
+                continue
+            package.dependencies.extend(_TOML_INLINE_NAME.findall(line))
+            continue
+
+        field_match = _TOML_STRING_FIELD.match(line)
+        if field_match:
+            setattr(package, field_match.group(1), field_match.group(2))
+        elif line.startswith("source") and ("editable" in line or "virtual" in line):
+            is_member = True
+        elif line.startswith("dependencies"):
+            value = line.split("=", 1)[1]
+            package.dependencies.extend(_TOML_INLINE_NAME.findall(value))
+            in_dependencies = not value.rstrip().endswith("]")
+
+    if finished():
+        yield package
+
+
+_JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+def _skip_whitespace(text: str, position: int) -> int:
+    return _JSON_WHITESPACE.match(text, position).end()
+
+
+def _char_at(text: str, position: int) -> str:
+    if position >= len(text):
+        raise json.JSONDecodeError("Unexpected end of input", text, position)
+    return text[position]
+
+
+def _iter_json_object(text: str, position: int) -> Generator[Tuple[str, int], int, None]:
+    """Yield (key, value_start) for each member of the object starting at `position`.
+
+    The caller decodes (or skips) each value and sends back where it ended.
+    """
+    position = _skip_whitespace(text, position)
+    if _char_at(text, position) != "{":
+        raise ValueError(f"Expected an object at position {position}")
+    position = _skip_whitespace(text, position + 1)
+    if _char_at(text, position) == "}":
+        return
+    while True:
+        if _char_at(text, position) != '"':
+            raise ValueError(f"Expected a key at position {position}")
+        key, position = scanstring(text, position + 1)
+        position = _skip_whitespace(text, position)
+        if _char_at(text, position) != ":":
+            raise ValueError(f"Expected ':' at position {position}")
+        position = _skip_whitespace(text, position + 1)
+        position = yield key, position
+        position = _skip_whitespace(text, position)
+        if _char_at(text, position) == "}":
+            return
+        if _char_at(text, position) != ",":
+            raise ValueError(f"Expected ',' at position {position}")
+        position = _skip_whitespace(text, position + 1)
+
+
+def parse_package_lock(text: str) -> Iterator[LockedPackage]:
+    """
+    Stream the "packages" entries of a package-lock.json (lockfileVersion 2 and 3).
+
+    Only the top-level object is walked; each package entry is decoded on its
+    own with raw_decode and dropped once yielded. Workspace and linked entries
+    are skipped, nested node_modules entries yield an extra version.
+    """
+    decoder = json.JSONDecoder()
+    members = _iter_json_object(text, 0)
+    try:
+        key, position = next(members)
+        while True:
+            if key != "packages":
+                _, end = decoder.raw_decode(text, position)
+                key, position = members.send(end)
+                continue
+
+            entries = _iter_json_object(text, position)
+            try:
+                path, entry_position = next(entries)
+                while True:
+                    entry, end = decoder.raw_decode(text, entry_position)
+                    if "node_modules/" in path and not entry.get("link") and entry.get("version"):
+                        yield LockedPackage(
+                            name=entry.get("name") or path.rsplit("node_modules/", 1)[1],
+                            version=entry["version"],
+                            dependencies=list(entry.get("dependencies") or {})
+                            + list(entry.get("optionalDependencies") or {}),
+                            nested=path.count("node_modules/") > 1,
+                        )
+                    path, entry_position = entries.send(end)
+            except StopIteration:
+                pass
+            # The v2 "dependencies" section that follows duplicates "packages"
+            return
+    except StopIteration:
+        logger.warning("⚠️  package-lock.json has no \"packages\" section (lockfileVersion 1 is not supported)")
+
+
+_YAML_KEY = re.compile(r"^( *)(['\"]?)(.+?)\2:\s*(.*)$")
+
+
+def _split_pnpm_key(key: str) -> Optional[Tuple[str, str]]:
+    """Split a pnpm package key such as /@scope/name@1.2.3(peer@1) into name and version."""
+    key = key.lstrip("/").split("(", 1)[0]
+    at = key.rfind("@")
+    if at <= 0:
+        return None
+    return key[:at], key[at + 1:]
+
+
+def _pnpm_dependency_name(key: str, value: str) -> str:
+    """
+    Real name of a pnpm dependency entry.
+
+    Aliased dependencies are keyed by their alias and point to the real
+    package, as in `string-width-cjs: string-width@4.2.3`.
+    """
+    parts = _split_pnpm_key(value.strip("'\"").removeprefix("npm:"))
+    return parts[0] if parts else key
+
+
+def parse_pnpm_lock(lines: Iterable[str]) -> Iterator[LockedPackage]:
+    """
+    Stream the packages of a pnpm-lock.yaml (lockfile v6 and v9).
+
+    v6 keeps dependencies under `packages`, v9 under `snapshots` (its
+    `packages` entries repeat without dependencies); both are read line by
+    line using indentation only, without a YAML parser.
+    """
+    section = None
+    package: Optional[LockedPackage] = None
+    in_dependencies = False
+
+    for line in lines:
+        stripped = line.rstrip()
+        if not stripped or stripped.lstrip().startswith("#"):
+            continue
+        match = _YAML_KEY.match(stripped)
+        if not match:
+            continue
+        indent = len(match.group(1))
+        key = match.group(3)
+
+        if indent == 0:
+            if package:
+                yield package
+            package = None
+            section = key
+            continue
+        if section not in ("packages", "snapshots"):
+            continue
+
+        if indent == 2:
+            if package:
+                yield package
+            parts = _split_pnpm_key(key)
+            package = LockedPackage(*parts) if parts else None
+            in_dependencies = False
+        elif indent == 4 and package is not None:
+            in_dependencies = key in ("dependencies", "optionalDependencies")
+        elif indent == 6 and package is not None and in_dependencies:
+            package.dependencies.append(_pnpm_dependency_name(key, match.group(4)))
+
+    if package:
+        yield package
+
+
+_PNPM_DEPENDENCY_GROUPS = ("dependencies", "devDependencies", "optionalDependencies")
+
+
+def _pnpm_locked_version(value: str) -> Optional[str]:
+    """Version of a pnpm importer entry such as 18.2.0(react-dom@18.2.0), 1.0.0_peer@1 or alias@4.2.3."""
+    value = value.strip("'\"").split("(", 1)[0].split("_", 1)[0]
+    if not value or value.startswith(("link:", "file:")):
+        return None
+    return value[value.rfind("@") + 1:] if value.rfind("@") > 0 else value
+
+
+def parse_pnpm_root_versions(lines: Iterable[str]) -> Dict[str, str]:
+    """
+    Locked versions of the root project's direct dependencies in a pnpm-lock.yaml.
+
+    Reads the `.` importer (lockfile v6 and v9, `version:` below each
+    dependency), or the top-level dependency groups of lockfiles without
+    importers (v5, `name: version`).
+    """
+    versions: Dict[str, str] = {}
+    section = importer = group = name = None
+
+    for line in lines:
+        stripped = line.rstrip()
+        if not stripped or stripped.lstrip().startswith("#"):
+            continue
+        match = _YAML_KEY.match(stripped)
+        if not match:
+            continue
+        indent = len(match.group(1))
+        key, value = match.group(3), match.group(4)
+
+        if indent == 0:
+            section, importer = key, None
+            group = key if key in _PNPM_DEPENDENCY_GROUPS else None
+            continue
+        if section == "importers":
+            if indent == 2:
+                importer, group = key, None
+                continue
+            if importer != ".":
+                continue
+            if indent == 4:
+                group = key if key in _PNPM_DEPENDENCY_GROUPS else None
+                continue
+            indent -= 4
+        if group is None:
+            continue
+
+        if indent == 2:
+            name = key
+            version = _pnpm_locked_version(value) if value else None
+            if version:
+                versions[name] = version
+        elif indent == 4 and key == "version" and name:
+            version = _pnpm_locked_version(value)
+            if version:
+                versions[name] = version
+
+    return versions
+
+
+# Lockfile name -> streaming parser taking the lockfile content
+LOCKFILE_PARSERS: Dict[str, Callable[[str], Iterator[LockedPackage]]] = {
+    "poetry.lock": lambda content: parse_poetry_lock(io.StringIO(content)),
+    "uv.lock": lambda content: parse_uv_lock(io.StringIO(content)),
+    "package-lock.json": parse_package_lock,
+    "pnpm-lock.yaml": lambda content: parse_pnpm_lock(io.StringIO(content)),
+}
+
+
+def parse_lockfile(name: str, content: str) -> Iterator[LockedPackage]:
+    """Stream the locked packages of a lockfile; unsupported lockfiles yield nothing."""
+    parser = LOCKFILE_PARSERS.get(name)
+    if parser is None:
+        logger.info(f"⏭️  No parser for {name}")
+        return iter(())
+    return parser(content)
+
+
+def get_node_links_from_lockfile(
+    owner_node_id: str, language: str, locked_packages: Iterable[LockedPackage], direct_ids: Set[str]
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], Dict[str, str]]:
+    """
+    Turn locked packages into transitive dependency nodes and edges.
+
+    Direct dependencies already have a node from the manifest, so only their
+    resolved version is returned. Edges point from a locked package's
+    dependency to the package, like the manifest links.
+
+    Returns:
+        (nodes, links, resolved versions of the direct dependencies by node id)
+    """
+    nodes_by_id: Dict[str, Dict[str, Any]] = {}
+    links = []
+    resolved: Dict[str, str] = {}
+    locked_ids = set()
+    seen_links = set()
+
+    for package in locked_packages:
+        package_id = get_dependency_node_id(package.name, language)
+        locked_ids.add(package_id)
+        if package_id in direct_ids:
+            if not package.nested or package_id not in resolved:
+                resolved[package_id] = package.version
+        elif package_id in nodes_by_id:
+            # Several locked versions of one package share its node
+            versions = nodes_by_id[package_id]["version"]
+            version = {"repo_name": owner_node_id, "version": package.version}
+            if version not in versions:
+                versions.append(version)
+        else:
+            nodes_by_id[package_id] = {
+                "id": package_id,
+                "name": package.name,
+                "version": [{"repo_name": owner_node_id, "version": package.version}],
+                "owner": get_package_owner(package.name),
+                "type": "transitive-dependency",
+                "language": language,
+            }
+        for dependency in package.dependencies:
+            dependency_id = get_dependency_node_id(dependency, language)
+            if (dependency_id, package_id) in seen_links:
+                continue
+            seen_links.add((dependency_id, package_id))
+            links.append(
+                {
+                    "source": dependency_id,
+                    "target": package_id,
+                    "type": "transitive-dependency",
+                    "language": language,
+                }
+            )
+
+    # An edge to a package the lockfile does not pin would point at a missing node
+    links = [link for link in links if link["source"] in locked_ids]
+    return (list(nodes_by_id.values()), links, resolved)
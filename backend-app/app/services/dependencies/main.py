@@ -1,75 +1,208 @@
 import json
-import re
-from typing import Any, Dict, List
+from dataclasses import astuple
+from typing import Any, Dict, List, Optional, Tuple
 
-import requests
-
-from app.core.config import REPOSITORIES
+from app.core.config import REPOSITORIES, settings
 from app.core.logging import LoggerFactory
+from app.services.advisories import advisory_index
 from app.services.dependencies.validate import validate
+from app.utils.collection import map_concurrently, record_collection_error
 from app.utils.github import get_github_token
 
+from .discovery import (
+    RepoFile,
+    discover_repo_files,
+    fetch_parsed,
+    get_manifest_package_name,
+    parse_manifest,
+)
+from .identity import canonicalize_name
 from .js_package import get_node_links_from_js_repo
+from .lockfiles import (
+    LOCKFILE_PARSERS,
+    LockedPackage,
+    get_node_links_from_lockfile,
+    parse_lockfile,
+)
 from .python_module import get_node_links_from_python_repo
+from .requirements import parse_constraint
+from .skew import build_skew_matrix
+from .utils import get_node_name
 
 logger = LoggerFactory.get_logger(__name__)
 
 
-def get_repo_contents(repo: Dict[str, Any]) -> List[Dict[str, Any]]:
-    organization = re.sub("_", "", repo.get("owner"))
-    repo_name = repo.get("name")
-    
-    logger.info(f"📂 Fetching repository contents for {organization}/{repo_name}")
+def get_node_links_from_manifest(
+    repo: Dict[str, Any], language: str, manifest_data: Dict[str, Any]
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    if language == "python":
+        return get_node_links_from_python_repo(repo, manifest_data)
+    return get_node_links_from_js_repo(repo, manifest_data)
 
-    token = get_github_token()
-    headers = {
-        "Authorization": f"token {token}",
-        "Accept": "application/vnd.github.v3+json",
+
+def get_repo_node(repo: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "id": get_node_name(repo),
+        "name": get_node_name(repo),
+        "owner": repo.get("owner"),
+        "language": repo.get("language"),
+        "type": "dependency",
     }
 
-    url = f"https://api.github.com/repos/{organization}/{repo_name}/contents"
-    if repo.get("branch"):
-        url += f"?ref={repo.get('branch')}"
-        logger.info(f"🌿 Using branch: {repo.get('branch')}")
-    
-    logger.info(f"🌐 Making API request to: {url}")
-    repo_contents_response = requests.get(url, headers=headers)
-    
-    if repo_contents_response.status_code != 200:
-        logger.error(f"❌ Failed to fetch contents for {organization}/{repo_name}: {repo_contents_response.status_code}")
-        return []
-    
-    repo_contents = repo_contents_response.json()
-    logger.info(f"✅ Successfully fetched {len(repo_contents)} items from {organization}/{repo_name}")
 
-    return repo_contents
+def select_primary_manifest(repo: Dict[str, Any], manifests: List[Tuple[RepoFile, Dict[str, Any]]]) -> Optional[RepoFile]:
+    """
+    Pick the manifest that describes the repository itself.
+
+    That is the manifest of the repository's language named after its build
+    name (which may live in a subdirectory of a workspace), falling back to
+    the root manifest of that language.
+    """
+    candidates = [
+        (repo_file, manifest_data)
+        for repo_file, manifest_data in manifests
+        if repo_file.language == repo.get("language")
+    ]
+    build_name = canonicalize_name(get_node_name(repo), repo.get("language"))
+    for repo_file, manifest_data in candidates:
+        package_name = get_manifest_package_name(repo_file, manifest_data)
+        if package_name and canonicalize_name(package_name, repo_file.language) == build_name:
+            return repo_file
+    for repo_file, _ in candidates:
+        if repo_file.directory == "":
+            return repo_file
+    return None
+
+
+def parse_repo_file(repo_file: RepoFile) -> Any:
+    """Parse a manifest into its data, or a lockfile into [name, version, dependencies, nested] rows.
+
+    Both forms are JSON-serializable so they can be kept in the parsed blob cache.
+    """
+    if repo_file.name in LOCKFILE_PARSERS:
+        return [astuple(package) for package in parse_lockfile(repo_file.name, repo_file.content)]
+    return parse_manifest(repo_file)
+
 
+def get_node_links_from_repo_lockfile(
+    lockfile: RepoFile,
+    locked_rows: List[List[Any]],
+    owner_node_id: str,
+    nodes: List[Dict[str, Any]],
+    links: List[Dict[str, Any]],
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Add the resolved graph of a lockfile to the node owning its directory.
 
-def get_dep_data_from_repo(repo: Dict[str, Any]) -> Dict[str, Any]:
+    The manifest links of the owner identify its direct dependencies, whose
+    version entries always get the resolved version; every other locked
+    package becomes a transitive dependency node when
+    settings.DEPENDENCIES_INCLUDE_LOCKFILES is on.
+    """
+    direct_ids = {link["source"] for link in links if link["target"] == owner_node_id}
+    logger.info(f"🔒 Adding {lockfile.path} to {owner_node_id}")
+    (lock_nodes, lock_links, resolved) = get_node_links_from_lockfile(
+        owner_node_id, lockfile.language, (LockedPackage(*row) for row in locked_rows), direct_ids
+    )
+
+    for node in nodes:
+        if node["id"] in resolved:
+            for version in node.get("version") or []:
+                if isinstance(version, dict) and version.get("repo_name") == owner_node_id:
+                    version["resolved"] = resolved[node["id"]]
+
+    if not settings.DEPENDENCIES_INCLUDE_LOCKFILES:
+        logger.info(f"🔒 {lockfile.path}: {len(resolved)} resolved direct dependencies")
+        return ([], [])
+    logger.info(f"🔒 {lockfile.path}: {len(lock_nodes)} transitive packages, {len(resolved)} resolved direct dependencies")
+    return (lock_nodes, lock_links)
+
+
+def get_dep_data_from_repo(repo: Dict[str, Any], token: Optional[str] = None) -> Dict[str, Any]:
     repo_name = repo.get("name", "unknown")
     language = repo.get("language")
     
     logger.info(f"🔍 Processing dependencies for {repo_name} ({language})")
-    
-    repo_contents = get_repo_contents(repo)
-    if not repo_contents:
-        logger.error(f"❌ No repository contents available for {repo_name}")
+
+    repo_files = discover_repo_files(repo, token)
+    if repo_files is None:
+        logger.error(f"❌ No repository tree available for {repo_name}")
+        return (None, None)
+    if not repo_files.manifests:
+        logger.warning(f"⚠️  No manifests found in {repo_name}")
         return (None, None)
 
-    nodes = None
-    links = None
-    
-    if language == "python":
-        logger.info(f"🐍 Processing Python dependencies for {repo_name}")
-        (nodes, links) = get_node_links_from_python_repo(repo, repo_contents)
+    lockfiles = [repo_file for repo_file in repo_files.lockfiles if repo_file.name in LOCKFILE_PARSERS]
+    manifests = []
+    parsed_lockfiles = []
+    for repo_file, parsed in fetch_parsed(repo, repo_files.manifests + lockfiles, parse_repo_file, token):
+        if repo_file.name in LOCKFILE_PARSERS:
+            parsed_lockfiles.append((repo_file, parsed))
+        else:
+            manifests.append((repo_file, parsed))
 
-    elif language == "javascript":
-        logger.info(f"📦 Processing JavaScript dependencies for {repo_name}")
-        (nodes, links) = get_node_links_from_js_repo(repo, repo_contents)
-    
-    else:
-        logger.error(f"⚠️  Unsupported language: {language} for {repo_name}")
-        return (None, None)
+    primary = select_primary_manifest(repo, manifests)
+    repo_node_name = get_node_name(repo)
+    nodes = []
+    links = []
+    # (manifest directory, language) -> id of the node the manifest produced
+    owners: Dict[Tuple[str, str], str] = {}
+
+    for repo_file, manifest_data in manifests:
+        if repo_file is primary:
+            logger.info(f"{'🐍' if repo_file.language == 'python' else '📦'} Processing {repo_file.path} of {repo_name}")
+            (_nodes, _links) = get_node_links_from_manifest(repo, repo_file.language, manifest_data)
+            nodes.extend(_nodes)
+            links.extend(_links)
+            owners[(repo_file.directory, repo_file.language)] = repo_node_name
+            continue
+
+        # Nested workspace packages get their own node, linked to the repository node
+        package_name = get_manifest_package_name(repo_file, manifest_data)
+        if not package_name:
+            logger.info(f"⏭️  Skipping unnamed manifest {repo_file.path} in {repo_name}")
+            continue
+        package_node_id = f"{repo_node_name}/{repo_file.directory or repo_file.name}"
+        package = {
+            "name": package_node_id,
+            "build_name": package_node_id,
+            "owner": repo.get("owner"),
+            "language": repo_file.language,
+        }
+        try:
+            (_nodes, _links) = get_node_links_from_manifest(package, repo_file.language, manifest_data)
+        except Exception as e:
+            # One unreadable nested manifest must not drop the whole repository
+            record_collection_error(
+                f"dependencies:{repo_name}", f"⚠️  Skipping {repo_file.path} in {repo_name}: {e}"
+            )
+            continue
+        _nodes[0].update({"name": package_name, "repository": repo_name, "path": repo_file.path})
+        owners[(repo_file.directory, repo_file.language)] = package_node_id
+        nodes.extend(_nodes)
+        links.extend(_links)
+        links.append(
+            {
+                "source": package_node_id,
+                "target": repo_node_name,
+                "type": "workspace",
+                "language": repo_file.language,
+            }
+        )
+
+    if nodes and not any(node["id"] == repo_node_name for node in nodes):
+        nodes.insert(0, get_repo_node(repo))
+
+    for lockfile, locked_rows in parsed_lockfiles:
+        (_nodes, _links) = get_node_links_from_repo_lockfile(
+            lockfile,
+            locked_rows,
+            owners.get((lockfile.directory, lockfile.language), repo_node_name),
+            nodes,
+            links,
+        )
+        nodes.extend(_nodes)
+        links.extend(_links)
 
     if nodes and links:
         logger.info(f"✅ Successfully processed {repo_name}: {len(nodes)} nodes, {len(links)} links")
@@ -79,26 +212,79 @@ def get_dep_data_from_repo(repo: Dict[str, Any]) -> Dict[str, Any]:
     return (nodes, links)
 
 
-def get_dependency_data(repos: List[Dict[str, Any]]) -> Dict[str, Any]:
+def attach_advisories(nodes: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Mark the version entries of every node whose locked or pinned version has
+    known advisories, looked up in bulk in the offline advisory index.
+
+    Locked versions are the `resolved` versions read from the repository's
+    lockfiles, whatever settings.DEPENDENCIES_INCLUDE_LOCKFILES says; a
+    dependency of a repository without a lockfile is only matched when
+    its constraint is an exact pin.
+
+    Each affected entry gets `advisories` ([{id, fixed}]) and its node `vulnerable`.
+
+    Returns:
+        Details of every matched advisory by id
+    """
+    entries = []
+    for node in nodes:
+        for entry in node.get("version") or []:
+            if not isinstance(entry, dict):
+                continue
+            version = entry.get("resolved") or parse_constraint(str(entry.get("version", ""))).pinned
+            if version:
+                entries.append((node, entry, version))
+
+    details = {}
+    matches = advisory_index.match((node.get("language"), node["name"], version) for node, entry, version in entries)
+    for (node, entry, _), advisories in zip(entries, matches):
+        if not advisories:
+            continue
+        entry["advisories"] = [{"id": advisory["id"], "fixed": advisory["fixed"]} for advisory in advisories]
+        node["vulnerable"] = True
+        for advisory in advisories:
+            details.setdefault(advisory["id"], {key: advisory[key] for key in ("summary", "severity", "aliases")})
+    if details:
+        logger.info(f"🛡️  {len(details)} advisories affect {sum(1 for node in nodes if node.get('vulnerable'))} packages")
+    return details
+
+
+def get_dependency_data(repos: List[Dict[str, Any]], token: Optional[str] = None) -> Dict[str, Any]:
     logger.info(f"🚀 Starting dependency analysis for {len(repos)} repositories")
     
+    token = token or get_github_token()
+    
+    def process(repo: Dict[str, Any]):
+        repo_name = repo.get("name", "unknown")
+        try:
+            return get_dep_data_from_repo(repo, token)
+        except Exception as e:
+            record_collection_error(f"dependencies:{repo_name}", f"❌ Error processing dependencies for {repo_name}: {e}")
+            return (None, None)
+
+    # Every repository is independent, so they are fetched in one parallel wave
+    repo_results = map_concurrently(process, repos, settings.DEPENDENCIES_MAX_WORKERS)
+
     nodes = []
     links = []
     successful_repos = 0
     failed_repos = 0
-    
-    for i, repo in enumerate(repos, 1):
-        repo_name = repo.get("name", "unknown")
-        logger.info(f"[{i}/{len(repos)}] Processing {repo_name}")
-        
-        _nodes, _links = get_dep_data_from_repo(repo)
-        
+
+    # The same transitive edge shows up in the lockfile of every repository using the package
+    transitive_links = set()
+    for repo, (_nodes, _links) in zip(repos, repo_results):
         if _nodes and _links:
             nodes.extend(_nodes)
-            links.extend(_links)
+            for link in _links:
+                if link["type"] == "transitive-dependency":
+                    if (link["source"], link["target"]) in transitive_links:
+                        continue
+                    transitive_links.add((link["source"], link["target"]))
+                links.append(link)
             successful_repos += 1
         else:
-            logger.warning(f"⚠️  Failed to process dependencies for {repo_name}")
+            logger.warning(f"⚠️  Failed to process dependencies for {repo.get('name', 'unknown')}")
             failed_repos += 1
 
     logger.info(f"📊 Pre-validation: {len(nodes)} total nodes, {len(links)} total links")
@@ -110,7 +296,12 @@ def get_dependency_data(repos: List[Dict[str, Any]]) -> Dict[str, Any]:
     logger.info(f"📈 Summary: {successful_repos} successful, {failed_repos} failed repositories")
     logger.info(f"📊 Final result: {len(nodes)} nodes, {len(links)} links")
     
-    return {"nodes": nodes, "links": links}
+    return {
+        "nodes": nodes,
+        "links": links,
+        "skew": build_skew_matrix(nodes),
+        "advisories": attach_advisories(nodes),
+    }
 
 
 if __name__ == "__main__":
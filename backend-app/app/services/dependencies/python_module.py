@@ -1,10 +1,11 @@
-import re
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
-import requests
-import tomllib
+from app.core.logging import LoggerFactory
 
-from .utils import get_node_name, get_package_owner
+from .requirements import parse_requirement
+from .utils import get_dependency_node_id, get_node_name, get_package_owner
+
+logger = LoggerFactory.get_logger(__name__)
 
 
 def get_version_from_pyproject_toml(pyproject_toml_data: Dict[str, Any]) -> str:
@@ -17,14 +18,47 @@ def get_version_from_pyproject_toml(pyproject_toml_data: Dict[str, Any]) -> str:
     raise ValueError("Unsupported build system. Only Poetry, Hatch, and UV are supported.")
 
 
+def parse_py_requirements(requirements: List[str]) -> Tuple[Dict[str, str], Dict[str, Dict[str, Any]]]:
+    """Split PEP 508 requirement strings into name -> specifier and name -> extras/marker details."""
+    dependencies = {}
+    details = {}
+    for requirement_string in requirements:
+        requirement = parse_requirement(requirement_string)
+        if requirement is None:
+            logger.warning(f"⚠️  Could not parse requirement {requirement_string!r}")
+            continue
+        dependencies[requirement.name] = requirement.specifier or requirement.url or "No Valid Version"
+        extra = {}
+        if requirement.extras:
+            extra["extras"] = list(requirement.extras)
+        if requirement.marker:
+            extra["marker"] = requirement.marker
+        if extra:
+            details[requirement.name] = extra
+    return (dependencies, details)
+
+
 def get_node_links_from_py_deps(
-    input_dict: Dict[str, str], node_data: Dict, link_data: Dict, repo: Dict
+    input_dict: Dict[str, Any],
+    node_data: Dict,
+    link_data: Dict,
+    repo: Dict,
+    details: Optional[Dict[str, Dict[str, Any]]] = None,
 ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
     if input_dict is None or len(input_dict) == 0:
         return ([], [])
     repo_node_name = get_node_name(repo)
+    details = dict(details or {})
     nodes = []
     for name, version in input_dict.items():
+        if isinstance(version, dict) and isinstance(version.get("version"), str):
+            # Poetry table form: {version = "^1", extras = [...], markers = "..."}
+            details[name] = {
+                key: version[source]
+                for key, source in (("extras", "extras"), ("marker", "markers"))
+                if version.get(source)
+            }
+            version = version["version"]
         if not isinstance(version, str):
             version = "No Valid Version"
             print(
@@ -32,9 +66,9 @@ def get_node_links_from_py_deps(
             )
         nodes.append(
             {
-                "id": f"{name}-{repo.get('language')}",
+                "id": get_dependency_node_id(name, repo.get("language")),
                 "name": name,
-                "version": [{"repo_name": repo_node_name, "version": version}],
+                "version": [{"repo_name": repo_node_name, "version": version, **details.get(name, {})}],
                 "owner": get_package_owner(name),
                 **node_data,
             }
@@ -42,7 +76,7 @@ def get_node_links_from_py_deps(
 
     links = [
         {
-            "source": f"{name}-{repo.get('language')}",
+            "source": get_dependency_node_id(name, repo.get("language")),
             "target": repo_node_name,
             **link_data,
         }
@@ -55,18 +89,15 @@ def get_node_links_from_py_deps(
 def get_deps_from_poetry_pyproject_toml(
     pyproject_toml_data: Dict[str, Any], repo: Dict, repo_node: Dict, graph_kwargs: Dict
 ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    poetry = pyproject_toml_data.get("tool", {}).get("poetry", {})
     (dependencies_nodes, dependencies_links) = get_node_links_from_py_deps(
-        pyproject_toml_data.get("tool").get("poetry").get("dependencies"),
+        poetry.get("dependencies", {}),
         {"type": "dependency", **graph_kwargs},
         {"type": "dependency", **graph_kwargs},
         repo,
     )
     (dev_dependencies_nodes, dev_dependencies_links) = get_node_links_from_py_deps(
-        pyproject_toml_data.get("tool")
-        .get("poetry")
-        .get("group")
-        .get("dev")
-        .get("dependencies"),
+        poetry.get("group", {}).get("dev", {}).get("dependencies", {}),
         {"type": "dev-dependency", **graph_kwargs},
         {"type": "dev-dependency", **graph_kwargs},
         repo,
@@ -80,22 +111,18 @@ def get_deps_from_hatch_pyproject_toml(
     pyproject_toml_data: Dict[str, Any], repo: Dict, repo_node: Dict, graph_kwargs: Dict
 ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
     """Extract all dependencies from a hatch-style pyproject.toml file."""
-    dependencies = {}
 
     # Get main project dependencies
     nodes = [repo_node]
     links = []
     project_deps = pyproject_toml_data.get("project", {}).get("dependencies", [])
-    for dep in project_deps:
-        parts = re.split(r"(>=|<=|==|!=|~=|<|>)", dep)
-        package = parts[0].strip()
-        version = "".join(parts[1:]).strip() if len(parts) > 1 else ""
-        dependencies[package] = version if version else "No Valid Version"
+    (dependencies, details) = parse_py_requirements(project_deps)
     (dep_nodes, dep_links) = get_node_links_from_py_deps(
         dependencies,
         {"type": "dependency", **graph_kwargs},
         {"type": "dependency", **graph_kwargs},
         repo,
+        details,
     )
     nodes += dep_nodes
     links += dep_links
@@ -104,17 +131,13 @@ def get_deps_from_hatch_pyproject_toml(
     hatch_envs = pyproject_toml_data.get("tool", {}).get("hatch", {}).get("envs", {})
     for env_name, env_config in hatch_envs.items():
         env_deps = env_config.get("dependencies", [])
-        dependencies = {}
-        for dep in env_deps:
-            parts = re.split(r"(>=|<=|==|!=|~=|<|>)", dep)
-            package = parts[0].strip()
-            version = "".join(parts[1:]).strip() if len(parts) > 1 else ""
-            dependencies[package] = version if version else "No Valid Version"
+        (dependencies, details) = parse_py_requirements(env_deps)
         (dep_nodes, dep_links) = get_node_links_from_py_deps(
             dependencies,
             {"type": f"{env_name}_dependency", **graph_kwargs},
             {"type": f"{env_name}_dependency", **graph_kwargs},
             repo,
+            details,
         )
         nodes += dep_nodes
         links += dep_links
@@ -140,19 +163,15 @@ def get_deps_from_uv_pyproject_toml(
     links = []
     
     # Get main project dependencies
-    dependencies = {}
     project_deps = pyproject_toml_data.get("project", {}).get("dependencies", [])
-    for dep in project_deps:
-        parts = re.split(r"(>=|<=|==|!=|~=|<|>)", dep)
-        package = parts[0].strip()
-        version = "".join(parts[1:]).strip() if len(parts) > 1 else ""
-        dependencies[package] = version if version else "No Valid Version"
+    (dependencies, details) = parse_py_requirements(project_deps)
     
     (dep_nodes, dep_links) = get_node_links_from_py_deps(
         dependencies,
         {"type": "dependency", **graph_kwargs},
         {"type": "dependency", **graph_kwargs},
         repo,
+        details,
     )
     nodes += dep_nodes
     links += dep_links
@@ -160,18 +179,14 @@ def get_deps_from_uv_pyproject_toml(
     # Get optional dependencies
     optional_deps = pyproject_toml_data.get("project", {}).get("optional-dependencies", {})
     for group_name, group_deps in optional_deps.items():
-        dependencies = {}
-        for dep in group_deps:
-            parts = re.split(r"(>=|<=|==|!=|~=|<|>)", dep)
-            package = parts[0].strip()
-            version = "".join(parts[1:]).strip() if len(parts) > 1 else ""
-            dependencies[package] = version if version else "No Valid Version"
+        (dependencies, details) = parse_py_requirements(group_deps)
         
         (opt_dep_nodes, opt_dep_links) = get_node_links_from_py_deps(
             dependencies,
             {"type": f"{group_name}_dependency", **graph_kwargs},
             {"type": f"{group_name}_dependency", **graph_kwargs},
             repo,
+            details,
         )
         nodes += opt_dep_nodes
         links += opt_dep_links
@@ -216,7 +231,7 @@ def is_uv_pyproject(pyproject_toml_data: Dict[str, Any]) -> bool:
 
 
 def get_node_links_from_python_repo(
-    repo: Dict, repo_contents: List[Dict]
+    repo: Dict, pyproject_toml_data: Dict[str, Any]
 ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
     repo_node = {
         "id": get_node_name(repo),
@@ -226,13 +241,7 @@ def get_node_links_from_python_repo(
         "type": "dependency",
     }
     graph_kwargs = {"language": "python"}
-    pyproject_toml = [
-        item for item in repo_contents if item["name"] == "pyproject.toml"
-    ]
-    if len(pyproject_toml) > 0:
-        pyproject_toml_url = pyproject_toml[0].get("download_url")
-        pyproject_toml_response = requests.get(pyproject_toml_url)
-        pyproject_toml_data = tomllib.loads(pyproject_toml_response.text)
+    if pyproject_toml_data:
         repo_node["version"] = [get_version_from_pyproject_toml(pyproject_toml_data)]
         
         if is_poetry_pyproject(pyproject_toml_data):
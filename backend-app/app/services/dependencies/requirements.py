@@ -0,0 +1,317 @@
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+# A version as a sortable key: release numbers without trailing zeros, then
+# (0, dev, identifiers) for pre-releases so they sort before the final
+# release (1,), which sorts before post-releases (2, number)
+VersionKey = Tuple[Tuple[int, ...], Tuple]
+
+_VERSION = re.compile(r"^\s*[v=]?(\d+(?:\.\d+)*)([^+\s]*)", re.I)
+_PEP440_PRE = re.compile(r"^[-_.]?(a|b|c|rc|alpha|beta|pre|preview|dev)[-_.]?(\d*)", re.I)
+_PEP440_POST = re.compile(r"^[-_.]?(?:post|rev|r)[-_.]?(\d*)$", re.I)
+
+# PEP 440 spellings of a pre-release phase, as semver identifiers
+_PRE_ALIASES = {"a": "alpha", "b": "beta", "c": "rc", "pre": "rc", "preview": "rc"}
+
+
+def _identifier(part: str) -> Tuple:
+    # Semver: numeric identifiers compare numerically and before alphanumeric ones
+    if part.isdigit():
+        return (0, int(part))
+    part = part.lower()
+    return (1, _PRE_ALIASES.get(part, part))
+
+
+@lru_cache(maxsize=4096)
+def parse_version(version: str) -> Optional[VersionKey]:
+    """
+    Sortable key of a PEP 440 or semver version, or None if it is not a version.
+
+    `1.0.0-beta.10` > `1.0.0-beta.3` > `1.0b2` > `1.0.dev1`, pre-releases sort
+    before their final release and post-releases after it; build metadata
+    (`+abc`) and local versions are ignored.
+    """
+    match = _VERSION.match(version)
+    if not match:
+        return None
+    release = tuple(int(part) for part in match.group(1).split("."))
+    while len(release) > 1 and release[-1] == 0:
+        release = release[:-1]
+
+    suffix = match.group(2)
+    post = _PEP440_POST.match(suffix)
+    if not suffix:
+        pre: Tuple = (1,)
+    elif post:
+        pre = (2, int(post.group(1) or 0))
+    elif suffix.startswith("-"):
+        # Semver: every dot-separated identifier counts
+        identifiers = tuple(_identifier(part) for part in suffix[1:].split(".") if part)
+        pre = (0, 0 if identifiers[:1] == ((1, "dev"),) else 1, identifiers)
+    else:
+        phase = _PEP440_PRE.match(suffix)
+        if not phase:
+            return None
+        identifiers = (_identifier(phase.group(1)),) + ((_identifier(phase.group(2)),) if phase.group(2) else ())
+        pre = (0, 0 if phase.group(1).lower() == "dev" else 1, identifiers)
+    return (release, pre)
+
+
+def is_prerelease(key: VersionKey) -> bool:
+    return key[1][0] == 0
+
+
+def _release_key(release: Tuple[int, ...]) -> VersionKey:
+    while len(release) > 1 and release[-1] == 0:
+        release = release[:-1]
+    return (release, (1,))
+
+
+@dataclass(frozen=True)
+class Interval:
+    """A contiguous version range; a None bound is unbounded."""
+
+    lower: Optional[VersionKey] = None
+    lower_inclusive: bool = True
+    upper: Optional[VersionKey] = None
+    upper_inclusive: bool = False
+
+    def is_empty(self) -> bool:
+        if self.lower is None or self.upper is None:
+            return False
+        if self.lower == self.upper:
+            return not (self.lower_inclusive and self.upper_inclusive)
+        return self.lower > self.upper
+
+    def intersect(self, other: "Interval") -> "Interval":
+        lower, lower_inclusive = self.lower, self.lower_inclusive
+        if other.lower is not None and (
+            lower is None or other.lower > lower or (other.lower == lower and not other.lower_inclusive)
+        ):
+            lower, lower_inclusive = other.lower, other.lower_inclusive
+        upper, upper_inclusive = self.upper, self.upper_inclusive
+        if other.upper is not None and (
+            upper is None or other.upper < upper or (other.upper == upper and not other.upper_inclusive)
+        ):
+            upper, upper_inclusive = other.upper, other.upper_inclusive
+        return Interval(lower, lower_inclusive, upper, upper_inclusive)
+
+    def contains(self, version: VersionKey) -> bool:
+        if self.lower is not None and (version < self.lower or version == self.lower and not self.lower_inclusive):
+            return False
+        if self.upper is not None and (version > self.upper or version == self.upper and not self.upper_inclusive):
+            return False
+        return True
+
+
+ANY_VERSION = Interval()
+
+
+@dataclass(frozen=True)
+class Constraint:
+    """
+    A parsed version constraint: a union of intervals.
+
+    `intervals` is None when the constraint is not a version range (a git URL,
+    a path, a dist-tag, a workspace reference) and cannot be compared.
+    """
+
+    text: str
+    intervals: Optional[Tuple[Interval, ...]]
+    # The exact version for == pins, which is also the effective version
+    pinned: Optional[str] = None
+
+    @property
+    def minimum(self) -> Optional[VersionKey]:
+        if not self.intervals:
+            return None
+        lowers = [interval.lower for interval in self.intervals]
+        return None if None in lowers else min(lowers)
+
+    def allows(self, version: VersionKey) -> bool:
+        return bool(self.intervals) and any(interval.contains(version) for interval in self.intervals)
+
+
+def intersect_constraints(constraints: List[Constraint]) -> Optional[List[Interval]]:
+    """Intervals allowed by every comparable constraint; None if none of them is comparable."""
+    allowed: Optional[List[Interval]] = None
+    for constraint in constraints:
+        if constraint.intervals is None:
+            continue
+        if allowed is None:
+            allowed = list(constraint.intervals)
+            continue
+        allowed = [
+            intersection
+            for mine in allowed
+            for theirs in constraint.intervals
+            if not (intersection := mine.intersect(theirs)).is_empty()
+        ]
+    return allowed
+
+
+@dataclass(frozen=True)
+class Requirement:
+    """A PEP 508 requirement such as `algokit-utils[cli]>=3,<4; python_version >= "3.10"`."""
+
+    name: str
+    extras: Tuple[str, ...] = ()
+    specifier: str = ""
+    marker: Optional[str] = None
+    url: Optional[str] = None
+
+
+_REQUIREMENT = re.compile(
+    r"""^\s*
+    (?P<name>[A-Za-z0-9](?:[A-Za-z0-9._-]*[A-Za-z0-9])?)\s*
+    (?:\[(?P<extras>[^\]]*)\])?\s*
+    (?:@\s*(?P<url>[^\s;]+)\s*|\(?(?P<specifier>[^;()]*)\)?\s*)
+    (?:;\s*(?P<marker>.*?))?\s*$""",
+    re.X,
+)
+
+
+@lru_cache(maxsize=4096)
+def parse_requirement(requirement: str) -> Optional[Requirement]:
+    """Parse a PEP 508 requirement string, or None if it is not one."""
+    match = _REQUIREMENT.match(requirement)
+    if not match:
+        return None
+    extras = tuple(extra.strip() for extra in (match.group("extras") or "").split(",") if extra.strip())
+    return Requirement(
+        name=match.group("name"),
+        extras=extras,
+        specifier=re.sub(r"\s+", "", match.group("specifier") or ""),
+        marker=match.group("marker") or None,
+        url=match.group("url"),
+    )
+
+
+_COMPARATOR = re.compile(r"^(===|==|!=|~=|>=|<=|>|<|\^|~|=)?\s*v?(.+)$")
+_PARTIAL = re.compile(r"^(\d+|[xX*])(?:\.(\d+|[xX*]))?(?:\.(\d+|[xX*]))?(?:[-+.]?(.*))?$")
+
+
+def _bump(release: Tuple[int, ...], position: int) -> Tuple[int, ...]:
+    return release[:position] + (release[position] + 1,)
+
+
+def _caret_upper(release: Tuple[int, ...], given: int) -> Tuple[int, ...]:
+    # ^1.2.3 -> <2, ^0.2.3 -> <0.3, ^0.0.3 -> <0.0.4, ^0.0 -> <0.1
+    for position, part in enumerate(release[:given]):
+        if part != 0:
+            return _bump(release, position)
+    return _bump(release, max(given - 1, 0))
+
+
+def _comparator_interval(operator: str, version: str) -> Optional[Interval]:
+    """Interval of one comparator such as `>=1.2`, `^2`, `~=3.1`, `1.x` or `==1.4.*`."""
+    if version.endswith(".*"):
+        version = version[:-2] + ".x"
+    partial = _PARTIAL.match(version)
+    if not partial:
+        return None
+    parts = [part for part in partial.group(1, 2, 3) if part is not None]
+    given = next((i for i, part in enumerate(parts) if not part.isdigit()), len(parts))
+    if given == 0:
+        return ANY_VERSION if operator in ("", "=", "==", ">=", "^", "~") else None
+    release = tuple(int(part) for part in parts[:given])
+    # A partial version (1.2, 1.x, 1.*) means the whole 1.2 or 1 series
+    wildcard = given < len(parts) or (given < 3 and operator in ("", "=", "^", "~"))
+    floor = _release_key(release)
+    exact = parse_version(version) if partial.group(4) and not wildcard else floor
+    ceiling = _release_key(_bump(release, given - 1))
+
+    if operator in ("", "=", "==", "==="):
+        if wildcard:
+            return Interval(floor, True, ceiling, False)
+        return Interval(exact, True, exact, True)
+    if operator == "^":
+        return Interval(exact, True, _release_key(_caret_upper(release, given)), False)
+    if operator == "~":
+        return Interval(exact, True, _release_key(_bump(release, min(given, 2) - 1)), False)
+    if operator == "~=":
+        return Interval(exact, True, _release_key(_bump(release, max(given - 2, 0))), False)
+    if operator == ">=":
+        return Interval(exact, True, None)
+    if operator == ">":
+        if wildcard:
+            return Interval(ceiling, True, None)
+        return Interval(exact, False, None)
+    if operator == "<=":
+        if wildcard:
+            return Interval(None, True, ceiling, False)
+        return Interval(None, True, exact, True)
+    if operator == "<":
+        return Interval(None, True, exact, False)
+    # != excludes a single point, which does not change the range in practice
+    return ANY_VERSION
+
+
+def _comparator_set(text: str) -> Optional[Interval]:
+    """Intersection of the comparators of one range, separated by commas or spaces."""
+    # 1.2 - 2.3 hyphen ranges (npm)
+    hyphen = re.match(r"^\s*(\S+)\s+-\s+(\S+)\s*$", text)
+    if hyphen:
+        lower = _comparator_interval(">=", hyphen.group(1))
+        upper = _comparator_interval("<=", hyphen.group(2))
+        return lower.intersect(upper) if lower and upper else None
+
+    interval = ANY_VERSION
+    # Glue operators to their version so `>= 1.2` is one comparator
+    tokens = re.sub(r"(===|==|!=|~=|>=|<=|>|<|\^|~|=)\s+", r"\1", text.replace(",", " ")).split()
+    for token in tokens:
+        comparator = _COMPARATOR.match(token)
+        if not comparator:
+            return None
+        part = _comparator_interval(comparator.group(1) or "", comparator.group(2))
+        if part is None:
+            return None
+        interval = interval.intersect(part)
+    return interval
+
+
+@lru_cache(maxsize=8192)
+def parse_constraint(constraint: str) -> Constraint:
+    """
+    Parse a version constraint as written in a manifest.
+
+    Understands PEP 440 specifiers (`>=1.2,<2`, `~=3.1`, `==1.4.*`), Poetry
+    constraints (`^2`, `~1.2`, `*`) and npm ranges (`^1.2.3 || ~2.0`,
+    `1.x`, `1.2 - 2.3`). Anything else (URLs, paths, dist-tags, workspace
+    references) is kept as an uncomparable constraint.
+    """
+    text = constraint.strip()
+    if text in ("", "*", "latest", "x", "X"):
+        return Constraint(constraint, (ANY_VERSION,) if text != "latest" else None)
+    if ":" in text or "/" in text:
+        # workspace:*, npm:alias@1, file:, link:, git URLs
+        return Constraint(constraint, None)
+
+    intervals = []
+    for alternative in text.split("||"):
+        interval = _comparator_set(alternative)
+        if interval is None:
+            return Constraint(constraint, None)
+        if not interval.is_empty():
+            intervals.append(interval)
+
+    pinned = None
+    pin = re.match(r"^(?:===?|=)?\s*v?(\d+(?:\.\d+)*\S*)$", text)
+    if pin and "*" not in text and "x" not in text.lower() and len(intervals) == 1:
+        if intervals[0].lower == intervals[0].upper:
+            pinned = pin.group(1)
+    return Constraint(constraint, tuple(intervals), pinned)
+
+
+def format_version(key: VersionKey) -> str:
+    """Human readable form of a version key, padded to major.minor.patch."""
+    release, pre = key
+    release = release + (0,) * (3 - len(release))
+    text = ".".join(str(part) for part in release)
+    if pre[0] == 0:
+        return f"{text}-{'.'.join(str(value) for _, value in pre[2])}"
+    if pre[0] == 2:
+        return f"{text}.post{pre[1]}"
+    return text
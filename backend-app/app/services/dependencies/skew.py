@@ -0,0 +1,81 @@
+from typing import Any, Dict, List, Optional
+
+from app.core.logging import LoggerFactory
+
+from .requirements import Constraint, format_version, intersect_constraints, parse_constraint, parse_version
+
+logger = LoggerFactory.get_logger(__name__)
+
+
+def _effective_version(entry: Dict[str, Any], constraint: Constraint) -> Optional[str]:
+    """The version a repository actually gets: the locked one, else the pin, else the lowest allowed."""
+    if entry.get("resolved"):
+        return entry["resolved"]
+    if constraint.pinned:
+        return constraint.pinned
+    minimum = constraint.minimum
+    return format_version(minimum) if minimum else None
+
+
+def build_skew_matrix(nodes: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Package x repository matrix of declared constraints and effective versions.
+
+    Built in a single pass over the dependency nodes; constraint strings are
+    parsed through the cached parser, so a constraint shared by many
+    repositories is parsed once. A package is flagged `skewed` when the
+    repositories end up on different effective versions and `conflicting`
+    when no version satisfies every repository's constraint.
+
+    Returns:
+        {"repos": [...], "packages": [{id, name, language, owner, cells, ...}], "summary": {...}}
+    """
+    repos = set()
+    packages = []
+
+    for node in nodes:
+        entries = [entry for entry in node.get("version") or [] if isinstance(entry, dict)]
+        if not entries or node.get("type") == "transitive-dependency":
+            continue
+
+        cells = {}
+        constraints = []
+        effective = set()
+        for entry in entries:
+            repo_name = entry.get("repo_name")
+            constraint = parse_constraint(str(entry.get("version", "")))
+            version = _effective_version(entry, constraint)
+            cells.setdefault(repo_name, []).append({"constraint": constraint.text, "effective": version})
+            repos.add(repo_name)
+            constraints.append(constraint)
+            if version:
+                effective.add(version)
+
+        # Versions are compared by key so 2.0 and 2.0.0 are not reported as skew
+        effective_keys = {parse_version(version) or version for version in effective}
+        allowed = intersect_constraints(constraints)
+        packages.append(
+            {
+                "id": node["id"],
+                "name": node.get("name"),
+                "language": node.get("language"),
+                "owner": node.get("owner"),
+                "cells": cells,
+                "effective_versions": sorted(effective),
+                "skewed": len(effective_keys) > 1,
+                "conflicting": allowed is not None and not allowed,
+            }
+        )
+
+    packages.sort(key=lambda package: (not package["conflicting"], not package["skewed"], package["id"]))
+    summary = {
+        "packages": len(packages),
+        "shared": sum(1 for package in packages if len(package["cells"]) > 1),
+        "skewed": sum(1 for package in packages if package["skewed"]),
+        "conflicting": sum(1 for package in packages if package["conflicting"]),
+    }
+    logger.info(
+        f"📐 Version skew: {summary['skewed']} skewed and {summary['conflicting']} conflicting "
+        f"of {summary['packages']} packages"
+    )
+    return {"repos": sorted(repos), "packages": packages, "summary": summary}
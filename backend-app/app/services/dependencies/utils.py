@@ -1,17 +1,6 @@
-import re
 from typing import Dict
 
-from app.core.config import settings
-
-algo_fnd_repo_regex = "|".join(
-    [
-        r.get("build_name")
-        for r in settings.REPOSITORIES
-        if r.get("build_name") is not None
-    ]
-)
-makerx_repo_regex = "@makerx"
-algorand_tech_regex = "py-algorand-sdk"
+from .identity import canonicalize_name, package_owners
 
 
 def get_node_name(repo: Dict) -> str:
@@ -22,13 +11,10 @@ def get_node_name(repo: Dict) -> str:
     return repo.get("name")
 
 
+def get_dependency_node_id(package_name: str, language: str) -> str:
+    # Canonical names so `AlgoKit_Utils` and `algokit-utils` share a node
+    return f"{canonicalize_name(package_name, language)}-{language}"
+
+
 def get_package_owner(package_name: str) -> str:
-    owner = "other"
-    if re.search(algo_fnd_repo_regex, package_name) is not None:
-        owner = "algorandfoundation"
-    elif re.search(makerx_repo_regex, package_name) is not None:
-        owner = "makerx"
-    elif re.search(algorand_tech_regex, package_name) is not None:
-        owner = "algorandtechnologies"
-
-    return owner
+    return package_owners.owner_of(package_name)
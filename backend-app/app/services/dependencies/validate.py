@@ -1,42 +1,27 @@
+from app.core.logging import LoggerFactory
+
+from .graph import DependencyGraph
+
+logger = LoggerFactory.get_logger(__name__)
+
+
 def validate_unique_nodes(nodes):
-    unique_nodes = {}
-    for node in nodes:
-        node_id = node.get("id")
-        node_version = node.get("version")
-        if node_id in unique_nodes:
-            print(f"Duplicate node found: {node_id}")
-            current_versions = unique_nodes[node_id]["version"]
-            # Combine lists and use set comprehension to remove exact duplicates
-            unique_nodes[node_id]["version"] = list(
-                {
-                    (v["repo_name"], v["version"]): v
-                    for v in current_versions + node_version
-                }.values()
-            )
-        else:
-            unique_nodes[node_id] = node
-
-    return list(unique_nodes.values())
-
-
-def validate_links_contain_nodes(nodes, links):
-    node_names = list(set([node.get("id") for node in nodes]))
-    for link in links:
-        source = link.get("source")
-        target = link.get("target")
-        if source not in node_names:
-            print(f"WARN: Link source not found in nodes: {source}")
-        if target not in node_names:
-            print(f"WARN: Link target not found in nodes: {target}")
+    graph = DependencyGraph()
+    graph.add_nodes(nodes)
+    return graph.to_dict()["nodes"]
+
+
+def validate_links_contain_nodes(graph: DependencyGraph):
+    for link, endpoint in graph.dangling_links():
+        logger.warning(f"⚠️  Link {endpoint} not found in nodes: {link.get(endpoint)}")
 
 
 def validate(data):
-    nodes = data.get("nodes", [])
-    links = data.get("links", [])
-    nodes = validate_unique_nodes(nodes)
-    validate_links_contain_nodes(nodes, links)
+    graph = DependencyGraph.from_dict(data)
+    validate_links_contain_nodes(graph)
 
-    return nodes, links
+    data = graph.to_dict()
+    return data["nodes"], data["links"]
 
 
 if __name__ == "__main__":
@@ -6,7 +6,9 @@ import requests
 
 from app.core.config import settings
 from app.core.logging import LoggerFactory
+from app.utils.collection import record_collection_error
 from app.utils.github import get_github_token
+from app.utils.http_client import http_get
 
 logger = LoggerFactory.get_logger(__name__)
 
@@ -91,7 +93,7 @@ def read_google_sheets(sheet_url: str) -> List[List[str]]:
                 "Authorization": f"Bearer {get_github_token()}",
                 "Accept": "text/csv",
             }
-            response = requests.get(csv_url, headers=headers)
+            response = http_get(csv_url, headers=headers)
             response.raise_for_status()
 
             csv_content = StringIO(response.text)
@@ -113,7 +115,7 @@ def read_google_sheets(sheet_url: str) -> List[List[str]]:
             )
 
         except requests.RequestException as e:
-            logger.error(f"Error reading tab {tab_name}: {str(e)}")
+            record_collection_error(f"functional_specs:{tab_name}", f"Error reading tab {tab_name}: {str(e)}")
             continue
 
     return all_rows
@@ -1,11 +1,13 @@
 import time
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import requests
 
 from app.core.config import settings
 from app.core.logging import LoggerFactory
-from app.utils.github import get_github_token
+from app.utils.collection import record_collection_error
+from app.utils.github import get_github_token, github_graphql
+from app.utils.http_client import http_get
 
 logger = LoggerFactory.get_logger(__name__)
 
@@ -23,10 +25,18 @@ def get_repo_issues(repo_name: str, token: str) -> List[Dict[str, Any]]:
     page = 1
 
     while True:
-        response = requests.get(f"{url}&page={page}", headers=headers)
+        try:
+            response = http_get(f"{url}&page={page}", headers=headers)
+        except requests.RequestException as e:
+            record_collection_error(
+                f"issues:{repo_name}",
+                f"Error fetching issues for {settings.GITHUB_ORG}/{repo_name} page {page}: {e}",
+            )
+            break
         if response.status_code != 200:
-            logger.error(
-                f"Error fetching issues for {settings.GITHUB_ORG}/{repo_name}: {response.status_code}"
+            record_collection_error(
+                f"issues:{repo_name}",
+                f"Error fetching issues for {settings.GITHUB_ORG}/{repo_name} page {page}: {response.status_code}",
             )
             break
 
@@ -42,67 +52,181 @@ def get_repo_issues(repo_name: str, token: str) -> List[Dict[str, Any]]:
     return all_issues
 
 
-def get_pull_request_details(pull_request_url: str, token: str = None) -> Dict[str, Any]:
-    """Fetch detailed information about a pull request."""
-    headers = {
-        "Authorization": f"token {token}",
-        "Accept": "application/vnd.github.v3+json",
+# Aliased pullRequest lookups per GraphQL query; keeps each query well within
+# GitHub's node limits while covering a typical repo in a single request.
+PULL_REQUEST_BATCH_SIZE = 50
+
+# Reviews per page, GitHub's maximum for a connection
+REVIEWS_PAGE_SIZE = 100
+
+
+def _count_remaining_review_comments(repo_name: str, number: int, cursor: str, token: str) -> int:
+    """Review comments of a pull request's reviews after `cursor`, following every further page.
+
+    Raises:
+        RuntimeError, requests.RequestException: If a page cannot be fetched
+    """
+    query = (
+        "query($owner: String!, $name: String!, $number: Int!, $cursor: String) { "
+        "repository(owner: $owner, name: $name) { pullRequest(number: $number) { "
+        f"reviews(first: {REVIEWS_PAGE_SIZE}, after: $cursor) "
+        "{ pageInfo { hasNextPage endCursor } nodes { comments { totalCount } } } } } }"
+    )
+    total = 0
+    while cursor:
+        data = github_graphql(
+            query, {"owner": settings.GITHUB_ORG, "name": repo_name, "number": number, "cursor": cursor}, token
+        )
+        reviews = data["repository"]["pullRequest"]["reviews"]
+        total += sum(review["comments"]["totalCount"] for review in reviews["nodes"])
+        cursor = reviews["pageInfo"]["endCursor"] if reviews["pageInfo"]["hasNextPage"] else None
+    return total
+
+
+def get_pull_request_comment_counts(
+    repo_name: str, numbers: List[int], token: str
+) -> Dict[int, Dict[str, int]]:
+    """Fetch comment and review-comment counts for many pull requests at once.
+
+    Uses one aliased GraphQL query per batch of pull request numbers instead
+    of one REST request per pull request; the few pull requests with more
+    reviews than fit in one page get their remaining reviews paginated.
+
+    Returns:
+        Mapping of pull request number to its `comments` (conversation
+        comments) and `review_comments` (diff comments) counts. Pull requests
+        that could not be looked up are missing from the mapping.
+    """
+    counts: Dict[int, Dict[str, int]] = {}
+    numbers = sorted(set(numbers))
+
+    for start in range(0, len(numbers), PULL_REQUEST_BATCH_SIZE):
+        batch = numbers[start : start + PULL_REQUEST_BATCH_SIZE]
+        fields = "\n".join(
+            f"pr{number}: pullRequest(number: {number}) {{ number comments {{ totalCount }} "
+            f"reviews(first: {REVIEWS_PAGE_SIZE}) {{ pageInfo {{ hasNextPage endCursor }} "
+            "nodes { comments { totalCount } } } }"
+            for number in batch
+        )
+        query = (
+            "query($owner: String!, $name: String!) { "
+            f"repository(owner: $owner, name: $name) {{ {fields} }} }}"
+        )
+        try:
+            data = github_graphql(
+                query, {"owner": settings.GITHUB_ORG, "name": repo_name}, token
+            )
+        except (RuntimeError, requests.RequestException) as e:
+            record_collection_error(
+                f"issues:{repo_name}",
+                f"Error fetching pull request details for {settings.GITHUB_ORG}/{repo_name}: {e}",
+            )
+            continue
+
+        for pull_request in (data.get("repository") or {}).values():
+            if not pull_request:
+                continue
+            reviews = pull_request["reviews"]
+            review_comments = sum(review["comments"]["totalCount"] for review in reviews["nodes"])
+            if reviews["pageInfo"]["hasNextPage"]:
+                try:
+                    review_comments += _count_remaining_review_comments(
+                        repo_name, pull_request["number"], reviews["pageInfo"]["endCursor"], token
+                    )
+                except (RuntimeError, requests.RequestException, KeyError, TypeError) as e:
+                    # A partial count would undercount; leave the pull request out instead
+                    record_collection_error(
+                        f"issues:{repo_name}",
+                        f"Error fetching reviews of {settings.GITHUB_ORG}/{repo_name}#{pull_request['number']}: {e}",
+                    )
+                    continue
+            counts[pull_request["number"]] = {
+                "comments": pull_request["comments"]["totalCount"],
+                "review_comments": review_comments,
+            }
+
+    return counts
+
+
+def format_issue_data(
+    issue: Dict[str, Any], repo_name: str, pull_request_details: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Format a GitHub issue (or pull request listed as an issue) for the issues dataset.
+
+    Args:
+        issue: Issue object as returned by the GitHub REST API or webhooks
+        repo_name: The repository name
+        pull_request_details: `comments` and `review_comments` counts when the
+            issue is a pull request
+    """
+    is_pull_request = "pull_request" in issue
+    return {
+        "repository": f"{settings.GITHUB_ORG}/{repo_name}",
+        "title": issue["title"],
+        "number": issue["number"],
+        "state": issue["state"],
+        "createdAt": issue["created_at"],
+        "updatedAt": issue["updated_at"],
+        "htmlUrl": issue["html_url"],
+        "labels": [label["name"] for label in issue["labels"]],
+        "assignees": [assignee["login"] for assignee in issue["assignees"]],
+        "commentsCount": issue["comments"],
+        "isPullRequest": is_pull_request,
+        "author": issue["user"]["login"],
+        "closedAt": issue.get("closed_at"),
+        "pullRequest": {
+            "url": issue["pull_request"]["url"],
+            "comments": pull_request_details.get("comments"),
+            "reviewComments": pull_request_details.get("review_comments"),
+        }
+        if is_pull_request
+        else None,
     }
-    response = requests.get(pull_request_url, headers=headers)
-    if response.status_code != 200:
-        logger.error(f"Error fetching pull request details: {response.status_code}")
-        return {}
-    return response.json()
 
 
-def get_github_issues() -> List[Dict[str, Any]]:
+def get_github_issues(
+    token: Optional[str] = None,
+    open_pull_requests: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+) -> List[Dict[str, Any]]:
     """
     Cloud Function entry point - triggered by Cloud Scheduler.
     Fetches all issues and saves them to Cloud Storage.
+
+    Args:
+        token: GitHub access token, resolved from settings if not given
+        open_pull_requests: Open pull requests already fetched for this run,
+            keyed by repository name. Issues that are pull requests missing
+            from it (closed since that sweep) skip the comment count lookup.
     """
     try:
         # Collect issues from all repositories
-        token = get_github_token()
+        token = token or get_github_token()
         all_issues = []
         for repo in settings.REPOSITORIES:
             repo_name = repo["name"]
             logger.info(f"Fetching issues for {settings.GITHUB_ORG}/{repo_name}")
             issues = get_repo_issues(repo_name, token)
+            open_pr_numbers = (
+                {pr["number"] for pr in open_pull_requests.get(repo_name, [])}
+                if open_pull_requests is not None
+                else None
+            )
+            pull_request_numbers = [
+                issue["number"]
+                for issue in issues
+                if "pull_request" in issue
+                and (open_pr_numbers is None or issue["number"] in open_pr_numbers)
+            ]
+            pull_request_counts = (
+                get_pull_request_comment_counts(repo_name, pull_request_numbers, token)
+                if pull_request_numbers
+                else {}
+            )
             for issue in issues:
-                is_pull_request = "pull_request" in issue
-                pull_request_details = {}
-                if is_pull_request:
-                    pull_request_details = get_pull_request_details(
-                        issue["pull_request"]["url"], token
-                    )
-
                 all_issues.append(
-                    {
-                        "repository": f"{settings.GITHUB_ORG}/{repo_name}",
-                        "title": issue["title"],
-                        "number": issue["number"],
-                        "state": issue["state"],
-                        "createdAt": issue["created_at"],
-                        "updatedAt": issue["updated_at"],
-                        "htmlUrl": issue["html_url"],
-                        "labels": [label["name"] for label in issue["labels"]],
-                        "assignees": [
-                            assignee["login"] for assignee in issue["assignees"]
-                        ],
-                        "commentsCount": issue["comments"],
-                        "isPullRequest": is_pull_request,
-                        "author": issue["user"]["login"],
-                        "closedAt": issue.get("closed_at"),
-                        "pullRequest": {
-                            "url": pull_request_details.get("url"),
-                            "comments": pull_request_details.get("comments"),
-                            "reviewComments": pull_request_details.get(
-                                "review_comments"
-                            ),
-                        }
-                        if is_pull_request
-                        else None,
-                    }
+                    format_issue_data(
+                        issue, repo_name, pull_request_counts.get(issue["number"], {})
+                    )
                 )
 
         return all_issues
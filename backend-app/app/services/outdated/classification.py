@@ -0,0 +1,50 @@
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional
+
+from app.services.dependencies.requirements import VersionKey, parse_constraint, parse_version
+
+# Kinds of update, from most to least disruptive
+UPDATE_TYPES = ("major", "minor", "patch", "prerelease")
+
+
+@lru_cache(maxsize=4096)
+def parse_version_or_range(text: str) -> Optional[VersionKey]:
+    """Version key of a version, or of the lowest version a range such as `^1.2.3` allows."""
+    key = parse_version(text)
+    if key is not None:
+        return key
+    return parse_constraint(text).minimum
+
+
+@lru_cache(maxsize=8192)
+def classify_update(current: str, latest: str) -> Optional[str]:
+    """
+    Kind of update from `current` to `latest`.
+
+    Returns:
+        "major", "minor" or "patch" for the first release number that increases,
+        "prerelease" when only the pre/post-release part does, or None if
+        `latest` is not newer or either is not a version
+    """
+    current_key = parse_version_or_range(current)
+    latest_key = parse_version_or_range(latest)
+    if current_key is None or latest_key is None or latest_key <= current_key:
+        return None
+
+    current_release = current_key[0] + (0,) * (3 - len(current_key[0]))
+    latest_release = latest_key[0] + (0,) * (3 - len(latest_key[0]))
+    for update_type, current_part, latest_part in zip(("major", "minor", "patch"), current_release, latest_release):
+        if current_part != latest_part:
+            return update_type
+    # Equal up to patch; 1.2.3.4 -> 1.2.3.5 is still a patch
+    return "patch" if current_release != latest_release else "prerelease"
+
+
+def classify_outdated(records: Iterable[Dict[str, Any]]) -> List[Optional[str]]:
+    """classify_update for each {current, latest} record, parsing every distinct version once."""
+    return [
+        classify_update(str(record["current"]), str(record["latest"]))
+        if record.get("current") and record.get("latest")
+        else None
+        for record in records
+    ]
@@ -2,55 +2,34 @@ import json
 import os
 import subprocess
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
+from app.core.config import settings
 from app.core.logging import LoggerFactory
+from app.services.advisories import advisory_index
+from app.services.dependencies.discovery import LOCKFILE_LANGUAGES, MANIFEST_LANGUAGES
+from app.services.dependencies.lockfiles import parse_pnpm_root_versions
+from app.services.outdated.classification import classify_outdated
+from app.services.outdated.environments import (
+    detect_package_manager,
+    environment_cache,
+    node_modules_cache,
+    pnpm_command,
+)
+from app.services.outdated.incremental import check_repo_incrementally, outdated_state
+from app.services.outdated.registry import check_registry_outdated, get_current_version, get_declared_dependencies
+from app.utils.collection import map_concurrently, record_collection_error
+from app.utils.commands import command_deadline, run_command
+from app.utils.repositories import repository_manager, repository_url
 
 logger = LoggerFactory.get_logger(__name__)
 
+# Installed into every environment rather than declared by the repository
+ENVIRONMENT_TOOLING = {"pip", "setuptools", "wheel"}
 
-def get_or_clone_repo(repo_url: str, repo_name: str) -> Optional[str]:
-    """Get repository from .algokit_repos folder, clone or update as needed."""
-    repos_dir = Path(".algokit_repos")
-    repos_dir.mkdir(exist_ok=True)
-    
-    repo_path = repos_dir / repo_name
-    
-    try:
-        if repo_path.exists():
-            logger.info(f"🔄 Updating existing repository: {repo_name}")
-            
-            # Determine main branch (main vs master)
-            try:
-                result = subprocess.run(
-                    ["git", "symbolic-ref", "refs/remotes/origin/HEAD"],
-                    cwd=repo_path,
-                    capture_output=True, text=True, check=False
-                )
-                main_branch = result.stdout.strip().split('/')[-1] if result.returncode == 0 else "main"
-            except:
-                main_branch = "main"
-            
-            logger.info(f"🌿 Checking out {main_branch} branch and pulling latest changes")
-            # Checkout main branch and hard pull
-            subprocess.run(["git", "checkout", main_branch], cwd=repo_path, check=True, capture_output=True)
-            subprocess.run(["git", "fetch", "origin"], cwd=repo_path, check=True, capture_output=True)
-            subprocess.run(["git", "reset", "--hard", f"origin/{main_branch}"], cwd=repo_path, check=True, capture_output=True)
-            
-        else:
-            logger.info(f"📥 Cloning fresh repository: {repo_name}")
-            subprocess.run(
-                ["git", "clone", repo_url, str(repo_path)],
-                check=True,
-                capture_output=True,
-            )
-        
-        logger.info(f"✅ Repository {repo_name} ready at: {repo_path}")
-        return str(repo_path)
-        
-    except subprocess.CalledProcessError as e:
-        logger.error(f"❌ Error with repository {repo_name}: {e}")
-        return None
+# npm only needs the manifests, lockfiles and workspace configuration; installing
+# a Python project builds it, which needs its sources, so Python gets a full worktree
+JAVASCRIPT_SPARSE_PATHS = sorted(MANIFEST_LANGUAGES) + sorted(LOCKFILE_LANGUAGES) + ["pnpm-workspace.yaml", ".npmrc"]
 
 
 def format_python_outdated_results(pip_output: List[Dict]) -> List[Dict]:
@@ -79,28 +58,24 @@ def format_python_outdated_results(pip_output: List[Dict]) -> List[Dict]:
 
 
 def check_python_outdated(repo_path: str) -> List[Dict]:
-    """Check outdated Python dependencies using pip."""
+    """Check outdated Python dependencies using pip, inside the repository's own environment."""
     try:
         logger.info(f"🐍 Checking Python dependencies in {repo_path}")
-        requirements_file = os.path.join(repo_path, "requirements.txt")
-        if os.path.exists(requirements_file):
-            logger.info(f"📦 Installing requirements from {requirements_file}")
-            subprocess.run(
-                ["pip", "install", "-r", requirements_file],
+        with environment_cache.python(Path(repo_path).name, repo_path) as python:
+            if python is None:
+                logger.info("📦 No requirements.txt, lockfile or pyproject.toml found, nothing to check")
+                return []
+
+            logger.info("🔍 Running pip list --outdated to check for updates")
+            result = run_command(
+                [str(python), "-m", "pip", "list", "--outdated", "--format=json", "--disable-pip-version-check"],
                 check=True,
                 capture_output=True,
+                text=True,
             )
-        else:
-            logger.info("📦 No requirements.txt found, checking installed packages")
-
-        logger.info("🔍 Running pip list --outdated to check for updates")
-        result = subprocess.run(
-            ["pip", "list", "--outdated", "--format=json"],
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-        raw_results = json.loads(result.stdout)
+        raw_results = [
+            package for package in json.loads(result.stdout) if package["name"].lower() not in ENVIRONMENT_TOOLING
+        ]
         formatted_results = format_python_outdated_results(raw_results)
         logger.info(f"✅ Found {len(formatted_results)} outdated Python packages")
         return formatted_results
@@ -109,12 +84,14 @@ def check_python_outdated(repo_path: str) -> List[Dict]:
         return []
 
 
-def format_npm_outdated_results(npm_output: Dict) -> List[Dict]:
+def format_npm_outdated_results(npm_output: Dict, locked_versions: Optional[Dict[str, str]] = None) -> List[Dict]:
     """
-    Transform npm outdated JSON output into a simplified list of dependency information.
+    Transform npm (or pnpm) outdated JSON output into a simplified list of dependency information.
 
     Args:
         npm_output: Dictionary containing npm outdated command output
+        locked_versions: Versions from the lockfile when nothing is installed, used as `current`
+            (falling back to `wanted`, which is the locked version for pnpm); None when installed
 
     Returns:
         List of dictionaries containing name, current, wanted, and latest versions
@@ -122,51 +99,243 @@ def format_npm_outdated_results(npm_output: Dict) -> List[Dict]:
     formatted_results = []
 
     for package_name, package_info in npm_output.items():
-        formatted_results.append(
-            {
-                "name": package_name,
-                "current": package_info["current"],
-                "wanted": package_info["wanted"],
-                "latest": package_info["latest"],
-            }
-        )
+        # Workspaces report a dependency once per workspace declaring it
+        for info in package_info if isinstance(package_info, list) else [package_info]:
+            current = info.get("current")
+            if not current and locked_versions is not None:
+                current = locked_versions.get(package_name) or info.get("wanted")
+            # Without node_modules npm lists every dependency as missing, up to date or not
+            if not current or (current == info.get("wanted") and current == info.get("latest")):
+                continue
+            formatted_results.append(
+                {
+                    "name": package_name,
+                    "current": current,
+                    "wanted": info["wanted"],
+                    "latest": info["latest"],
+                }
+            )
+            break
 
     return formatted_results
 
 
-def check_javascript_outdated(repo_path: str) -> Dict:
-    """Check outdated JavaScript dependencies using npm."""
+def get_locked_npm_versions(repo_path: str) -> Dict[str, str]:
+    """Versions of the root project's direct dependencies recorded in package-lock.json."""
+    try:
+        with open(os.path.join(repo_path, "package-lock.json"), encoding="utf-8") as f:
+            lock = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    # lockfileVersion 2 and 3 list installed paths, version 1 a dependency tree
+    packages = lock.get("packages")
+    if packages is not None:
+        prefix = "node_modules/"
+        return {
+            path[len(prefix):]: info["version"]
+            for path, info in packages.items()
+            if path.startswith(prefix) and "/node_modules/" not in path and "version" in info
+        }
+    return {name: info["version"] for name, info in (lock.get("dependencies") or {}).items() if "version" in info}
+
+
+def get_locked_pnpm_versions(repo_path: str) -> Dict[str, str]:
+    """Versions of the root project's direct dependencies recorded in pnpm-lock.yaml."""
+    try:
+        with open(os.path.join(repo_path, "pnpm-lock.yaml"), encoding="utf-8") as f:
+            return parse_pnpm_root_versions(f)
+    except (OSError, UnicodeDecodeError):
+        return {}
+
+
+def _run_outdated(command: List[str], cwd: str) -> Dict:
+    # Exits non-zero when anything is outdated
+    result = run_command(command, capture_output=True, text=True, cwd=cwd)
+    return json.loads(result.stdout) if result.stdout.strip() else {}
+
+
+def check_javascript_outdated(repo_path: str) -> List[Dict]:
+    """
+    Check outdated JavaScript dependencies with the repository's package manager.
+
+    In "lockfile" mode (settings.OUTDATED_NPM_MODE) nothing is installed:
+    pnpm and npm are compared against the root project's locked versions in
+    pnpm-lock.yaml or package-lock.json, the latter created with
+    --package-lock-only when the repository has none. In "install" mode
+    the dependencies are installed (without scripts) into a node_modules
+    tree cached per lockfile hash.
+    """
     try:
         logger.info(f"📦 Checking JavaScript dependencies in {repo_path}")
-        package_json_path = os.path.join(repo_path, "package.json")
-        if os.path.exists(package_json_path):
-            logger.info(f"📦 Installing npm packages from {package_json_path}")
-            subprocess.run(
-                ["npm", "install", "--yes"], capture_output=True, cwd=repo_path
-            )
-        else:
+        if not os.path.exists(os.path.join(repo_path, "package.json")):
             logger.info("📦 No package.json found in repository")
+            return []
 
-        logger.info("🔍 Running npm outdated to check for updates")
-        result = subprocess.run(
-            ["npm", "outdated", "--json"],
-            capture_output=True,
-            text=True,
-            cwd=repo_path,
+        manager = detect_package_manager(repo_path)
+        outdated_command = (
+            [*pnpm_command(), "outdated", "--format", "json"] if manager == "pnpm" else ["npm", "outdated", "--json"]
         )
-        raw_results = json.loads(result.stdout) if result.stdout else {}
-        formatted_results = format_npm_outdated_results(raw_results)
+
+        if settings.OUTDATED_NPM_MODE == "install":
+            with node_modules_cache.project(Path(repo_path).name, repo_path) as project:
+                logger.info(f"🔍 Running {manager} outdated against installed node_modules")
+                raw_results = _run_outdated(outdated_command, str(project))
+            locked_versions = None
+        else:
+            if manager == "npm" and not os.path.exists(os.path.join(repo_path, "package-lock.json")):
+                logger.info("🔒 No package-lock.json, resolving one without installing")
+                run_command(
+                    ["npm", "install", "--package-lock-only", "--ignore-scripts", "--no-audit", "--no-fund"],
+                    check=True,
+                    capture_output=True,
+                    cwd=repo_path,
+                )
+            logger.info(f"🔍 Running {manager} outdated against the lockfile")
+            raw_results = _run_outdated(outdated_command, repo_path)
+            locked_versions = (
+                get_locked_npm_versions(repo_path) if manager == "npm" else get_locked_pnpm_versions(repo_path)
+            )
+
+        formatted_results = format_npm_outdated_results(raw_results, locked_versions)
         logger.info(f"✅ Found {len(formatted_results)} outdated JavaScript packages")
         return formatted_results
     except subprocess.CalledProcessError as e:
         logger.error(f"Error checking JavaScript dependencies: {e}")
         return []
+    except ValueError as e:
+        logger.error(f"Error reading outdated output: {e}")
+        return []
+
 
+def check_repo_outdated(repo: Dict, position: int, total: int) -> Tuple[Dict, bool]:
+    """
+    Check outdated dependencies of one repository within settings.OUTDATED_REPO_TIMEOUT_SECONDS.
+
+    Returns:
+        The repository result and whether the check succeeded
+    """
+    logger.info(f"[{position}/{total}] 🔍 Checking outdated dependencies for {repo['name']} ({repo['language']})")
+    repo_result = {
+        "name": repo["name"],
+        "url": repository_url(repo),
+        "language": repo["language"],
+        "build_name": repo["build_name"],
+        "outdated_dependencies": None,
+        "error": None,
+    }
+    repo_url = repository_url(repo)
+    language = repo["language"].lower()
+
+    try:
+        if settings.OUTDATED_MODE == "registry":
+            repo_result["outdated_dependencies"] = check_registry_outdated(repo)
+        elif language not in ("python", "javascript"):
+            logger.error(f"❌ Unsupported language: {repo['language']} for {repo['name']}")
+            repo_result["error"] = f"Unsupported language: {repo['language']}"
+            return (repo_result, False)
+        else:
+            logger.info(f"📂 Getting repository: {repo_url}")
+            sparse_paths = JAVASCRIPT_SPARSE_PATHS if language == "javascript" else None
+            with repository_manager.checkout(
+                repo_url, repo["name"], branch=repo.get("branch"), sparse_paths=sparse_paths
+            ) as cloned_path:
+                if not cloned_path:
+                    logger.error(f"❌ Failed to get repository {repo['name']}")
+                    repo_result["error"] = "Failed to clone repository"
+                    return (repo_result, False)
+
+                logger.info(f"✅ Repository ready at: {cloned_path}")
+
+                if language == "python":
+                    repo_result["outdated_dependencies"] = check_python_outdated(cloned_path)
+                else:
+                    repo_result["outdated_dependencies"] = check_javascript_outdated(cloned_path)
+    except subprocess.TimeoutExpired:
+        logger.error(f"⏱️  Timed out checking {repo['name']} after {settings.OUTDATED_REPO_TIMEOUT_SECONDS}s")
+        repo_result["error"] = f"Timed out after {settings.OUTDATED_REPO_TIMEOUT_SECONDS}s"
+        return (repo_result, False)
+    except Exception as e:
+        # One broken repository must not fail the whole run
+        logger.exception(f"❌ Error checking outdated dependencies for {repo['name']}: {e}")
+        repo_result["error"] = str(e)
+        return (repo_result, False)
+
+    if repo_result["outdated_dependencies"] is not None:
+        outdated_count = len(repo_result["outdated_dependencies"])
+        if outdated_count > 0:
+            logger.info(f"📊 {repo['name']}: {outdated_count} outdated dependencies found")
+        else:
+            logger.info(f"✨ {repo['name']}: All dependencies are up to date!")
+        return (repo_result, True)
+
+    logger.error(f"❌ Failed to check dependencies for {repo['name']}")
+    return (repo_result, False)
+
+
+def _declared_for_advisories(repo: Dict) -> Optional[List[Dict]]:
+    try:
+        return get_declared_dependencies(repo)
+    except Exception as e:
+        record_collection_error(
+            f"outdated:{repo['name']}", f"⚠️  Could not read dependencies of {repo['name']} for advisories: {e}"
+        )
+        return None
+
+
+def attach_advisories(repositories: List[Dict], results: List[Dict]) -> None:
+    """
+    Security status of every dependency, from the offline advisory index in one pass.
 
-def check_outdated_dependencies(repositories: List[Dict]) -> Dict:
+    Each outdated record gets the `advisories` affecting its current version,
+    and each repository result gets `vulnerable_dependencies`: every declared
+    dependency, outdated or not, whose locked or pinned version is affected
+    (None when its manifests could not be read).
+    """
+    # Declarations come from the blob-cached manifests; without an index there is nothing to match them to
+    if advisory_index.age() is not None:
+        declared_by_repo = map_concurrently(_declared_for_advisories, repositories, settings.OUTDATED_MAX_WORKERS)
+    else:
+        declared_by_repo = [None] * len(results)
+
+    queries = []
+    candidates_by_repo = []
+    for repo_result, declared in zip(results, declared_by_repo):
+        language = repo_result["language"].lower()
+        for dependency in repo_result.get("outdated_dependencies") or []:
+            if dependency.get("current"):
+                queries.append((dependency, language, dependency["name"], str(dependency["current"])))
+        candidates = []
+        for package in declared or []:
+            version = get_current_version(package)
+            if version:
+                candidate = {"name": package["name"], "current": version}
+                queries.append((candidate, package["language"], package["name"], version))
+                candidates.append(candidate)
+        candidates_by_repo.append(candidates if declared is not None else None)
+
+    matches = advisory_index.match((language, name, version) for _, language, name, version in queries)
+    for (record, _, _, _), advisories in zip(queries, matches):
+        record["advisories"] = advisories
+    for repo_result, candidates in zip(results, candidates_by_repo):
+        repo_result["vulnerable_dependencies"] = (
+            [candidate for candidate in candidates if candidate["advisories"]] if candidates is not None else None
+        )
+
+
+def check_outdated_dependencies(repositories: List[Dict], incremental: Optional[bool] = None) -> Dict:
     """
     Check outdated dependencies for multiple repositories.
 
+    In "registry" mode (settings.OUTDATED_MODE) manifests and lockfiles are
+    read through the GitHub API and compared against PyPI and npm registry
+    metadata; in "install" mode each repository is cloned and checked with
+    pip and npm.
+
+    When incremental (default: settings.OUTDATED_INCREMENTAL), a repository
+    whose manifests and lockfiles are unchanged and whose dependencies have
+    no new release since its last successful check reuses that result.
+    Security advisories are matched for every run, see attach_advisories.
+
     Expected input format:
     [
         {
@@ -185,60 +354,32 @@ def check_outdated_dependencies(repositories: List[Dict]) -> Dict:
     ]
     """
     logger.info(f"🚀 Starting outdated dependency check for {len(repositories)} repositories")
-    results = []
-    successful_checks = 0
-    failed_checks = 0
-
-    for i, repo in enumerate(repositories, 1):
-        logger.info(f"[{i}/{len(repositories)}] 🔍 Checking outdated dependencies for {repo['name']} ({repo['language']})")
-        repo_result = {
-            "name": repo["name"],
-            "url": f"https://github.com/{repo['owner']}/{repo['name']}",
-            "language": repo["language"],
-            "build_name": repo["build_name"],
-            "outdated_dependencies": None,
-            "error": None,
-        }
-        repo_url = f"https://github.com/{repo['owner']}/{repo['name']}"
-        
-        logger.info(f"📂 Getting repository: {repo_url}")
-        cloned_path = get_or_clone_repo(repo_url, repo["name"])
-        if not cloned_path:
-            logger.error(f"❌ Failed to get repository {repo['name']}")
-            repo_result["error"] = "Failed to clone repository"
-            failed_checks += 1
-            results.append(repo_result)
-            continue
-
-        logger.info(f"✅ Repository ready at: {cloned_path}")
-
-        if repo["language"].lower() == "python":
-            repo_result["outdated_dependencies"] = check_python_outdated(
-                cloned_path
-            )
-        elif repo["language"].lower() == "javascript":
-            repo_result["outdated_dependencies"] = check_javascript_outdated(
-                cloned_path
-            )
-        else:
-            logger.error(f"❌ Unsupported language: {repo['language']} for {repo['name']}")
-            repo_result["error"] = f"Unsupported language: {repo['language']}"
-            failed_checks += 1
-            results.append(repo_result)
-            continue
-
-        if repo_result["outdated_dependencies"] is not None:
-            outdated_count = len(repo_result["outdated_dependencies"])
-            if outdated_count > 0:
-                logger.info(f"📊 {repo['name']}: {outdated_count} outdated dependencies found")
-            else:
-                logger.info(f"✨ {repo['name']}: All dependencies are up to date!")
-            successful_checks += 1
-        else:
-            logger.error(f"❌ Failed to check dependencies for {repo['name']}")
-            failed_checks += 1
+    total = len(repositories)
+
+    if incremental is None:
+        incremental = settings.OUTDATED_INCREMENTAL
+
+    def check(item: Tuple[int, Dict]) -> Tuple[Dict, bool]:
+        position, repo = item
+
+        def run() -> Tuple[Dict, bool]:
+            with command_deadline(settings.OUTDATED_REPO_TIMEOUT_SECONDS):
+                return check_repo_outdated(repo, position, total)
+
+        return check_repo_incrementally(repo, run, outdated_state) if incremental else run()
+
+    # Repositories are independent and their checks wait on git, npm and pip,
+    # so they run side by side; results keep the input order
+    checks = map_concurrently(check, list(enumerate(repositories, 1)), settings.OUTDATED_MAX_WORKERS)
+    results = [repo_result for repo_result, _ in checks]
+    for repo_result in results:
+        outdated = repo_result.get("outdated_dependencies") or []
+        for dependency, update_type in zip(outdated, classify_outdated(outdated)):
+            dependency["update_type"] = update_type
 
-        results.append(repo_result)
+    attach_advisories(repositories, results)
+    successful_checks = sum(1 for _, succeeded in checks if succeeded)
+    failed_checks = len(checks) - successful_checks
 
     # Summary logging
     total_outdated = sum(len(r.get("outdated_dependencies", [])) for r in results if r.get("outdated_dependencies"))
@@ -0,0 +1,321 @@
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from app.core.config import settings
+from app.core.logging import LoggerFactory
+from app.services.dependencies.lockfiles import parse_lockfile
+from app.utils.commands import run_command
+
+logger = LoggerFactory.get_logger(__name__)
+
+# Files that determine what gets installed, in order of preference for installing
+ENVIRONMENT_INPUT_FILES = ("requirements.txt", "poetry.lock", "uv.lock", "pyproject.toml")
+
+# Lockfiles whose pins constrain what pip installs, in order of preference
+PYTHON_LOCKFILES = ("poetry.lock", "uv.lock")
+
+# Written last, so a directory without it is a failed or interrupted build
+_COMPLETE_MARKER = ".complete"
+
+# Build directories are named <repository>-<key>
+_ENVIRONMENT_NAME = re.compile(r"^(?P<repo>.+)-(?P<key>[0-9a-f]{16})$")
+
+
+def _hash_files(repo_path: str, names: Iterable[str]) -> Optional[str]:
+    digest = hashlib.sha256()
+    found = False
+    for name in names:
+        path = os.path.join(repo_path, name)
+        if os.path.isfile(path):
+            found = True
+            digest.update(name.encode())
+            with open(path, "rb") as f:
+                digest.update(hashlib.sha256(f.read()).digest())
+    return digest.hexdigest()[:16] if found else None
+
+
+def environment_key(repo_path: str) -> Optional[str]:
+    """Hash of the repository's requirement and lockfiles, or None if it has none."""
+    return _hash_files(repo_path, ENVIRONMENT_INPUT_FILES)
+
+
+def _project_files(repo_path: str) -> List[str]:
+    """Checked out files of a (sparse) repository, relative to it, in a stable order."""
+    files = []
+    for root, directories, names in os.walk(repo_path):
+        directories[:] = sorted(d for d in directories if d not in (".git", "node_modules"))
+        files.extend(os.path.relpath(os.path.join(root, name), repo_path) for name in sorted(names))
+    return files
+
+
+def node_project_key(repo_path: str) -> Optional[str]:
+    """Hash of the repository's manifests, lockfiles and npm configuration, or None without a package.json."""
+    if not os.path.isfile(os.path.join(repo_path, "package.json")):
+        return None
+    return _hash_files(repo_path, _project_files(repo_path))
+
+
+def detect_package_manager(repo_path: str) -> str:
+    """
+    "pnpm" or "npm", from package.json's packageManager field or else the lockfile present.
+
+    Yarn projects are handled by npm, which reads yarn.lock when creating its own lockfile.
+    """
+    try:
+        with open(os.path.join(repo_path, "package.json"), encoding="utf-8") as f:
+            package_manager = json.load(f).get("packageManager") or ""
+    except (OSError, ValueError, AttributeError):
+        package_manager = ""
+    if package_manager.startswith("pnpm@"):
+        return "pnpm"
+    if not package_manager and os.path.isfile(os.path.join(repo_path, "pnpm-lock.yaml")):
+        return "pnpm"
+    return "npm"
+
+
+def pnpm_command() -> List[str]:
+    """pnpm itself when installed, else through corepack (bundled with Node), which honours packageManager."""
+    return ["pnpm"] if shutil.which("pnpm") else ["corepack", "pnpm"]
+
+
+def _directory_size(path: Path) -> int:
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                pass
+    return total
+
+
+def write_lock_constraints(repo_path: str, constraints_file: Path) -> bool:
+    """
+    Write the versions pinned by the repository's poetry.lock or uv.lock as pip constraints.
+
+    Packages locked at several versions (per platform or Python version)
+    are left unconstrained, as a single pin would conflict.
+
+    Returns:
+        Whether a constraints file was written
+    """
+    for name in PYTHON_LOCKFILES:
+        path = os.path.join(repo_path, name)
+        if not os.path.isfile(path):
+            continue
+        with open(path, encoding="utf-8") as f:
+            content = f.read()
+        versions: Dict[str, set] = {}
+        for package in parse_lockfile(name, content):
+            versions.setdefault(package.name, set()).add(package.version)
+        pins = sorted(f"{package}=={next(iter(locked))}" for package, locked in versions.items() if len(locked) == 1)
+        if not pins:
+            return False
+        constraints_file.write_text("\n".join(pins) + "\n", encoding="utf-8")
+        logger.info(f"🔒 Constraining {len(pins)} packages to the versions in {name}")
+        return True
+    return False
+
+
+def _python_of(environment: Path) -> Path:
+    return environment / ("Scripts/python.exe" if os.name == "nt" else "bin/python")
+
+
+class BuildCache(ABC):
+    """
+    Per-repository build directories keyed by a hash of the repository's
+    dependency declarations.
+
+    A directory is built once and reused while the hash is unchanged; when
+    it changes a new one is built and the repository's old ones are
+    removed. Directories are evicted least recently used first (by the
+    mtime of their completion marker) once the cache exceeds its disk
+    budget. Subclasses define the key and how to build.
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        self._evict_lock = threading.Lock()
+
+    @abstractmethod
+    def _key(self, repo_path: str) -> Optional[str]:
+        """Hash of what the repository's build depends on, or None if there is nothing to build."""
+
+    @abstractmethod
+    def _build(self, build: Path, repo_path: str) -> None:
+        """Build the repository into the empty directory `build`."""
+
+    def _lock_for(self, repo_name: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(repo_name, threading.Lock())
+
+    @contextmanager
+    def _acquire(self, repo_name: str, repo_path: str) -> Iterator[Optional[Path]]:
+        """
+        The repository's build directory, built if needed, not evicted while the block runs.
+
+        Yields:
+            The directory, or None if the repository declares nothing to install
+
+        Raises:
+            subprocess.CalledProcessError: If building fails
+        """
+        key = self._key(repo_path)
+        if key is None:
+            yield None
+            return
+
+        build = self.directory / f"{repo_name}-{key}"
+        with self._lock_for(repo_name):
+            marker = build / _COMPLETE_MARKER
+            if marker.exists():
+                logger.info(f"♻️  Reusing {build.parent.name} {build.name}")
+                marker.touch()
+            else:
+                logger.info(f"🏗️  Building {build.parent.name} {build.name}")
+                shutil.rmtree(build, ignore_errors=True)
+                build.parent.mkdir(parents=True, exist_ok=True)
+                try:
+                    self._build(build, repo_path)
+                except BaseException:
+                    shutil.rmtree(build, ignore_errors=True)
+                    raise
+                marker.touch()
+                self._remove_stale(repo_name, build)
+            self._evict()
+            yield build
+
+    def _remove_stale(self, repo_name: str, current: Path) -> None:
+        for build in self.directory.glob(f"{repo_name}-*"):
+            name = _ENVIRONMENT_NAME.match(build.name)
+            # Repositories sharing a name prefix (puya, puya-ts) are not stale versions
+            if build != current and name and name.group("repo") == repo_name:
+                logger.info(f"🧹 Removing outdated {build.parent.name} {build.name}")
+                shutil.rmtree(build, ignore_errors=True)
+
+    def _evict(self) -> None:
+        """Remove least recently used builds until the cache fits its disk budget."""
+        with self._evict_lock:
+            builds: List[tuple] = []
+            for build in self.directory.iterdir() if self.directory.exists() else []:
+                marker = build / _COMPLETE_MARKER
+                name = _ENVIRONMENT_NAME.match(build.name)
+                if name and marker.exists():
+                    builds.append((marker.stat().st_mtime, build, name.group("repo")))
+
+            sizes = {build: _directory_size(build) for _, build, _ in builds}
+            total = sum(sizes.values())
+            for _, build, repo_name in sorted(builds, key=lambda item: item[0]):
+                if total <= self.max_bytes:
+                    break
+                lock = self._lock_for(repo_name)
+                # Held by the caller (its own build) or by a check using it right now
+                if not lock.acquire(blocking=False):
+                    continue
+                try:
+                    logger.info(f"🧹 Evicting {build.parent.name} {build.name} ({sizes[build] // (1024 * 1024)} MiB)")
+                    shutil.rmtree(build, ignore_errors=True)
+                    total -= sizes[build]
+                finally:
+                    lock.release()
+
+
+class EnvironmentCache(BuildCache):
+    """Per-repository virtual environments keyed by a hash of the repository's requirement and lock files."""
+
+    def _key(self, repo_path: str) -> Optional[str]:
+        return environment_key(repo_path)
+
+    @contextmanager
+    def python(self, repo_name: str, repo_path: str) -> Iterator[Optional[Path]]:
+        """
+        Python interpreter of the repository's environment, built if needed.
+
+        The environment is not evicted while the block runs.
+
+        Yields:
+            The interpreter path, or None if the repository declares nothing to install
+
+        Raises:
+            subprocess.CalledProcessError: If creating the environment or installing fails
+        """
+        with self._acquire(repo_name, repo_path) as environment:
+            yield _python_of(environment) if environment is not None else None
+
+    def _build(self, environment: Path, repo_path: str) -> None:
+        run_command([sys.executable, "-m", "venv", str(environment)], check=True, capture_output=True)
+        python = str(_python_of(environment))
+        requirements_file = os.path.join(repo_path, "requirements.txt")
+        if os.path.exists(requirements_file):
+            install = ["-r", requirements_file]
+        else:
+            # Installing the project pulls in its declared dependencies
+            install = [os.path.abspath(repo_path)]
+        # Install what the lockfile pins rather than the newest versions the declarations allow
+        constraints_file = environment / "constraints.txt"
+        if write_lock_constraints(repo_path, constraints_file):
+            install = ["-c", str(constraints_file), *install]
+        run_command(
+            [python, "-m", "pip", "install", "--disable-pip-version-check", *install],
+            check=True,
+            capture_output=True,
+        )
+
+
+class NodeModulesCache(BuildCache):
+    """
+    Per-repository installed npm trees keyed by a hash of the repository's
+    manifests and lockfiles.
+
+    Each build is a copy of the (sparse) checkout with node_modules
+    installed next to it, so workspace links resolve inside the build.
+    """
+
+    def _key(self, repo_path: str) -> Optional[str]:
+        return node_project_key(repo_path)
+
+    @contextmanager
+    def project(self, repo_name: str, repo_path: str) -> Iterator[Optional[Path]]:
+        """
+        Directory holding the repository's manifests and installed node_modules, built if needed.
+
+        The directory is not evicted while the block runs.
+
+        Yields:
+            The directory, or None if the repository has no package.json
+
+        Raises:
+            subprocess.CalledProcessError: If installing fails
+        """
+        with self._acquire(repo_name, repo_path) as project:
+            yield project
+
+    def _build(self, project: Path, repo_path: str) -> None:
+        for name in _project_files(repo_path):
+            target = project / name
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(os.path.join(repo_path, name), target)
+        # Installs exactly the lockfile; scripts would build sources that are not here
+        if detect_package_manager(str(project)) == "pnpm":
+            install = [*pnpm_command(), "install", "--frozen-lockfile", "--ignore-scripts"]
+        elif (project / "package-lock.json").exists():
+            install = ["npm", "ci", "--ignore-scripts", "--no-audit", "--no-fund"]
+        else:
+            install = ["npm", "install", "--ignore-scripts", "--no-audit", "--no-fund"]
+        run_command(install, cwd=project, check=True, capture_output=True)
+
+
+environment_cache = EnvironmentCache(settings.OUTDATED_VENV_DIR, settings.OUTDATED_VENV_MAX_BYTES)
+node_modules_cache = NodeModulesCache(settings.OUTDATED_NODE_MODULES_DIR, settings.OUTDATED_NODE_MODULES_MAX_BYTES)
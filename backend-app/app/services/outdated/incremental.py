@@ -0,0 +1,166 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.logging import LoggerFactory
+from app.services.dependencies.discovery import discover_repo_files
+from app.services.dependencies.utils import get_dependency_node_id
+from app.services.outdated.registry import fetch_registry_versions, get_declared_dependencies
+
+logger = LoggerFactory.get_logger(__name__)
+
+# Bump when the stored state's shape changes so old state is ignored
+STATE_FORMAT_VERSION = 2
+
+
+def manifest_fingerprint(repo: Dict[str, Any], token: Optional[str] = None) -> Optional[str]:
+    """
+    Hash of the blob SHAs of every manifest and lockfile in the repository,
+    plus the settings that shape a check; one tree request, no downloads.
+
+    Returns:
+        The fingerprint, or None if the repository tree could not be read
+    """
+    repo_files = discover_repo_files(repo, token)
+    if repo_files is None:
+        return None
+    digest = hashlib.sha256(f"{settings.OUTDATED_MODE}:{settings.OUTDATED_NPM_MODE}".encode())
+    for repo_file in sorted(repo_files.manifests + repo_files.lockfiles, key=lambda repo_file: repo_file.path):
+        digest.update(f"\0{repo_file.path}:{repo_file.sha}".encode())
+    return digest.hexdigest()
+
+
+def release_digests(packages: List[Dict[str, Any]]) -> Dict[str, Optional[str]]:
+    """
+    Digest of the registry `latest` and every published version of each package,
+    keyed by node id, through the registry metadata cache.
+
+    Covering every version catches releases that do not move `latest`, such
+    as a backported fix on an older major.
+    """
+    registry_versions = fetch_registry_versions(packages)
+    digests = {}
+    for package in packages:
+        key = get_dependency_node_id(package["name"], package["language"])
+        versions = registry_versions.get(key)
+        if versions is None:
+            digests[key] = None
+            continue
+        digest = hashlib.sha256(str(versions.latest).encode())
+        for version in sorted(versions.versions):
+            digest.update(f"\0{version}".encode())
+        digests[key] = digest.hexdigest()
+    return digests
+
+
+class OutdatedState:
+    """
+    Per-repository result of the last successful outdated check, with what it depended on:
+    the manifest fingerprint and a digest of the registry releases of each declared dependency.
+
+    Stored as one JSON file on local disk, rewritten atomically after each update.
+    """
+
+    def __init__(self, path: Optional[str]):
+        self.path = Path(path) if path else None
+        self._repos: Optional[Dict[str, Any]] = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, Any]:
+        if self._repos is not None:
+            return self._repos
+        self._repos = {}
+        if self.path is None:
+            return self._repos
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == STATE_FORMAT_VERSION:
+                self._repos = data.get("repositories") or {}
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"⚠️  Ignoring unreadable outdated state {self.path}: {e}")
+        return self._repos
+
+    def get(self, repo_name: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._load().get(repo_name)
+
+    def set(self, repo_name: str, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            repos = self._load()
+            repos[repo_name] = entry
+            if self.path is None:
+                return
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                # Write then rename so a crash never leaves a partial file
+                with tempfile.NamedTemporaryFile("w", dir=self.path.parent, delete=False, encoding="utf-8") as f:
+                    json.dump({"version": STATE_FORMAT_VERSION, "repositories": repos}, f, separators=(",", ":"))
+                os.replace(f.name, self.path)
+            except OSError as e:
+                logger.warning(f"⚠️  Could not write outdated state {self.path}: {e}")
+
+
+def check_repo_incrementally(
+    repo: Dict[str, Any], check: Callable[[], Tuple[Dict[str, Any], bool]], state: "OutdatedState"
+) -> Tuple[Dict[str, Any], bool]:
+    """
+    Reuse the repository's previous result when neither its manifests nor the
+    releases of any dependency changed since; otherwise run `check`.
+
+    Returns:
+        The repository result and whether it succeeded, like `check`
+    """
+    try:
+        fingerprint = manifest_fingerprint(repo)
+        previous = state.get(repo["name"])
+        if fingerprint is not None and previous is not None and previous["fingerprint"] == fingerprint:
+            current_releases = release_digests(previous["dependencies"])
+            released = sorted(
+                key for key, digest in current_releases.items() if digest != previous["releases"].get(key)
+            )
+            if not released:
+                logger.info(f"♻️  {repo['name']}: manifests and upstream releases unchanged, reusing previous result")
+                return (previous["result"], True)
+            logger.info(f"🆕 {repo['name']}: new upstream releases of {', '.join(released)}, rechecking")
+        elif previous is not None:
+            logger.info(f"📝 {repo['name']}: manifests changed, rechecking")
+    except Exception as e:
+        # Without a fingerprint the repository is simply checked in full
+        logger.warning(f"⚠️  Could not compare {repo['name']} with its previous check, rechecking: {e}")
+        fingerprint = None
+
+    repo_result, succeeded = check()
+    if not succeeded or fingerprint is None:
+        return (repo_result, succeeded)
+
+    try:
+        dependencies = get_declared_dependencies(repo)
+        if dependencies is None:
+            return (repo_result, succeeded)
+        dependencies = [{"name": package["name"], "language": package["language"]} for package in dependencies]
+        releases = release_digests(dependencies)
+    except Exception as e:
+        # The check itself succeeded; only its reuse next time is lost
+        logger.warning(f"⚠️  Not recording outdated state for {repo['name']}: {e}")
+        return (repo_result, succeeded)
+    state.set(
+        repo["name"],
+        {
+            "fingerprint": fingerprint,
+            "dependencies": dependencies,
+            "releases": releases,
+            "result": repo_result,
+        },
+    )
+    return (repo_result, succeeded)
+
+
+outdated_state = OutdatedState(settings.OUTDATED_STATE_FILE)
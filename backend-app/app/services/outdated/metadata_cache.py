@@ -0,0 +1,137 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from app.core.config import settings
+from app.core.logging import LoggerFactory
+
+logger = LoggerFactory.get_logger(__name__)
+
+# Bump when the stored value's shape changes so stale entries on disk are ignored
+METADATA_FORMAT_VERSION = 1
+
+
+@dataclass
+class CachedMetadata:
+    """
+    Registry metadata of one package as last fetched.
+
+    Attributes:
+        value: JSON-serializable metadata, or None if the package is not published
+        etag: ETag of the response, sent back as If-None-Match to revalidate
+        last_modified: Last-Modified of the response, sent back as If-Modified-Since
+        fetched_at: Unix time the metadata was fetched or last revalidated
+    """
+
+    value: Optional[Any]
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: float = 0.0
+
+
+class RegistryMetadataCache:
+    """
+    Package registry metadata keyed by ecosystem and package name, shared by
+    every repository check in a run and, through local disk, across runs.
+
+    Entries younger than the TTL are served without a request. Older entries
+    are revalidated with a conditional request, so an unchanged package costs
+    a 304 instead of a full metadata document. Concurrent lookups of the same
+    package wait for a single fetch.
+    """
+
+    def __init__(self, directory: Optional[str], ttl_seconds: float, max_entries: int):
+        self.directory = Path(directory) / f"v{METADATA_FORMAT_VERSION}" if directory else None
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CachedMetadata]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return self.directory / digest[:2] / f"{digest}.json"
+
+    def lookup(
+        self, ecosystem: str, name: str, fetch: Callable[[Optional[CachedMetadata]], CachedMetadata]
+    ) -> Optional[Any]:
+        """
+        Metadata of a package, fetched or revalidated only when the cached entry is missing or expired.
+
+        Args:
+            ecosystem: Registry ecosystem, e.g. "python" or "javascript"
+            name: Canonical package name
+            fetch: Called with the expired entry (or None) and returns the new one;
+                it should send the entry's validators and reuse its value on a 304
+
+        Returns:
+            The metadata value, or None if the package is not published
+        """
+        key = f"{ecosystem}:{name}"
+        with self._key_lock(key):
+            cached = self._get(key)
+            if cached is not None and time.time() - cached.fetched_at < self.ttl_seconds:
+                return cached.value
+
+            entry = fetch(cached)
+            self._set(key, entry)
+            return entry.value
+
+    def _get(self, key: str) -> Optional[CachedMetadata]:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+        if self.directory is None:
+            return None
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                entry = CachedMetadata(**json.load(f))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"⚠️  Ignoring unreadable registry metadata for {key}: {e}")
+            return None
+
+        self._remember(key, entry)
+        return entry
+
+    def _set(self, key: str, entry: CachedMetadata) -> None:
+        self._remember(key, entry)
+        if self.directory is None:
+            return
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename so concurrent readers never see a partial file
+            with tempfile.NamedTemporaryFile("w", dir=path.parent, delete=False, encoding="utf-8") as f:
+                json.dump(asdict(entry), f, separators=(",", ":"))
+            os.replace(f.name, path)
+        except OSError as e:
+            logger.warning(f"⚠️  Could not write registry metadata for {key}: {e}")
+
+    def _remember(self, key: str, entry: CachedMetadata) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+registry_metadata_cache = RegistryMetadataCache(
+    settings.OUTDATED_METADATA_CACHE_DIR,
+    settings.OUTDATED_METADATA_TTL_SECONDS,
+    settings.OUTDATED_METADATA_CACHE_MAX_ENTRIES,
+)
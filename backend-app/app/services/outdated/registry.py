@@ -0,0 +1,231 @@
+import time
+from dataclasses import asdict, dataclass, replace
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import quote
+
+import requests
+
+from app.core.config import settings
+from app.core.logging import LoggerFactory
+from app.services.dependencies.identity import canonicalize_name
+from app.services.dependencies.main import get_dep_data_from_repo
+from app.services.dependencies.requirements import is_prerelease, parse_constraint, parse_version
+from app.services.dependencies.utils import get_dependency_node_id, get_node_name
+from app.services.outdated.metadata_cache import CachedMetadata, registry_metadata_cache
+from app.utils.collection import map_concurrently, record_collection_error
+from app.utils.http_client import http_get
+
+logger = LoggerFactory.get_logger(__name__)
+
+# Declared by manifests but not installable packages
+NON_PACKAGE_DEPENDENCIES = {"python", "node"}
+
+
+@dataclass
+class PackageVersions:
+    """Published versions of a package according to its registry."""
+
+    latest: Optional[str]
+    versions: List[str]
+
+
+def _fetch_metadata(
+    url: str, accept: str, parse: Callable[[Dict[str, Any]], PackageVersions], cached: Optional[CachedMetadata]
+) -> CachedMetadata:
+    """Fetch package metadata, or revalidate the cached copy with a conditional request."""
+    headers = {"Accept": accept}
+    if cached is not None and cached.etag:
+        headers["If-None-Match"] = cached.etag
+    if cached is not None and cached.last_modified:
+        headers["If-Modified-Since"] = cached.last_modified
+    response = http_get(url, headers=headers)
+    if response.status_code == 304 and cached is not None:
+        return replace(cached, fetched_at=time.time())
+    if response.status_code == 404:
+        return CachedMetadata(None, fetched_at=time.time())
+    response.raise_for_status()
+    return CachedMetadata(
+        asdict(parse(response.json())),
+        response.headers.get("ETag"),
+        response.headers.get("Last-Modified"),
+        time.time(),
+    )
+
+
+def _parse_pypi(data: Dict[str, Any]) -> PackageVersions:
+    versions = [
+        version
+        for version, files in (data.get("releases") or {}).items()
+        if not files or not all(file.get("yanked") for file in files)
+    ]
+    return PackageVersions((data.get("info") or {}).get("version"), versions)
+
+
+def _parse_npm(data: Dict[str, Any]) -> PackageVersions:
+    return PackageVersions((data.get("dist-tags") or {}).get("latest"), list(data.get("versions") or {}))
+
+
+def get_pypi_versions(name: str) -> Optional[PackageVersions]:
+    """Latest stable and all non-yanked versions of a package from the PyPI JSON API, through the metadata cache."""
+    name = canonicalize_name(name, "python")
+    url = f"{settings.PYPI_JSON_URL.rstrip('/')}/{quote(name)}/json"
+    value = registry_metadata_cache.lookup(
+        "python", name, lambda cached: _fetch_metadata(url, "application/json", _parse_pypi, cached)
+    )
+    return PackageVersions(**value) if value is not None else None
+
+
+def get_npm_versions(name: str) -> Optional[PackageVersions]:
+    """`latest` dist-tag and all versions of a package from the npm registry metadata API, through the metadata cache."""
+    # Scoped names keep their @ but the slash is encoded: @scope%2fname
+    url = f"{settings.NPM_REGISTRY_URL.rstrip('/')}/{quote(name, safe='@')}"
+    # The abbreviated document has everything needed and is a fraction of the full one
+    value = registry_metadata_cache.lookup(
+        "javascript",
+        name,
+        lambda cached: _fetch_metadata(url, "application/vnd.npm.install-v1+json", _parse_npm, cached),
+    )
+    return PackageVersions(**value) if value is not None else None
+
+
+REGISTRY_CLIENTS = {
+    "python": get_pypi_versions,
+    "javascript": get_npm_versions,
+}
+
+
+def _is_prerelease(version: str) -> bool:
+    key = parse_version(version)
+    return key is None or is_prerelease(key)
+
+
+def get_wanted_version(constraint: str, versions: List[str]) -> Optional[str]:
+    """Highest stable version allowed by the constraint, like the `wanted` column of npm outdated."""
+    parsed = parse_constraint(constraint)
+    allowed = [
+        (key, version)
+        for version in versions
+        if not _is_prerelease(version) and parsed.allows(key := parse_version(version))
+    ]
+    return max(allowed)[1] if allowed else None
+
+
+def get_current_version(entry: Dict[str, Any]) -> Optional[str]:
+    """
+    The locked version when a lockfile is present, else the pin.
+
+    Returns:
+        The version, or None when neither says what is installed
+    """
+    if entry.get("resolved"):
+        return entry["resolved"]
+    return parse_constraint(entry["constraint"]).pinned
+
+
+def get_declared_dependencies(repo: Dict[str, Any], token: Optional[str] = None) -> Optional[List[Dict[str, Any]]]:
+    """
+    Direct dependencies declared by the manifests of a repository, with their
+    constraint and locked version, from the same blob-cached discovery the
+    dependency graph uses.
+
+    Returns:
+        One {name, language, constraint, resolved} entry per package, or None if the repository could not be read
+    """
+    (nodes, _) = get_dep_data_from_repo(repo, token)
+    if nodes is None:
+        return None
+
+    # Nodes of the repository itself and of its workspace packages
+    repo_node_name = get_node_name(repo)
+    own_nodes = {node["id"] for node in nodes if node["id"] == repo_node_name or node.get("repository")}
+
+    declared = {}
+    for node in nodes:
+        if node["id"] in own_nodes or node.get("type") == "transitive-dependency":
+            continue
+        if node["name"].lower() in NON_PACKAGE_DEPENDENCIES:
+            continue
+        for entry in node.get("version") or []:
+            if not isinstance(entry, dict) or entry.get("repo_name") not in own_nodes:
+                continue
+            # The first declaration wins, the repository's own manifest comes first
+            declared.setdefault(
+                node["id"],
+                {
+                    "name": node["name"],
+                    "language": node["language"],
+                    "constraint": str(entry.get("version", "")),
+                    "resolved": entry.get("resolved"),
+                },
+            )
+    return list(declared.values())
+
+
+def fetch_registry_versions(packages: List[Dict[str, Any]]) -> Dict[str, PackageVersions]:
+    """Registry metadata for the given packages, fetched concurrently, keyed by node id."""
+    keys = {}
+    for package in packages:
+        keys.setdefault(get_dependency_node_id(package["name"], package["language"]), package)
+
+    def fetch(package: Dict[str, Any]) -> Optional[PackageVersions]:
+        client = REGISTRY_CLIENTS.get(package["language"])
+        if client is None:
+            return None
+        try:
+            return client(package["name"])
+        except (requests.RequestException, ValueError) as e:
+            record_collection_error(
+                f"outdated:{package['name']}", f"❌ Failed to fetch registry metadata for {package['name']}: {e}"
+            )
+            return None
+
+    results = map_concurrently(fetch, list(keys.values()), settings.OUTDATED_REGISTRY_WORKERS)
+    return {key: versions for key, versions in zip(keys, results) if versions is not None}
+
+
+def check_registry_outdated(repo: Dict[str, Any], token: Optional[str] = None) -> Optional[List[Dict]]:
+    """
+    Check outdated dependencies of a repository against registry metadata,
+    without cloning or installing anything.
+
+    A dependency with no locked or pinned version has an unknown (None)
+    `current` and is only reported when its constraint excludes `latest`.
+
+    Returns:
+        {name, current, wanted, latest} for every outdated direct dependency,
+        or None if the repository's manifests could not be read
+    """
+    logger.info(f"🛰️  Checking {repo['name']} against registry metadata")
+    declared = get_declared_dependencies(repo, token)
+    if declared is None:
+        return None
+
+    registry_versions = fetch_registry_versions(declared)
+    outdated = []
+    for package in declared:
+        versions = registry_versions.get(get_dependency_node_id(package["name"], package["language"]))
+        if versions is None or not versions.latest or parse_version(versions.latest) is None:
+            continue
+        current = get_current_version(package)
+        wanted = get_wanted_version(package["constraint"], versions.versions)
+        if current is None:
+            # Whatever is installed, the constraint keeps it below latest
+            is_outdated = not parse_constraint(package["constraint"]).allows(parse_version(versions.latest))
+        elif parse_version(current) is None:
+            continue
+        else:
+            wanted = wanted or current
+            current_key = parse_version(current)
+            is_outdated = current_key < parse_version(versions.latest) or current_key < parse_version(wanted)
+        if is_outdated:
+            outdated.append(
+                {
+                    "name": package["name"],
+                    "current": current,
+                    "wanted": wanted,
+                    "latest": versions.latest,
+                }
+            )
+
+    logger.info(f"✅ Found {len(outdated)} outdated packages of {len(declared)} declared in {repo['name']}")
+    return outdated
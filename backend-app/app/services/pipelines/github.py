@@ -1,8 +1,11 @@
+import asyncio
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any
 import requests
 
 from app.core.config import settings
+from app.utils.collection import record_collection_error
+from app.utils.http_client import http_get
 
 
 def get_previous_day_range_iso() -> Tuple[str, str]:
@@ -52,7 +55,9 @@ def _process_runs(
     return total, success, failed
 
 
-async def get_pipeline_status() -> Tuple[List[Dict[str, Any]], str, str]:
+def fetch_pipeline_runs(
+    token: Optional[str] = None,
+) -> Tuple[List[Dict[str, Any]], str, str]:
     """Fetches GitHub Actions runs for the specified date range across monitored repositories."""
     all_runs: List[Dict[str, Any]] = []
 
@@ -60,7 +65,7 @@ async def get_pipeline_status() -> Tuple[List[Dict[str, Any]], str, str]:
     date_query = f"{start_date_iso}..{end_date_iso}"
 
     headers = {
-        "Authorization": f"token {settings.GITHUB_TOKEN}",
+        "Authorization": f"token {token or settings.GITHUB_TOKEN}",
         "Accept": "application/vnd.github.v3+json",
     }
 
@@ -77,7 +82,7 @@ async def get_pipeline_status() -> Tuple[List[Dict[str, Any]], str, str]:
             }
 
             try:
-                response = requests.get(api_url, headers=headers, params=params)
+                response = http_get(api_url, headers=headers, params=params)
                 response.raise_for_status()
                 runs_data = response.json()
                 runs = runs_data.get("workflow_runs", [])
@@ -94,8 +99,23 @@ async def get_pipeline_status() -> Tuple[List[Dict[str, Any]], str, str]:
                 page += 1
 
             except requests.exceptions.RequestException as e:
+                record_collection_error(
+                    f"pipeline_status:{name}",
+                    f"Error fetching workflow runs for {owner}/{name} page {page}: {e}",
+                )
                 break
             except Exception as e:
+                record_collection_error(
+                    f"pipeline_status:{name}",
+                    f"Error processing workflow runs for {owner}/{name} page {page}: {e}",
+                )
                 break
 
     return all_runs, start_date_iso, end_date_iso
+
+
+async def get_pipeline_status(
+    token: Optional[str] = None,
+) -> Tuple[List[Dict[str, Any]], str, str]:
+    """Fetches GitHub Actions runs without blocking the event loop."""
+    return await asyncio.to_thread(fetch_pipeline_runs, token)
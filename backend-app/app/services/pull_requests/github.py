@@ -6,7 +6,9 @@ import requests
 
 from app.core.config import settings
 from app.core.logging import LoggerFactory
+from app.utils.collection import record_collection_error
 from app.utils.github import get_github_token
+from app.utils.http_client import http_get
 
 logger = LoggerFactory.get_logger(__name__)
 
@@ -39,10 +41,18 @@ def get_repo_pull_requests(repo_name: str, token: str, state: str = "open", sinc
 
     while True:
         params["page"] = page
-        response = requests.get(url, headers=headers, params=params)
+        try:
+            response = http_get(url, headers=headers, params=params)
+        except requests.RequestException as e:
+            record_collection_error(
+                f"pull_requests:{repo_name}",
+                f"Error fetching pull requests for {settings.GITHUB_ORG}/{repo_name} page {page}: {e}",
+            )
+            break
         if response.status_code != 200:
-            logger.error(
-                f"Error fetching pull requests for {settings.GITHUB_ORG}/{repo_name}: {response.status_code}"
+            record_collection_error(
+                f"pull_requests:{repo_name}",
+                f"Error fetching pull requests for {settings.GITHUB_ORG}/{repo_name} page {page}: {response.status_code}",
             )
             break
 
@@ -104,18 +114,40 @@ def format_pr_data(pr: Dict[str, Any], repo_name: str) -> Dict[str, Any]:
     }
 
 
-def get_github_pull_requests() -> List[Dict[str, Any]]:
+def get_open_pull_requests(token: Optional[str] = None) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Fetches the raw open pull requests of every configured repository.
+
+    Returns:
+        Raw GitHub pull request objects keyed by repository name
+    """
+    token = token or get_github_token()
+    open_pull_requests = {}
+    for repo in settings.REPOSITORIES:
+        repo_name = repo["name"]
+        logger.info(f"Fetching pull requests for {settings.GITHUB_ORG}/{repo_name}")
+        open_pull_requests[repo_name] = get_repo_pull_requests(repo_name, token)
+    return open_pull_requests
+
+
+def get_github_pull_requests(
+    token: Optional[str] = None,
+    open_pull_requests: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+) -> List[Dict[str, Any]]:
     """
     Fetches all pull requests from the configured repositories.
+
+    Args:
+        token: GitHub access token, resolved from settings if not given
+        open_pull_requests: Raw open pull requests already fetched for this run,
+            keyed by repository name (see get_open_pull_requests)
     """
     try:
         # Collect pull requests from all repositories
-        token = get_github_token()
+        if open_pull_requests is None:
+            open_pull_requests = get_open_pull_requests(token)
         all_pull_requests = []
-        for repo in settings.REPOSITORIES:
-            repo_name = repo["name"]
-            logger.info(f"Fetching pull requests for {settings.GITHUB_ORG}/{repo_name}")
-            pull_requests = get_repo_pull_requests(repo_name, token)
+        for repo_name, pull_requests in open_pull_requests.items():
             for pr in pull_requests:
                 all_pull_requests.append(format_pr_data(pr, repo_name))
 
@@ -126,12 +158,13 @@ def get_github_pull_requests() -> List[Dict[str, Any]]:
         return {"error": str(e)}, 500
 
 
-def get_closed_pull_requests(days_back: int = 1) -> List[Dict[str, Any]]:
+def get_closed_pull_requests(days_back: int = 1, token: Optional[str] = None) -> List[Dict[str, Any]]:
     """
     Fetches all closed pull requests from the configured repositories within the specified time period.
     
     Args:
         days_back: Number of days to look back for closed PRs (default: 1)
+        token: GitHub access token, resolved from settings if not given
     
     Returns:
         List of closed PR data with enhanced fields
@@ -140,7 +173,7 @@ def get_closed_pull_requests(days_back: int = 1) -> List[Dict[str, Any]]:
         # Calculate the since date
         since_date = (datetime.now(timezone.utc) - timedelta(days=days_back)).isoformat().replace('+00:00', 'Z')
         
-        token = get_github_token()
+        token = token or get_github_token()
         all_closed_prs = []
         
         for repo in settings.REPOSITORIES:
@@ -276,17 +309,18 @@ def calculate_pr_metrics(closed_prs: List[Dict[str, Any]]) -> Dict[str, Any]:
     return metrics
 
 
-def get_closed_pull_requests_with_metrics(days_back: int = 7) -> Dict[str, Any]:
+def get_closed_pull_requests_with_metrics(days_back: int = 7, token: Optional[str] = None) -> Dict[str, Any]:
     """
     Fetches closed pull requests and calculates metrics.
     
     Args:
         days_back: Number of days to look back for closed PRs (default: 7 to cover both metrics)
+        token: GitHub access token, resolved from settings if not given
     
     Returns:
         Dict containing both the closed PRs data and calculated metrics
     """
-    closed_prs = get_closed_pull_requests(days_back=days_back)
+    closed_prs = get_closed_pull_requests(days_back=days_back, token=token)
     metrics = calculate_pr_metrics(closed_prs)
     
     return {
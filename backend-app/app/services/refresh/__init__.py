@@ -0,0 +1 @@
+# Refresh orchestration service package
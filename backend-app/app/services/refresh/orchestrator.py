@@ -0,0 +1,361 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.logging import LoggerFactory
+from app.services.dependencies.main import get_dependency_data
+from app.services.issues.github import get_github_issues
+from app.services.outdated.dependency_checker import check_outdated_dependencies
+from app.services.pipelines.github import fetch_pipeline_runs
+from app.services.pull_requests.github import (
+    get_closed_pull_requests_with_metrics,
+    get_github_pull_requests,
+    get_open_pull_requests,
+)
+from app.services.releases.github import get_github_releases
+from app.utils.cache import response_cache
+from app.utils.collection import collection_errors
+from app.utils.github import get_github_token
+from app.utils.singleflight import collector_key, run_collector
+from app.utils.storage import publish_snapshot
+
+logger = LoggerFactory.get_logger(__name__)
+
+
+@dataclass
+class Stage:
+    """A unit of work in the refresh DAG.
+
+    `run` receives the results of the stages listed in `depends_on` and is
+    executed in a worker thread. Stages with a `snapshot` builder produce a
+    dataset that is published once every stage has finished. Stages with a
+    `flight_key` are coalesced with identical collector runs already in flight,
+    e.g. an /api endpoint called while the refresh is running, so a stage's
+    result is only checked for collector error tuples once it is returned.
+    """
+
+    name: str
+    run: Callable[[Dict[str, Any]], Any]
+    depends_on: Tuple[str, ...] = ()
+    snapshot: Optional[Callable[[Any, str], Tuple[str, Dict[str, Any]]]] = None
+    flight_key: Optional[str] = None
+
+
+@dataclass
+class StageResult:
+    status: str = "pending"
+    result: Any = None
+    error: Optional[str] = None
+    started_at: Optional[float] = None
+    duration_seconds: Optional[float] = None
+    publish_seconds: Optional[float] = None
+    storage_paths: Dict[str, str] = field(default_factory=dict)
+    errors: List[Dict[str, str]] = field(default_factory=list)
+
+
+def _site_folder(name: str) -> str:
+    return f"{settings.GCP_BUCKET_SITE_FOLDER_NAME}/{name}"
+
+
+def _metadata(created_at: str, source: str, **extra: Any) -> Dict[str, Any]:
+    return {
+        "created_at": created_at,
+        "version": settings.VERSION,
+        "repository_count": len(settings.REPOSITORIES),
+        "source": source,
+        **extra,
+    }
+
+
+def _raise_on_error_tuple(result: Any) -> Any:
+    # Some collectors report failures as an ({"error": ...}, 500) tuple
+    if isinstance(result, tuple) and len(result) == 2 and result[1] == 500:
+        raise RuntimeError(result[0].get("error", "collector failed"))
+    return result
+
+
+def _issues_snapshot(results: Any, created_at: str) -> Tuple[str, Dict[str, Any]]:
+    return _site_folder("issues"), {
+        "results": results,
+        "metadata": _metadata(created_at, "issues-analyzer"),
+    }
+
+
+def _pull_requests_snapshot(results: Any, created_at: str) -> Tuple[str, Dict[str, Any]]:
+    return _site_folder("pull-requests"), {
+        "results": results,
+        "metadata": _metadata(f"{created_at}Z", "pull-requests-analyzer"),
+    }
+
+
+def _closed_pull_requests_snapshot(data: Any, created_at: str) -> Tuple[str, Dict[str, Any]]:
+    return _site_folder("metrics/pull_request"), {
+        "results": data["pull_requests"],
+        "metrics": data["metrics"],
+        "metadata": _metadata(
+            f"{created_at}Z",
+            "pull-requests-analyzer",
+            pr_count=len(data["pull_requests"]),
+        ),
+    }
+
+
+def _releases_snapshot(results: Any, created_at: str) -> Tuple[str, Dict[str, Any]]:
+    return _site_folder("releases"), {
+        "results": results,
+        "metadata": _metadata(created_at, "releases-analyzer"),
+    }
+
+
+def _pipeline_snapshot(data: Any, created_at: str) -> Tuple[str, Dict[str, Any]]:
+    all_runs, start_date_iso, end_date_iso = data
+    return _site_folder("pipeline-runs"), {
+        "results": all_runs,
+        "metadata": _metadata(
+            f"{created_at}Z",
+            "github-pipeline-status",
+            run_count=len(all_runs),
+            start_date_iso=start_date_iso,
+            end_date_iso=end_date_iso,
+        ),
+    }
+
+
+def _outdated_snapshot(results: Any, created_at: str) -> Tuple[str, Dict[str, Any]]:
+    return _site_folder("outdated"), {
+        "results": results,
+        "metadata": _metadata(created_at, "outdated-analyzer"),
+    }
+
+
+def _dependencies_snapshot(results: Any, created_at: str) -> Tuple[str, Dict[str, Any]]:
+    return _site_folder("dependencies"), {
+        "results": results,
+        "metadata": _metadata(created_at, "dependency-analyzer"),
+    }
+
+
+# Collectors that hit the same GitHub resources share the upstream stages
+# instead of fetching them again: the token is resolved once and the open pull
+# request sweep feeds both the pull request and the issues datasets.
+STAGES: Dict[str, Stage] = {
+    stage.name: stage
+    for stage in [
+        Stage("github_token", lambda deps: get_github_token()),
+        Stage(
+            "open_pull_requests",
+            lambda deps: get_open_pull_requests(deps["github_token"]),
+            depends_on=("github_token",),
+        ),
+        Stage(
+            "issues",
+            lambda deps: get_github_issues(
+                token=deps["github_token"],
+                open_pull_requests=deps["open_pull_requests"],
+            ),
+            depends_on=("github_token", "open_pull_requests"),
+            snapshot=_issues_snapshot,
+            flight_key=collector_key("issues"),
+        ),
+        Stage(
+            "pull_requests",
+            lambda deps: get_github_pull_requests(open_pull_requests=deps["open_pull_requests"]),
+            depends_on=("open_pull_requests",),
+            snapshot=_pull_requests_snapshot,
+            flight_key=collector_key("pull_requests"),
+        ),
+        Stage(
+            "closed_pull_requests",
+            lambda deps: get_closed_pull_requests_with_metrics(
+                days_back=7, token=deps["github_token"]
+            ),
+            depends_on=("github_token",),
+            snapshot=_closed_pull_requests_snapshot,
+            flight_key=collector_key("closed_pull_requests", days_back=7),
+        ),
+        Stage(
+            "releases",
+            lambda deps: get_github_releases(token=deps["github_token"]),
+            depends_on=("github_token",),
+            snapshot=_releases_snapshot,
+            flight_key=collector_key("releases"),
+        ),
+        Stage(
+            "pipeline_status",
+            lambda deps: fetch_pipeline_runs(token=deps["github_token"]),
+            depends_on=("github_token",),
+            snapshot=_pipeline_snapshot,
+            flight_key=collector_key("pipeline_status"),
+        ),
+        Stage(
+            "outdated",
+            lambda deps: check_outdated_dependencies(settings.REPOSITORIES),
+            snapshot=_outdated_snapshot,
+            flight_key=collector_key(
+                "outdated", repositories=settings.REPOSITORIES, incremental=settings.OUTDATED_INCREMENTAL
+            ),
+        ),
+        Stage(
+            "dependencies",
+            lambda deps: get_dependency_data(
+                settings.REPOSITORIES, token=deps["github_token"]
+            ),
+            depends_on=("github_token",),
+            snapshot=_dependencies_snapshot,
+            flight_key=collector_key("dependencies", repositories=settings.REPOSITORIES),
+        ),
+    ]
+}
+
+
+def resolve_stages(requested: Optional[List[str]] = None) -> List[str]:
+    """Return the requested stages plus everything they depend on, in DAG order.
+
+    Raises:
+        ValueError: If a stage name is unknown
+    """
+    names = list(STAGES) if not requested else requested
+    unknown = [name for name in names if name not in STAGES]
+    if unknown:
+        raise ValueError(f"Unknown refresh stage(s): {', '.join(unknown)}")
+
+    ordered: List[str] = []
+
+    def visit(name: str) -> None:
+        if name in ordered:
+            return
+        for dependency in STAGES[name].depends_on:
+            visit(dependency)
+        ordered.append(name)
+
+    for name in names:
+        visit(name)
+    return ordered
+
+
+async def run_refresh(
+    stages: Optional[List[str]] = None,
+    max_concurrency: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Run the collectors as a dependency-aware DAG and publish their snapshots.
+
+    Every stage starts as soon as its dependencies have finished, with at most
+    `max_concurrency` collectors running at the same time. Snapshots are only
+    published after all stages are done, so a run never leaves a mix of old and
+    new datasets half-written. A failed stage skips its dependents but does not
+    stop independent stages.
+
+    Args:
+        stages: Names of the stages to run (dependencies are added automatically).
+            Runs every stage when omitted.
+        max_concurrency: Maximum number of collectors running at once
+            (default: settings.REFRESH_MAX_CONCURRENCY)
+
+    Returns:
+        Per-stage status, timings and storage paths of the published snapshots
+    """
+    stage_names = resolve_stages(stages)
+    semaphore = asyncio.Semaphore(max(1, max_concurrency or settings.REFRESH_MAX_CONCURRENCY))
+    stage_results = {name: StageResult() for name in stage_names}
+    tasks: Dict[str, asyncio.Task] = {}
+    run_started = time.perf_counter()
+
+    logger.info(f"🚀 Starting refresh of {len(stage_names)} stages: {', '.join(stage_names)}")
+
+    async def run_stage(name: str) -> None:
+        stage = STAGES[name]
+        stage_result = stage_results[name]
+
+        await asyncio.gather(*(tasks[dependency] for dependency in stage.depends_on))
+        failed = [
+            dependency
+            for dependency in stage.depends_on
+            if stage_results[dependency].status != "success"
+        ]
+        if failed:
+            stage_result.status = "skipped"
+            stage_result.error = f"Dependency failed: {', '.join(failed)}"
+            logger.warning(f"⏭️  Skipping {name}: {stage_result.error}")
+            return
+
+        deps = {dependency: stage_results[dependency].result for dependency in stage.depends_on}
+        async with semaphore:
+            stage_result.started_at = time.perf_counter() - run_started
+            started = time.perf_counter()
+            try:
+                with collection_errors() as errors:
+                    if stage.flight_key:
+                        result = await run_collector(stage.flight_key, stage.run, deps)
+                    else:
+                        result = await asyncio.to_thread(stage.run, deps)
+                # Checked on the shared result: a joined endpoint flight ran the bare collector
+                stage_result.result = _raise_on_error_tuple(result)
+                stage_result.errors = errors
+                stage_result.status = "success"
+            except Exception as e:
+                logger.exception(f"❌ Refresh stage {name} failed: {e}")
+                stage_result.status = "failed"
+                stage_result.error = str(e)
+            finally:
+                stage_result.duration_seconds = round(time.perf_counter() - started, 3)
+        logger.info(f"⏱️  Stage {name} {stage_result.status} in {stage_result.duration_seconds}s")
+
+    # Tasks are created in DAG order, so every dependency task exists before its dependents
+    for name in stage_names:
+        tasks[name] = asyncio.create_task(run_stage(name))
+    await asyncio.gather(*tasks.values())
+
+    created_at = datetime.now(UTC).replace(microsecond=0).isoformat()
+
+    async def publish(name: str) -> None:
+        stage_result = stage_results[name]
+        started = time.perf_counter()
+        try:
+            folder, outdata = STAGES[name].snapshot(stage_result.result, created_at)
+            outdata["metadata"]["partial"] = bool(stage_result.errors)
+            outdata["metadata"]["errors"] = stage_result.errors
+            stage_result.storage_paths = await asyncio.to_thread(
+                publish_snapshot, outdata, folder, outdata["metadata"]["created_at"]
+            )
+            response_cache.update(name, outdata)
+        except Exception as e:
+            logger.exception(f"❌ Failed to publish snapshot for {name}: {e}")
+            stage_result.status = "publish_failed"
+            stage_result.error = str(e)
+        finally:
+            stage_result.publish_seconds = round(time.perf_counter() - started, 3)
+
+    await asyncio.gather(
+        *(
+            publish(name)
+            for name in stage_names
+            if STAGES[name].snapshot is not None and stage_results[name].status == "success"
+        )
+    )
+
+    total_seconds = round(time.perf_counter() - run_started, 3)
+    failed_stages = [name for name, r in stage_results.items() if r.status != "success"]
+    logger.info(f"🏁 Refresh completed in {total_seconds}s ({len(failed_stages)} stage(s) not successful)")
+
+    return {
+        "created_at": created_at,
+        "total_duration_seconds": total_seconds,
+        "failed_stages": failed_stages,
+        "stages": {
+            name: {
+                "status": r.status,
+                "error": r.error,
+                "depends_on": list(STAGES[name].depends_on),
+                "started_at_seconds": round(r.started_at, 3) if r.started_at is not None else None,
+                "duration_seconds": r.duration_seconds,
+                "publish_seconds": r.publish_seconds,
+                "storage_paths": r.storage_paths,
+                "errors": r.errors,
+            }
+            for name, r in stage_results.items()
+        },
+    }
@@ -5,7 +5,9 @@ import requests
 
 from app.core.config import settings
 from app.core.logging import LoggerFactory
+from app.utils.collection import record_collection_error
 from app.utils.github import get_github_token
+from app.utils.http_client import http_get
 
 logger = LoggerFactory.get_logger(__name__)
 
@@ -22,10 +24,18 @@ def get_repo_releases(repo_name: str, token: str) -> List[Dict[str, Any]]:
     page = 1
 
     while True:
-        response = requests.get(f"{url}?page={page}&per_page=100", headers=headers)
+        try:
+            response = http_get(f"{url}?page={page}&per_page=100", headers=headers)
+        except requests.RequestException as e:
+            record_collection_error(
+                f"releases:{repo_name}",
+                f"Error fetching releases for {settings.GITHUB_ORG}/{repo_name} page {page}: {e}",
+            )
+            break
         if response.status_code != 200:
-            logger.error(
-                f"Error fetching releases for {settings.GITHUB_ORG}/{repo_name}: {response.status_code}"
+            record_collection_error(
+                f"releases:{repo_name}",
+                f"Error fetching releases for {settings.GITHUB_ORG}/{repo_name} page {page}: {response.status_code}",
             )
             break
 
@@ -55,6 +65,19 @@ def classify_release(release: Dict[str, Any]) -> str:
         return "main"
 
 
+def format_release_data(release: Dict[str, Any]) -> Dict[str, Any]:
+    """Format a GitHub release for the releases dataset."""
+    return {
+        "tag_name": release["tag_name"],
+        "name": release["name"],
+        "published_at": release["published_at"],
+        "html_url": release["html_url"],
+        "prerelease": release["prerelease"],
+        "draft": release["draft"],
+        "author": release["author"]["login"] if release.get("author") else None,
+    }
+
+
 def get_latest_releases_for_repo(
     repo_name: str, token: str
 ) -> Dict[str, Optional[Dict[str, Any]]]:
@@ -75,25 +98,9 @@ def get_latest_releases_for_repo(
         release_type = classify_release(release)
 
         if release_type == "main" and latest_main is None:
-            latest_main = {
-                "tag_name": release["tag_name"],
-                "name": release["name"],
-                "published_at": release["published_at"],
-                "html_url": release["html_url"],
-                "prerelease": release["prerelease"],
-                "draft": release["draft"],
-                "author": release["author"]["login"] if release.get("author") else None,
-            }
+            latest_main = format_release_data(release)
         elif release_type == "beta" and latest_beta is None:
-            latest_beta = {
-                "tag_name": release["tag_name"],
-                "name": release["name"],
-                "published_at": release["published_at"],
-                "html_url": release["html_url"],
-                "prerelease": release["prerelease"],
-                "draft": release["draft"],
-                "author": release["author"]["login"] if release.get("author") else None,
-            }
+            latest_beta = format_release_data(release)
 
         # Break early if we found both
         if latest_main and latest_beta:
@@ -102,12 +109,15 @@ def get_latest_releases_for_repo(
     return {"main": latest_main, "beta": latest_beta}
 
 
-def get_github_releases() -> List[Dict[str, Any]]:
+def get_github_releases(token: Optional[str] = None) -> List[Dict[str, Any]]:
     """
     Fetches the latest main and beta releases from all configured repositories.
+
+    Args:
+        token: GitHub access token, resolved from settings if not given
     """
     try:
-        token = get_github_token()
+        token = token or get_github_token()
         all_releases = []
 
         for repo in settings.REPOSITORIES:
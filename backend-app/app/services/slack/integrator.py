@@ -1,13 +1,15 @@
 # backend-app/app/services/slack/integrator.py
 import json
-import requests
 from datetime import datetime, timezone
 from typing import Dict, Any, List
 import re
 
 from google.cloud import storage
+from google.cloud.storage.retry import DEFAULT_RETRY
 
 from app.core.config import settings
+from app.services.outdated.classification import classify_outdated
+from app.utils.http_client import http_post
 
 
 def strip_org_from_repo_name(repo_name: str) -> str:
@@ -33,7 +35,9 @@ def get_data_from_storage(folder_name: str) -> Dict[str, Any]:
             f"{settings.GCP_BUCKET_SITE_FOLDER_NAME}/{folder_name}/latest.json"
         )
 
-        file_contents = blob.download_as_string()
+        file_contents = blob.download_as_bytes(
+            timeout=settings.HTTP_TIMEOUT_SECONDS, retry=DEFAULT_RETRY
+        )
         return json.loads(file_contents)
     except Exception as e:
         print(f"Error fetching data from {folder_name}: {e}")
@@ -128,85 +132,6 @@ def process_pipeline_data(pipeline_data: Dict[str, Any]) -> Dict[str, Dict[str,
     return pipeline_stats
 
 
-def compare_versions(version1: str, version2: str) -> int:
-    """
-    Compare two version strings.
-    Returns 1 if version1 > version2, -1 if version1 < version2, 0 if equal.
-    """
-    try:
-        # Split versions into components
-        v1_parts = version1.split(".")
-        v2_parts = version2.split(".")
-
-        # Compare each part numerically
-        for i in range(max(len(v1_parts), len(v2_parts))):
-            # If one version has fewer parts, treat missing parts as 0
-            v1_part = v1_parts[i] if i < len(v1_parts) else "0"
-            v2_part = v2_parts[i] if i < len(v2_parts) else "0"
-
-            # Extract numeric part for comparison (handle alpha/beta suffixes)
-            v1_numeric = "".join(c for c in v1_part if c.isdigit())
-            v2_numeric = "".join(c for c in v2_part if c.isdigit())
-
-            # Convert to integers for comparison, default to 0 if empty
-            v1_num = int(v1_numeric) if v1_numeric else 0
-            v2_num = int(v2_numeric) if v2_numeric else 0
-
-            if v1_num > v2_num:
-                return 1
-            elif v1_num < v2_num:
-                return -1
-
-        return 0  # Versions are equal
-    except Exception:
-        # Fall back to string comparison if numeric comparison fails
-        return 1 if version1 > version2 else (-1 if version1 < version2 else 0)
-
-
-def determine_version_difference(current: str, latest: str) -> str:
-    """
-    Determine if the version difference is Major, Minor, or Patch.
-    
-    Args:
-        current: Current version string
-        latest: Latest version string
-        
-    Returns:
-        String indicating the type of difference: "major", "minor", "patch", or "unknown"
-    """
-    try:
-        # Extract numeric components for comparison
-        current_parts = current.split('.')
-        latest_parts = latest.split('.')
-        
-        # Ensure we have at least 3 parts (major.minor.patch)
-        while len(current_parts) < 3:
-            current_parts.append('0')
-        while len(latest_parts) < 3:
-            latest_parts.append('0')
-        
-        # Extract numeric values
-        current_major = int(''.join(c for c in current_parts[0] if c.isdigit()) or '0')
-        current_minor = int(''.join(c for c in current_parts[1] if c.isdigit()) or '0')
-        current_patch = int(''.join(c for c in current_parts[2] if c.isdigit()) or '0')
-        
-        latest_major = int(''.join(c for c in latest_parts[0] if c.isdigit()) or '0')
-        latest_minor = int(''.join(c for c in latest_parts[1] if c.isdigit()) or '0')
-        latest_patch = int(''.join(c for c in latest_parts[2] if c.isdigit()) or '0')
-        
-        # Determine version difference type
-        if latest_major > current_major:
-            return "major"
-        elif latest_minor > current_minor:
-            return "minor"
-        elif latest_patch > current_patch:
-            return "patch"
-        else:
-            return "unknown"
-    except Exception:
-        return "unknown"
-
-
 def process_outdated_data(outdated_data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
     """Process outdated dependencies data and return counts by repository."""
     repo_outdated_deps = {}
@@ -230,35 +155,29 @@ def process_outdated_data(outdated_data: Dict[str, Any]) -> Dict[str, Dict[str,
 
         # Count and collect details of outdated dependencies
         outdated_dependencies = repo_data.get("outdated_dependencies") or []
-        for dep in outdated_dependencies:
-            dep_name = dep.get("name")
-            current_version = dep.get("current")
-            latest_version = dep.get("latest")
-
+        for dep, version_diff_type in zip(outdated_dependencies, classify_outdated(outdated_dependencies)):
             # Only count if latest version is greater than current version
-            if current_version and latest_version:
-                if compare_versions(latest_version, current_version) > 0:
-                    # Determine the type of version difference
-                    version_diff_type = determine_version_difference(current_version, latest_version)
-                    
-                    # Update counts
-                    repo_outdated_deps[repo_name]["outdated_deps_count"] += 1
-                    
-                    if version_diff_type == "major":
-                        repo_outdated_deps[repo_name]["major_version_count"] += 1
-                    elif version_diff_type == "minor":
-                        repo_outdated_deps[repo_name]["minor_version_count"] += 1
-                    elif version_diff_type == "patch":
-                        repo_outdated_deps[repo_name]["patch_version_count"] += 1
-                    
-                    repo_outdated_deps[repo_name]["outdated_deps_details"].append(
-                        {
-                            "name": dep_name,
-                            "current": current_version,
-                            "latest": latest_version,
-                            "version_diff_type": version_diff_type
-                        }
-                    )
+            if version_diff_type is None:
+                continue
+
+            # Update counts
+            repo_outdated_deps[repo_name]["outdated_deps_count"] += 1
+
+            if version_diff_type == "major":
+                repo_outdated_deps[repo_name]["major_version_count"] += 1
+            elif version_diff_type == "minor":
+                repo_outdated_deps[repo_name]["minor_version_count"] += 1
+            elif version_diff_type == "patch":
+                repo_outdated_deps[repo_name]["patch_version_count"] += 1
+
+            repo_outdated_deps[repo_name]["outdated_deps_details"].append(
+                {
+                    "name": dep.get("name"),
+                    "current": dep.get("current"),
+                    "latest": dep.get("latest"),
+                    "version_diff_type": version_diff_type
+                }
+            )
 
     return repo_outdated_deps
 
@@ -450,8 +369,8 @@ def post_to_slack() -> Dict[str, Any]:
                 if repo != sorted_repos[-1]:
                     blocks.append({"type": "divider"})
 
-        # Post to Slack
-        response = requests.post(settings.SLACK_WEBHOOK_URL, json={"blocks": blocks})
+        # Post to Slack; not retried so an ambiguous failure cannot post twice
+        response = http_post(settings.SLACK_WEBHOOK_URL, json={"blocks": blocks}, retries=0)
         response.raise_for_status()
 
         result = {
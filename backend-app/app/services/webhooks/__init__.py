@@ -0,0 +1 @@
+# Webhooks service package
@@ -0,0 +1,296 @@
+import asyncio
+import hashlib
+import hmac
+from datetime import UTC, datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.logging import LoggerFactory
+from app.services.issues.github import format_issue_data
+from app.services.pull_requests.github import calculate_pr_metrics, format_pr_data
+from app.services.releases.github import (
+    classify_release,
+    format_release_data,
+    get_latest_releases_for_repo,
+)
+from app.utils.cache import response_cache
+from app.utils.github import get_github_token
+from app.utils.storage import load_from_storage, publish_snapshot
+
+logger = LoggerFactory.get_logger(__name__)
+
+Applier = Callable[[Dict[str, Any], Dict[str, Any]], None]
+
+# Storage folders (under the site folder) of the datasets webhooks can update
+DATASET_FOLDERS = {
+    "issues": "issues",
+    "pull-requests": "pull-requests",
+    "closed-pull-requests": "metrics/pull_request",
+    "releases": "releases",
+    "pipeline-runs": "pipeline-runs",
+}
+
+
+def verify_signature(body: bytes, signature_header: Optional[str], secret: str) -> bool:
+    """Verify the X-Hub-Signature-256 header of a GitHub webhook delivery."""
+    if not signature_header or not signature_header.startswith("sha256="):
+        return False
+    expected = hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(f"sha256={expected}", signature_header)
+
+
+def is_tracked_repository(payload: Dict[str, Any]) -> bool:
+    """Check whether the event belongs to one of the configured repositories."""
+    repository = payload.get("repository") or {}
+    owner = (repository.get("owner") or {}).get("login")
+    return owner == settings.GITHUB_ORG and any(
+        repo["name"] == repository.get("name") for repo in settings.REPOSITORIES
+    )
+
+
+def _replace_entry(
+    results: List[Dict[str, Any]],
+    matches: Callable[[Dict[str, Any]], bool],
+    entry: Optional[Dict[str, Any]],
+) -> None:
+    """Replace the entries matching `matches` with `entry`, or remove them if it is None.
+
+    A new entry keeps the position of the entry it replaces, or is appended.
+    """
+    position = next((i for i, item in enumerate(results) if matches(item)), None)
+    results[:] = [item for item in results if not matches(item)]
+    if entry is not None:
+        results.insert(position if position is not None else len(results), entry)
+
+
+def _same_item(repo_name: str, number: int) -> Callable[[Dict[str, Any]], bool]:
+    repository = f"{settings.GITHUB_ORG}/{repo_name}"
+    return lambda item: item.get("repository") == repository and item.get("number") == number
+
+
+def apply_issues_event(snapshot: Dict[str, Any], payload: Dict[str, Any]) -> None:
+    """Apply an `issues` event to the open issues dataset."""
+    repo_name = payload["repository"]["name"]
+    issue = payload["issue"]
+    is_open = issue["state"] == "open" and payload["action"] not in ("deleted", "transferred")
+    _replace_entry(
+        snapshot["results"],
+        _same_item(repo_name, issue["number"]),
+        format_issue_data(issue, repo_name, {}) if is_open else None,
+    )
+
+
+def apply_pull_request_to_issues(snapshot: Dict[str, Any], payload: Dict[str, Any]) -> None:
+    """Apply a `pull_request` event to the issues dataset, which lists open PRs too."""
+    repo_name = payload["repository"]["name"]
+    pull_request = payload["pull_request"]
+    entry = None
+    if pull_request["state"] == "open":
+        # The pull request payload is a superset of its issue representation
+        issue = {**pull_request, "pull_request": {"url": pull_request["url"]}}
+        entry = format_issue_data(
+            issue,
+            repo_name,
+            {
+                "comments": pull_request.get("comments"),
+                "review_comments": pull_request.get("review_comments"),
+            },
+        )
+    _replace_entry(snapshot["results"], _same_item(repo_name, pull_request["number"]), entry)
+
+
+def apply_pull_request_event(snapshot: Dict[str, Any], payload: Dict[str, Any]) -> None:
+    """Apply a `pull_request` event to the open pull requests dataset."""
+    repo_name = payload["repository"]["name"]
+    pull_request = payload["pull_request"]
+    _replace_entry(
+        snapshot["results"],
+        _same_item(repo_name, pull_request["number"]),
+        format_pr_data(pull_request, repo_name) if pull_request["state"] == "open" else None,
+    )
+
+
+def apply_closed_pull_request_event(snapshot: Dict[str, Any], payload: Dict[str, Any]) -> None:
+    """Apply a `pull_request` event to the closed pull request metrics dataset."""
+    action = payload["action"]
+    if action not in ("closed", "reopened"):
+        return
+
+    repo_name = payload["repository"]["name"]
+    pull_request = payload["pull_request"]
+    results = snapshot["results"]
+    _replace_entry(
+        results,
+        _same_item(repo_name, pull_request["number"]),
+        format_pr_data(pull_request, repo_name) if action == "closed" else None,
+    )
+
+    # Keep the same 7 day window the closed pull request collector uses
+    since = datetime.now(UTC) - timedelta(days=7)
+    results[:] = [
+        pr
+        for pr in results
+        if pr.get("closedAt")
+        and datetime.fromisoformat(pr["closedAt"].replace("Z", "+00:00")) >= since
+    ]
+    snapshot["metrics"] = calculate_pr_metrics(results)
+    snapshot["metadata"]["pr_count"] = len(results)
+
+
+def apply_release_event(snapshot: Dict[str, Any], payload: Dict[str, Any]) -> None:
+    """Apply a `release` event to the latest releases dataset."""
+    repo_name = payload["repository"]["name"]
+    repository = f"{settings.GITHUB_ORG}/{repo_name}"
+    release = payload["release"]
+
+    entry = next((item for item in snapshot["results"] if item["repository"] == repository), None)
+    if entry is None:
+        entry = {"repository": repository, "latest_main_release": None, "latest_beta_release": None}
+        snapshot["results"].append(entry)
+
+    key = "latest_main_release" if classify_release(release) == "main" else "latest_beta_release"
+    current = entry[key]
+
+    if payload["action"] in ("deleted", "unpublished") or release.get("draft"):
+        if current and current["tag_name"] == release["tag_name"]:
+            # The payload does not say which release is now the latest, so
+            # look it up for this repository only
+            releases = get_latest_releases_for_repo(repo_name, get_github_token())
+            entry["latest_main_release"] = releases["main"]
+            entry["latest_beta_release"] = releases["beta"]
+        return
+
+    if not release.get("published_at"):
+        return
+    if (
+        current is None
+        or current["tag_name"] == release["tag_name"]
+        or release["published_at"] >= (current.get("published_at") or "")
+    ):
+        entry[key] = format_release_data(release)
+
+
+def apply_workflow_run_event(snapshot: Dict[str, Any], payload: Dict[str, Any]) -> None:
+    """Apply a `workflow_run` event to the pipeline runs dataset.
+
+    Only runs created inside the snapshot's reporting window are kept, matching
+    the date filter used by the pipeline status collector.
+    """
+    run = payload["workflow_run"]
+    metadata = snapshot["metadata"]
+    start_date_iso = metadata.get("start_date_iso")
+    end_date_iso = metadata.get("end_date_iso")
+    if start_date_iso and end_date_iso:
+        created_at = datetime.fromisoformat(run["created_at"].replace("Z", "+00:00"))
+        start = datetime.fromisoformat(start_date_iso.replace("Z", "+00:00"))
+        end = datetime.fromisoformat(end_date_iso.replace("Z", "+00:00"))
+        if not start <= created_at <= end:
+            return
+
+    _replace_entry(snapshot["results"], lambda item: item.get("id") == run["id"], run)
+    metadata["run_count"] = len(snapshot["results"])
+
+
+EVENT_APPLIERS: Dict[str, List[Tuple[str, Applier]]] = {
+    "issues": [("issues", apply_issues_event)],
+    "pull_request": [
+        ("issues", apply_pull_request_to_issues),
+        ("pull-requests", apply_pull_request_event),
+        ("closed-pull-requests", apply_closed_pull_request_event),
+    ],
+    "release": [("releases", apply_release_event)],
+    "workflow_run": [("pipeline-runs", apply_workflow_run_event)],
+}
+
+
+def apply_pending_events(pending: Dict[str, List[Tuple[Applier, Dict[str, Any]]]]) -> Dict[str, Any]:
+    """
+    Apply queued events to the latest snapshot of each dataset and republish it.
+
+    Each dataset is loaded once, updated with all its queued events in arrival
+    order and published once. Datasets without a published snapshot are left
+    for the next polling refresh to create.
+
+    Returns:
+        Number of events applied, storage paths and the new snapshot per published dataset
+    """
+    published = {}
+    for dataset, events in pending.items():
+        folder = f"{settings.GCP_BUCKET_SITE_FOLDER_NAME}/{DATASET_FOLDERS[dataset]}"
+        try:
+            snapshot = load_from_storage(f"{folder}/latest.json")
+            if snapshot is None:
+                logger.warning(f"⚠️  No published {dataset} snapshot yet, skipping {len(events)} event(s)")
+                continue
+
+            for applier, payload in events:
+                try:
+                    applier(snapshot, payload)
+                except Exception as e:
+                    logger.exception(f"❌ Failed to apply {dataset} webhook event: {e}")
+
+            metadata = snapshot.setdefault("metadata", {})
+            created_at = datetime.now(UTC).replace(microsecond=0).isoformat()
+            if str(metadata.get("created_at", "")).endswith("Z"):
+                created_at += "Z"
+            metadata["created_at"] = created_at
+            metadata["webhook_events_applied"] = metadata.get("webhook_events_applied", 0) + len(events)
+
+            published[dataset] = {
+                "events": len(events),
+                "storage_paths": publish_snapshot(snapshot, folder, created_at),
+                "data": snapshot,
+            }
+            logger.info(f"📤 Republished {dataset} with {len(events)} webhook event(s)")
+        except Exception as e:
+            logger.exception(f"❌ Failed to republish {dataset} from webhook events: {e}")
+
+    return published
+
+
+class WebhookBatcher:
+    """
+    Collects webhook events and republishes the affected datasets in batches.
+
+    The first event of a batch starts a timer of `debounce_seconds`; every event
+    received until it fires joins the same batch, so a burst of events costs a
+    single load and publish per dataset.
+    """
+
+    def __init__(self, debounce_seconds: float):
+        self.debounce_seconds = debounce_seconds
+        self._pending: Dict[str, List[Tuple[Applier, Dict[str, Any]]]] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+
+    def enqueue(self, event: str, payload: Dict[str, Any]) -> List[str]:
+        """Queue an event and return the datasets it affects."""
+        datasets = []
+        for dataset, applier in EVENT_APPLIERS.get(event, []):
+            self._pending.setdefault(dataset, []).append((applier, payload))
+            datasets.append(dataset)
+
+        if datasets and self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_later())
+        return datasets
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.debounce_seconds)
+        await self.flush()
+
+    async def flush(self) -> Dict[str, Any]:
+        """Apply and publish everything queued so far."""
+        self._flush_task = None
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return {}
+        # Serialize flushes so batches of the same dataset are published in order
+        async with self._flush_lock:
+            published = await asyncio.to_thread(apply_pending_events, pending)
+        # Cached API responses would otherwise hide the events until their TTL expires
+        for dataset, result in published.items():
+            response_cache.update(dataset, result["data"])
+        return published
+
+
+webhook_batcher = WebhookBatcher(settings.WEBHOOK_DEBOUNCE_SECONDS)
@@ -0,0 +1,113 @@
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from app.core.config import settings
+from app.core.logging import LoggerFactory
+
+logger = LoggerFactory.get_logger(__name__)
+
+
+@dataclass
+class CacheEntry:
+    value: Any
+    stored_at: float
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.stored_at
+
+
+class ResponseCache:
+    """
+    In-process, size-bounded cache of endpoint responses with stale-while-revalidate.
+
+    - Entries younger than their TTL are served as-is.
+    - Entries older than the TTL but within `max_stale_seconds` beyond it are
+      served immediately while a background task recomputes them.
+    - Missing (or too stale) entries are computed before responding.
+
+    At most `max_entries` keys are kept; the least recently used is evicted first.
+    """
+
+    def __init__(self, max_entries: int, max_stale_seconds: float):
+        self.max_entries = max_entries
+        self.max_stale_seconds = max_stale_seconds
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._revalidating: Dict[str, asyncio.Task] = {}
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: str, value: Any) -> None:
+        self._entries[key] = CacheEntry(value, time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            logger.debug(f"🗑️  Evicted {evicted} from the response cache")
+
+    def update(self, key: str, value: Any) -> None:
+        """Replace the value of an existing entry, e.g. after a snapshot was republished elsewhere."""
+        if key in self._entries:
+            self.set(key, value)
+
+    def invalidate(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    async def get_or_compute(
+        self,
+        key: str,
+        ttl_seconds: float,
+        compute: Callable[[], Awaitable[Any]],
+        fresh: bool = False,
+    ) -> Any:
+        """
+        Return the cached value for `key`, computing or revalidating it as needed.
+
+        Args:
+            key: Cache key
+            ttl_seconds: Age after which the entry is revalidated
+            compute: Coroutine function producing a new value
+            fresh: Skip the cache and recompute before responding
+
+        Returns:
+            The cached or newly computed value
+        """
+        entry = None if fresh else self.get(key)
+        if entry is not None:
+            if entry.age <= ttl_seconds:
+                logger.info(f"⚡ Serving {key} from cache ({entry.age:.0f}s old)")
+                return entry.value
+            if entry.age <= ttl_seconds + self.max_stale_seconds:
+                logger.info(f"⚡ Serving stale {key} ({entry.age:.0f}s old), revalidating in background")
+                self._revalidate(key, compute)
+                return entry.value
+
+        value = await compute()
+        self.set(key, value)
+        return value
+
+    def _revalidate(self, key: str, compute: Callable[[], Awaitable[Any]]) -> None:
+        if key in self._revalidating:
+            return
+
+        async def revalidate() -> None:
+            try:
+                self.set(key, await compute())
+                logger.info(f"🔄 Revalidated {key}")
+            except Exception as e:
+                logger.exception(f"❌ Background revalidation of {key} failed: {e}")
+            finally:
+                self._revalidating.pop(key, None)
+
+        self._revalidating[key] = asyncio.create_task(revalidate())
+
+
+response_cache = ResponseCache(
+    settings.RESPONSE_CACHE_MAX_ENTRIES, settings.RESPONSE_CACHE_MAX_STALE_SECONDS
+)
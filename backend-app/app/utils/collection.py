@@ -0,0 +1,62 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, TypeVar
+
+from app.core.logging import LoggerFactory
+
+logger = LoggerFactory.get_logger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_collection_errors: ContextVar[Optional[List[Dict[str, str]]]] = ContextVar(
+    "collection_errors", default=None
+)
+
+
+@contextmanager
+def collection_errors() -> Iterator[List[Dict[str, str]]]:
+    """
+    Collect the errors collectors record while running inside the block.
+
+    Collectors keep going after a repository or page fails and return what they
+    could fetch; the yielded list tells the caller which parts are missing so
+    the published snapshot can be flagged as partial.
+    """
+    errors: List[Dict[str, str]] = []
+    token = _collection_errors.set(errors)
+    try:
+        yield errors
+    finally:
+        _collection_errors.reset(token)
+
+
+def record_collection_error(source: str, message: str) -> None:
+    """Log a collector failure and record it for the active collection_errors block."""
+    logger.error(f"{source}: {message}")
+    errors = _collection_errors.get()
+    if errors is not None:
+        errors.append({"source": source, "error": message})
+
+
+def extend_collection_errors(errors: List[Dict[str, str]]) -> None:
+    """Add errors recorded elsewhere (already logged) to the active collection_errors block."""
+    active = _collection_errors.get()
+    if active is not None and active is not errors:
+        active.extend(errors)
+
+
+def map_concurrently(fn: Callable[[T], R], items: Iterable[T], max_workers: int) -> List[R]:
+    """
+    Apply `fn` to every item on a bounded thread pool, returning results in input order.
+
+    Each call runs in a copy of the caller's context, so errors recorded by the
+    workers reach the caller's collection_errors block.
+    """
+    items = list(items)
+    if not items:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items)))) as executor:
+        futures = [executor.submit(copy_context().run, fn, item) for item in items]
+        return [future.result() for future in futures]
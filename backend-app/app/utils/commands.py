@@ -0,0 +1,46 @@
+import subprocess
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional
+
+# Monotonic deadline shared by every command run in the current context
+_deadline: ContextVar[Optional[float]] = ContextVar("command_deadline", default=None)
+
+
+@contextmanager
+def command_deadline(seconds: float) -> Iterator[None]:
+    """
+    Bound the total time of the commands run inside the block.
+
+    A nested block can only shorten the deadline, never extend it.
+    """
+    deadline = time.monotonic() + seconds
+    current = _deadline.get()
+    token = _deadline.set(deadline if current is None else min(current, deadline))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_time() -> Optional[float]:
+    """Seconds left before the active command_deadline (at most 0), or None without one."""
+    deadline = _deadline.get()
+    return None if deadline is None else max(0.0, deadline - time.monotonic())
+
+
+def run_command(args: List[str], **kwargs) -> subprocess.CompletedProcess:
+    """
+    subprocess.run bounded by the active command_deadline.
+
+    Raises:
+        subprocess.TimeoutExpired: If the deadline has passed or the command outlives it
+    """
+    deadline = _deadline.get()
+    if deadline is not None:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise subprocess.TimeoutExpired(args, 0)
+        kwargs["timeout"] = min(kwargs.get("timeout") or remaining, remaining)
+    return subprocess.run(args, **kwargs)
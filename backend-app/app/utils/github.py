@@ -1,6 +1,10 @@
+from functools import cache
+from typing import Any, Dict
+
 from google.cloud import secretmanager
 
 from app.core.config import settings
+from app.utils.http_client import http_post
 
 
 def get_github_token() -> str:
@@ -12,3 +16,41 @@ def get_github_token() -> str:
     name = f"projects/{settings.GCP_PROJECT_ID}/secrets/github-token/versions/latest"
     response = client.access_secret_version(request={"name": name})
     return response.payload.data.decode("UTF-8")
+
+
+@cache
+def get_github_webhook_secret() -> str:
+    """Retrieve the GitHub webhook secret from the environment or Secret Manager (cached)."""
+    if settings.GITHUB_WEBHOOK_SECRET_LOCAL:
+        return settings.GITHUB_WEBHOOK_SECRET_LOCAL
+    return settings.GITHUB_WEBHOOK_SECRET
+
+
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+
+
+def github_graphql(query: str, variables: Dict[str, Any], token: str) -> Dict[str, Any]:
+    """Run a GitHub GraphQL query and return its `data` payload.
+
+    Raises:
+        RuntimeError: If the request fails or the response has errors and no data
+    """
+    headers = {
+        "Authorization": f"bearer {token}",
+        "Accept": "application/vnd.github+json",
+    }
+    response = http_post(
+        GITHUB_GRAPHQL_URL,
+        json={"query": query, "variables": variables},
+        headers=headers,
+    )
+    if response.status_code != 200:
+        raise RuntimeError(f"GitHub GraphQL request failed: {response.status_code}")
+
+    payload = response.json()
+    # Partial results (e.g. one aliased lookup not found) come back as data with
+    # null fields alongside errors; only fail when there is no data at all
+    if payload.get("errors") and not payload.get("data"):
+        messages = "; ".join(error.get("message", "") for error in payload["errors"])
+        raise RuntimeError(f"GitHub GraphQL query returned errors: {messages}")
+    return payload.get("data") or {}
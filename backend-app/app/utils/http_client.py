@@ -0,0 +1,202 @@
+import random
+import threading
+import time
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from app.core.config import settings
+from app.core.logging import LoggerFactory
+
+logger = LoggerFactory.get_logger(__name__)
+
+# Statuses worth retrying: rate limiting and transient upstream failures
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class CircuitOpenError(requests.RequestException):
+    """Raised without making a request when the target host's circuit is open."""
+
+
+class CircuitBreaker:
+    """
+    Per-host circuit breaker.
+
+    After `failure_threshold` consecutive failures the circuit opens and calls
+    fail immediately for `reset_seconds`. The first call after that is let
+    through as a probe: success closes the circuit, failure opens it again.
+    """
+
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._probing or time.monotonic() - self._opened_at < self.reset_seconds:
+                return False
+            self._probing = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._probing or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._probing = False
+
+
+_session = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=settings.HTTP_POOL_SIZE, pool_maxsize=settings.HTTP_POOL_SIZE
+)
+_session.mount("https://", _adapter)
+_session.mount("http://", _adapter)
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(host: str) -> CircuitBreaker:
+    with _breakers_lock:
+        if host not in _breakers:
+            _breakers[host] = CircuitBreaker(
+                settings.CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+                settings.CIRCUIT_BREAKER_RESET_SECONDS,
+            )
+        return _breakers[host]
+
+
+def _retry_after_seconds(response: requests.Response) -> Optional[float]:
+    """Delay requested by the server via Retry-After or GitHub's rate limit headers."""
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            try:
+                return max(0.0, (parsedate_to_datetime(retry_after) - datetime.now(UTC)).total_seconds())
+            except (TypeError, ValueError):
+                return None
+
+    if response.headers.get("X-RateLimit-Remaining") == "0":
+        reset = response.headers.get("X-RateLimit-Reset")
+        if reset and reset.isdigit():
+            return max(0.0, int(reset) - time.time())
+    return None
+
+
+def _is_retryable(response: requests.Response) -> bool:
+    if response.status_code in RETRY_STATUSES:
+        return True
+    # GitHub reports exhausted (secondary) rate limits as 403
+    return response.status_code == 403 and (
+        response.headers.get("X-RateLimit-Remaining") == "0"
+        or "Retry-After" in response.headers
+    )
+
+
+def http_request(
+    method: str,
+    url: str,
+    *,
+    timeout: Optional[float] = None,
+    retries: Optional[int] = None,
+    **kwargs,
+) -> requests.Response:
+    """
+    Send an HTTP request through the shared session with resilience policies.
+
+    - Every request has a timeout (default: settings.HTTP_TIMEOUT_SECONDS).
+    - Connection errors, timeouts, 429/5xx and rate limited 403 responses are
+      retried up to `retries` times with full-jitter exponential backoff.
+      Retry-After (or GitHub's rate limit reset) is honoured when it is within
+      settings.HTTP_RETRY_AFTER_MAX_SECONDS; longer waits are not retried.
+    - Each host has a circuit breaker; while it is open requests fail
+      immediately with CircuitOpenError.
+
+    Returns the last response when retries are exhausted on a retryable status,
+    so callers keep their existing status code handling.
+
+    Raises:
+        CircuitOpenError: If the host's circuit is open
+        requests.RequestException: If the request still fails after all retries
+    """
+    timeout = timeout if timeout is not None else settings.HTTP_TIMEOUT_SECONDS
+    retries = retries if retries is not None else settings.HTTP_MAX_RETRIES
+    host = urlsplit(url).netloc
+    breaker = get_circuit_breaker(host)
+
+    attempt = 0
+    while True:
+        if not breaker.allow():
+            raise CircuitOpenError(f"Circuit open for {host}, skipping {method} {url}")
+
+        delay = None
+        try:
+            response = _session.request(method, url, timeout=timeout, **kwargs)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            breaker.record_failure()
+            if attempt >= retries:
+                raise
+            logger.warning(f"{method} {url} failed ({e}), retrying ({attempt + 1}/{retries})")
+        except BaseException:
+            # Any other error (invalid URL, SSL, interrupt) must still end a half-open probe
+            breaker.record_failure()
+            raise
+        else:
+            if response.status_code >= 500:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+
+            if not _is_retryable(response) or attempt >= retries:
+                return response
+
+            delay = _retry_after_seconds(response)
+            if delay is not None and delay > settings.HTTP_RETRY_AFTER_MAX_SECONDS:
+                logger.warning(
+                    f"{method} {url} returned {response.status_code}, retry requested in "
+                    f"{delay:.0f}s which exceeds the limit; not retrying"
+                )
+                return response
+            logger.warning(
+                f"{method} {url} returned {response.status_code}, retrying ({attempt + 1}/{retries})"
+            )
+
+        if delay is None:
+            delay = random.uniform(
+                0,
+                min(
+                    settings.HTTP_BACKOFF_MAX_SECONDS,
+                    settings.HTTP_BACKOFF_BASE_SECONDS * 2**attempt,
+                ),
+            )
+        time.sleep(delay)
+        attempt += 1
+
+
+def http_get(url: str, **kwargs) -> requests.Response:
+    """GET through http_request."""
+    return http_request("GET", url, **kwargs)
+
+
+def http_post(url: str, **kwargs) -> requests.Response:
+    """POST through http_request."""
+    return http_request("POST", url, **kwargs)
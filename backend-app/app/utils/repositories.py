@@ -0,0 +1,208 @@
+import asyncio
+import fcntl
+import shutil
+import subprocess
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from app.core.config import settings
+from app.core.logging import LoggerFactory
+from app.utils.commands import remaining_time, run_command
+
+logger = LoggerFactory.get_logger(__name__)
+
+REPOS_DIR = Path(".algokit_repos")
+
+# Touched after every successful fetch; its mtime is the mirror's age
+_FETCHED_STAMP = "algokit-fetched"
+
+# How often a caller with a deadline retries a mirror lock held by someone else
+_LOCK_POLL_SECONDS = 0.1
+
+
+def repository_url(repo: Dict[str, Any]) -> str:
+    return f"https://github.com/{repo['owner']}/{repo['name']}"
+
+
+class RepositoryManager:
+    """
+    Shared bare mirrors of the tracked repositories.
+
+    Every repository has one blobless bare mirror (full history, file
+    contents fetched on demand) that is kept up to date in the background.
+    Callers get a private, disposable worktree of the default branch, so
+    concurrent tasks never reset each other's checkout and usually do no
+    network work at request time. A worktree can be sparse, in which case
+    only the contents of the matching files are ever downloaded.
+
+    Mirror mutations (clone, fetch, adding and removing worktrees) hold an
+    exclusive file lock per repository, which also serializes separate
+    processes sharing the directory.
+    """
+
+    def __init__(self, directory: Path, max_age_seconds: float):
+        self.mirrors_dir = directory / "mirrors"
+        self.worktrees_dir = directory / "worktrees"
+        self.max_age_seconds = max_age_seconds
+
+    def _mirror_path(self, repo_name: str) -> Path:
+        return self.mirrors_dir / f"{repo_name}.git"
+
+    @contextmanager
+    def _locked(self, repo_name: str) -> Iterator[None]:
+        """
+        Hold the repository's mirror lock, waiting no longer than the active command_deadline.
+
+        Raises:
+            subprocess.TimeoutExpired: If the deadline passes before the lock is free
+        """
+        self.mirrors_dir.mkdir(parents=True, exist_ok=True)
+        lock_path = self.mirrors_dir / f"{repo_name}.lock"
+        with open(lock_path, "w") as lock_file:
+            if remaining_time() is None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            else:
+                # A request must not wait past its deadline behind a long background fetch
+                started = time.monotonic()
+                while True:
+                    try:
+                        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                        break
+                    except BlockingIOError:
+                        remaining = remaining_time()
+                        if not remaining:
+                            raise subprocess.TimeoutExpired(["flock", str(lock_path)], time.monotonic() - started)
+                        time.sleep(min(_LOCK_POLL_SECONDS, remaining))
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _git(self, args: List[str], cwd: Path) -> subprocess.CompletedProcess:
+        return run_command(["git", *args], cwd=cwd, check=True, capture_output=True, text=True)
+
+    def mirror_age(self, repo_name: str) -> Optional[float]:
+        """Seconds since the mirror was last fetched, or None if there is no mirror."""
+        stamp = self._mirror_path(repo_name) / _FETCHED_STAMP
+        try:
+            return time.time() - stamp.stat().st_mtime
+        except FileNotFoundError:
+            return None
+
+    def fetch(self, repo_url: str, repo_name: str) -> bool:
+        """
+        Create or update the mirror of a repository.
+
+        Returns:
+            Whether the mirror is now up to date
+        """
+        mirror = self._mirror_path(repo_name)
+        try:
+            with self._locked(repo_name):
+                if not (mirror / "HEAD").exists():
+                    logger.info(f"📥 Creating mirror of {repo_name}")
+                    shutil.rmtree(mirror, ignore_errors=True)
+                    self._git(["clone", "--bare", "--filter=blob:none", repo_url, str(mirror)], cwd=self.mirrors_dir)
+                    # A bare clone maps no remote-tracking refs; keep every branch up to date
+                    self._git(["config", "remote.origin.fetch", "+refs/heads/*:refs/heads/*"], cwd=mirror)
+                else:
+                    logger.info(f"🔄 Fetching mirror of {repo_name}")
+                self._git(["fetch", "--prune", "--tags", "origin"], cwd=mirror)
+                # Follow the remote's default branch, which may have been renamed
+                remote_head = self._git(["ls-remote", "--symref", "origin", "HEAD"], cwd=mirror).stdout
+                if remote_head.startswith("ref: "):
+                    self._git(["symbolic-ref", "HEAD", remote_head[5:].split()[0]], cwd=mirror)
+                self._git(["worktree", "prune"], cwd=mirror)
+                (mirror / _FETCHED_STAMP).touch()
+            return True
+        except subprocess.CalledProcessError as e:
+            logger.error(f"❌ Error with repository {repo_name}: {e} {e.stderr or ''}".strip())
+            return False
+
+    def ensure_fresh(self, repo_url: str, repo_name: str) -> bool:
+        """Fetch the mirror now only if it is missing or the background refresh fell behind."""
+        age = self.mirror_age(repo_name)
+        if age is not None and age <= self.max_age_seconds:
+            return True
+        return self.fetch(repo_url, repo_name)
+
+    @contextmanager
+    def checkout(
+        self,
+        repo_url: str,
+        repo_name: str,
+        branch: Optional[str] = None,
+        sparse_paths: Optional[List[str]] = None,
+        history_only: bool = False,
+    ) -> Iterator[Optional[str]]:
+        """
+        A private worktree of a branch (the default branch unless given), removed on exit.
+
+        The worktree directory is named after the repository.
+
+        Args:
+            branch: Branch to check out instead of the default branch
+            sparse_paths: gitignore-style patterns; when given only matching files are checked out
+            history_only: Check out no files at all, for callers that only read history (log, diff)
+
+        Yields:
+            Path of the worktree, or None if the repository could not be fetched or checked out
+        """
+        if not self.ensure_fresh(repo_url, repo_name):
+            yield None
+            return
+
+        mirror = self._mirror_path(repo_name)
+        ref = branch or "HEAD"
+        self.worktrees_dir.mkdir(parents=True, exist_ok=True)
+        worktree = Path(tempfile.mkdtemp(prefix=f"{repo_name}-", dir=self.worktrees_dir)) / repo_name
+        # Removed whatever happens from here on, including a deadline running out mid-checkout
+        try:
+            try:
+                with self._locked(repo_name):
+                    if history_only:
+                        self._git(
+                            ["worktree", "add", "--detach", "--no-checkout", str(worktree.resolve()), ref], cwd=mirror
+                        )
+                    elif sparse_paths:
+                        self._git(
+                            ["worktree", "add", "--detach", "--no-checkout", str(worktree.resolve()), ref], cwd=mirror
+                        )
+                        self._git(["sparse-checkout", "set", "--no-cone", *sparse_paths], cwd=worktree)
+                        self._git(["reset", "--hard", "HEAD"], cwd=worktree)
+                    else:
+                        self._git(["worktree", "add", "--detach", str(worktree.resolve()), ref], cwd=mirror)
+            except subprocess.CalledProcessError as e:
+                logger.error(f"❌ Error checking out {repo_name}: {e} {e.stderr or ''}".strip())
+                yield None
+                return
+
+            logger.info(f"✅ Repository {repo_name} ready at: {worktree}")
+            yield str(worktree)
+        finally:
+            self._remove_worktree(repo_name, worktree)
+
+    def _remove_worktree(self, repo_name: str, worktree: Path) -> None:
+        try:
+            with self._locked(repo_name):
+                self._git(["worktree", "remove", "--force", str(worktree.resolve())], cwd=self._mirror_path(repo_name))
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
+            # Pruned with the next fetch once the directory is gone
+            pass
+        shutil.rmtree(worktree.parent, ignore_errors=True)
+
+    async def refresh_forever(self, repositories: List[Dict[str, Any]], interval_seconds: float) -> None:
+        """Fetch every mirror, then again every `interval_seconds`, until cancelled."""
+        while True:
+            started = time.monotonic()
+            for repo in repositories:
+                # One at a time: a background refresh should not compete with requests for bandwidth
+                await asyncio.to_thread(self.fetch, repository_url(repo), repo["name"])
+            logger.info(f"🪞 Refreshed {len(repositories)} repository mirrors in {time.monotonic() - started:.1f}s")
+            await asyncio.sleep(interval_seconds)
+
+
+repository_manager = RepositoryManager(REPOS_DIR, settings.REPOSITORY_MIRROR_MAX_AGE_SECONDS)
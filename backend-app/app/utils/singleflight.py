@@ -0,0 +1,81 @@
+import asyncio
+import json
+from typing import Any, Awaitable, Callable, Dict, List, Tuple, TypeVar
+
+from app.core.logging import LoggerFactory
+from app.utils.collection import collection_errors, extend_collection_errors
+
+logger = LoggerFactory.get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key into one in-flight computation.
+
+    The first caller for a key starts the computation; every caller arriving
+    while it is still running awaits the same future and receives the same
+    result (or exception). Once it completes the key is released, so later
+    calls compute again.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    def in_flight(self, key: str) -> bool:
+        return key in self._inflight
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fn())
+            self._inflight[key] = future
+
+            def release(done: asyncio.Future) -> None:
+                if self._inflight.get(key) is done:
+                    del self._inflight[key]
+
+            future.add_done_callback(release)
+        else:
+            logger.info(f"🔗 Joining in-flight computation for {key}")
+
+        # Shielded so a caller that disconnects does not cancel the others
+        return await asyncio.shield(future)
+
+
+def collector_key(name: str, **params: Any) -> str:
+    """Build a single-flight key from a collector name and the parameters that shape its result."""
+    if not params:
+        return name
+    return f"{name}:{json.dumps(params, sort_keys=True, default=str)}"
+
+
+collectors = SingleFlight()
+
+
+def _collect(fn: Callable[..., T], args: Tuple, kwargs: Dict[str, Any]) -> Tuple[T, List[Dict[str, str]]]:
+    with collection_errors() as errors:
+        return fn(*args, **kwargs), errors
+
+
+async def run_collector(key: str, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run a sync collector in a worker thread, coalesced with identical concurrent runs.
+
+    Errors the shared run records are added to every caller's active
+    collection_errors block, so each response reports the same partial state.
+
+    Args:
+        key: Single-flight key, see collector_key
+        fn: Collector to run
+        *args, **kwargs: Arguments passed to the collector by the first caller
+
+    Returns:
+        The collector's result, shared by all coalesced callers
+    """
+    result, errors = await collectors.do(
+        key, lambda: asyncio.to_thread(_collect, fn, args, kwargs)
+    )
+    extend_collection_errors(errors)
+    return result
@@ -1,12 +1,25 @@
 import json
-from typing import Any
+from typing import Any, Dict, Optional
 
 from google.cloud import storage
+from google.cloud.storage.retry import DEFAULT_RETRY
 from google.oauth2 import service_account
 
 from app.core.config import settings
 
 
+def get_bucket() -> storage.Bucket:
+    """Get the configured bucket using the service account credentials."""
+    # Create credentials from service account info
+    credentials = service_account.Credentials.from_service_account_info(
+        json.loads(settings.GCP_SERVICE_ACCOUNT_INFO)
+    )
+
+    # Create client with explicit credentials
+    client = storage.Client(credentials=credentials)
+    return client.bucket(settings.GCP_BUCKET_NAME)
+
+
 def save_to_storage(data: Any, filename: str, make_public: bool = False) -> str:
     """Save data to Google Cloud Storage.
     
@@ -15,19 +28,58 @@ def save_to_storage(data: Any, filename: str, make_public: bool = False) -> str:
         filename: The name of the file to save
         make_public: If True, makes the file publicly accessible
     """
-    # Create credentials from service account info
-    credentials = service_account.Credentials.from_service_account_info(
-        json.loads(settings.GCP_SERVICE_ACCOUNT_INFO)
-    )
-
-    # Create client with explicit credentials
-    client = storage.Client(credentials=credentials)
-    bucket = client.bucket(settings.GCP_BUCKET_NAME)
+    bucket = get_bucket()
     blob = bucket.blob(filename)
 
-    blob.upload_from_string(json.dumps(data, indent=2), content_type="application/json")
+    # Uploads overwrite the whole object, so retrying them is safe
+    blob.upload_from_string(
+        json.dumps(data, indent=2),
+        content_type="application/json",
+        timeout=settings.HTTP_TIMEOUT_SECONDS,
+        retry=DEFAULT_RETRY,
+    )
     
     if make_public:
-        blob.make_public()
+        blob.make_public(timeout=settings.HTTP_TIMEOUT_SECONDS, retry=DEFAULT_RETRY)
 
     return f"gs://{settings.GCP_BUCKET_NAME}/{filename}"
+
+
+def load_from_storage(filename: str) -> Optional[Any]:
+    """Load JSON data from Google Cloud Storage.
+
+    Args:
+        filename: The name of the file to load
+
+    Returns:
+        The parsed data, or None if the file does not exist
+    """
+    blob = get_bucket().blob(filename)
+    if not blob.exists(timeout=settings.HTTP_TIMEOUT_SECONDS, retry=DEFAULT_RETRY):
+        return None
+    return json.loads(
+        blob.download_as_bytes(timeout=settings.HTTP_TIMEOUT_SECONDS, retry=DEFAULT_RETRY)
+    )
+
+
+def publish_snapshot(data: Any, folder: str, created_at: str) -> Dict[str, str]:
+    """Save a dataset snapshot as both the public latest.json and a timestamped copy.
+
+    Args:
+        data: The snapshot data to save
+        folder: Storage folder of the dataset, relative to the bucket root
+        created_at: Timestamp used to name the timestamped copy
+
+    Returns:
+        Public URLs of the latest and timestamped files
+    """
+    latest_path = f"{folder}/latest.json"
+    timestamped_path = f"{folder}/{created_at}.json"
+
+    save_to_storage(data, latest_path, make_public=True)
+    save_to_storage(data, timestamped_path)
+
+    return {
+        "latest": f"https://storage.googleapis.com/{settings.GCP_BUCKET_NAME}/{latest_path}",
+        "timestamped": f"https://storage.googleapis.com/{settings.GCP_BUCKET_NAME}/{timestamped_path}",
+    }